@@ -0,0 +1,33 @@
+import io
+
+import pytest
+
+from .docx_generator import generate_docx, generate_style_map
+
+
+@pytest.fixture(scope="session", name="large_docx")
+def _fixture_large_docx():
+    return generate_docx(
+        paragraphs=1000,
+        runs_per_paragraph=5,
+        tables=20,
+        list_items=200,
+        list_depth=4,
+        footnotes=50,
+        comments=50,
+        images=10,
+        styles=50,
+    )
+
+
+@pytest.fixture(scope="session", name="large_style_map")
+def _fixture_large_style_map():
+    return generate_style_map(500)
+
+
+@pytest.fixture(scope="session", name="open_docx")
+def _fixture_open_docx():
+    def open_docx(docx_bytes):
+        return io.BytesIO(docx_bytes)
+
+    return open_docx
@@ -0,0 +1,26 @@
+import mammoth
+
+
+def benchmark_convert_to_html(benchmark, large_docx, open_docx):
+    benchmark(lambda: mammoth.convert_to_html(open_docx(large_docx)))
+
+
+def benchmark_convert_to_html_with_large_style_map(benchmark, large_docx, large_style_map, open_docx):
+    benchmark(lambda: mammoth.convert_to_html(open_docx(large_docx), style_map=large_style_map))
+
+
+def benchmark_convert_to_html_with_image_references(benchmark, large_docx, open_docx):
+    convert_image = mammoth.images.reference()
+    benchmark(lambda: mammoth.convert_to_html(open_docx(large_docx), convert_image=convert_image))
+
+
+def benchmark_convert_to_markdown(benchmark, large_docx, open_docx):
+    benchmark(lambda: mammoth.convert_to_markdown(open_docx(large_docx)))
+
+
+def benchmark_extract_raw_text(benchmark, large_docx, open_docx):
+    benchmark(lambda: mammoth.extract_raw_text(open_docx(large_docx)))
+
+
+def benchmark_convert_to_html_with_coalesced_runs(benchmark, large_docx, open_docx):
+    benchmark(lambda: mammoth.convert_to_html(open_docx(large_docx), coalesce_runs=True))
@@ -0,0 +1,249 @@
+import io
+import random
+import zipfile
+from xml.sax.saxutils import escape, quoteattr
+
+
+# A 1x1 transparent PNG
+_png_bytes = (
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89"
+    b"\x00\x00\x00\rIDATx\x9cc\xf8\x0f\x00\x00\x01\x01\x00\x05\x18\xd8N\x00\x00\x00\x00IEND\xaeB`\x82"
+)
+
+_namespaces = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships" '
+    'xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing" '
+    'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:pic="http://schemas.openxmlformats.org/drawingml/2006/picture"'
+)
+
+_words = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+    "incididunt ut labore et dolore magna aliqua ut enim ad minim veniam quis nostrud"
+).split()
+
+_list_num_id = "1"
+
+
+def generate_docx(
+    paragraphs=100,
+    runs_per_paragraph=4,
+    tables=0,
+    list_items=0,
+    list_depth=1,
+    footnotes=0,
+    comments=0,
+    images=0,
+    styles=10,
+    seed=42,
+):
+    # The same arguments always produce the same document. Tables, lists,
+    # footnotes, comments and images are spread evenly through the paragraphs.
+    generator = _Generator(random.Random(seed), styles=styles)
+
+    blocks = []
+    for index in range(paragraphs):
+        blocks.append(generator.paragraph(runs_per_paragraph))
+    blocks = _spread(blocks, [generator.table() for _ in range(tables)])
+    blocks = _spread(blocks, generator.lists(list_items, list_depth))
+    blocks = _spread(blocks, [generator.footnote_paragraph() for _ in range(footnotes)])
+    blocks = _spread(blocks, [generator.comment_paragraph() for _ in range(comments)])
+    blocks = _spread(blocks, [generator.image_paragraph() for _ in range(images)])
+
+    fileobj = io.BytesIO()
+    with zipfile.ZipFile(fileobj, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        zip_file.writestr("[Content_Types].xml", _content_types_xml)
+        zip_file.writestr("_rels/.rels", _package_relationships_xml)
+        zip_file.writestr("word/_rels/document.xml.rels", generator.document_relationships_xml())
+        zip_file.writestr("word/document.xml", _document_xml(blocks))
+        zip_file.writestr("word/styles.xml", generator.styles_xml())
+        zip_file.writestr("word/numbering.xml", _numbering_xml(list_depth))
+        zip_file.writestr("word/footnotes.xml", generator.footnotes_xml())
+        zip_file.writestr("word/comments.xml", generator.comments_xml())
+        for image_index in range(images):
+            zip_file.writestr("word/media/image{0}.png".format(image_index), _png_bytes)
+
+    return fileobj.getvalue()
+
+
+def generate_style_map(styles):
+    return "\n".join(
+        "p[style-name='Generated Style {0}'] => p.generated-{0}:fresh".format(index)
+        for index in range(styles)
+    )
+
+
+def _spread(blocks, extra_blocks):
+    if not extra_blocks:
+        return blocks
+
+    step = max(1, len(blocks) // len(extra_blocks))
+    result = []
+    for index, block in enumerate(blocks):
+        result.append(block)
+        if index % step == 0 and extra_blocks:
+            result.append(extra_blocks.pop())
+    return result + extra_blocks
+
+
+class _Generator(object):
+    def __init__(self, random, styles):
+        self._random = random
+        self._styles = styles
+        self._footnotes = []
+        self._comments = []
+        self._images = 0
+
+    def _text(self, words):
+        return " ".join(self._random.choice(_words) for _ in range(words))
+
+    def run(self):
+        properties = []
+        if self._random.random() < 0.2:
+            properties.append("<w:b/>")
+        if self._random.random() < 0.2:
+            properties.append("<w:i/>")
+        if self._random.random() < 0.05:
+            properties.append('<w:u w:val="single"/>')
+        if self._random.random() < 0.05:
+            properties.append('<w:color w:val="FF0000"/>')
+
+        return "<w:r><w:rPr>{0}</w:rPr><w:t xml:space=\"preserve\">{1} </w:t></w:r>".format(
+            "".join(properties),
+            escape(self._text(self._random.randint(2, 8))),
+        )
+
+    def paragraph(self, runs, extra=""):
+        if self._styles and self._random.random() < 0.5:
+            style = '<w:pPr><w:pStyle w:val="GeneratedStyle{0}"/></w:pPr>'.format(
+                self._random.randrange(self._styles)
+            )
+        else:
+            style = ""
+        return "<w:p>{0}{1}{2}</w:p>".format(style, "".join(self.run() for _ in range(runs)), extra)
+
+    def lists(self, items, depth):
+        # Each list descends to the deepest level and back out again
+        levels = list(range(depth)) + list(range(depth - 2, 0, -1))
+        list_blocks = []
+        for start in range(0, items, len(levels)):
+            list_blocks.append("".join(
+                self.list_item(level)
+                for level in levels[:items - start]
+            ))
+        return list_blocks
+
+    def list_item(self, level):
+        return (
+            '<w:p><w:pPr><w:numPr><w:ilvl w:val="{0}"/><w:numId w:val="{1}"/></w:numPr></w:pPr>{2}</w:p>'
+        ).format(level, _list_num_id, self.run())
+
+    def table(self, rows=3, columns=3):
+        cell = "<w:tc>{0}</w:tc>"
+        row = "<w:tr>{0}</w:tr>"
+        return "<w:tbl>{0}</w:tbl>".format("".join(
+            row.format("".join(cell.format(self.paragraph(1)) for _ in range(columns)))
+            for _ in range(rows)
+        ))
+
+    def footnote_paragraph(self):
+        footnote_id = str(len(self._footnotes) + 1)
+        self._footnotes.append((footnote_id, self.paragraph(2)))
+        return self.paragraph(1, extra='<w:r><w:footnoteReference w:id="{0}"/></w:r>'.format(footnote_id))
+
+    def comment_paragraph(self):
+        comment_id = str(len(self._comments))
+        self._comments.append((comment_id, self.paragraph(1)))
+        return self.paragraph(1, extra='<w:r><w:commentReference w:id="{0}"/></w:r>'.format(comment_id))
+
+    def image_paragraph(self):
+        image_index = self._images
+        self._images += 1
+        drawing = (
+            '<w:r><w:drawing><wp:inline>'
+            '<wp:extent cx="9525" cy="9525"/>'
+            '<wp:docPr id="{0}" name="Picture {0}" descr="Image {0}"/>'
+            '<a:graphic><a:graphicData><pic:pic><pic:blipFill>'
+            '<a:blip r:embed="rIdImage{0}"/>'
+            '</pic:blipFill></pic:pic></a:graphicData></a:graphic>'
+            '</wp:inline></w:drawing></w:r>'
+        ).format(image_index)
+        return "<w:p>{0}</w:p>".format(drawing)
+
+    def document_relationships_xml(self):
+        relationship_type = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+        relationships = [
+            ("rIdStyles", relationship_type + "styles", "styles.xml"),
+            ("rIdNumbering", relationship_type + "numbering", "numbering.xml"),
+            ("rIdFootnotes", relationship_type + "footnotes", "footnotes.xml"),
+            ("rIdComments", relationship_type + "comments", "comments.xml"),
+        ] + [
+            ("rIdImage{0}".format(index), relationship_type + "image", "media/image{0}.png".format(index))
+            for index in range(self._images)
+        ]
+        return (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">{0}</Relationships>'
+        ).format("".join(
+            '<Relationship Id={0} Type={1} Target={2}/>'.format(quoteattr(id), quoteattr(type), quoteattr(target))
+            for id, type, target in relationships
+        ))
+
+    def styles_xml(self):
+        styles = "".join(
+            '<w:style w:type="paragraph" w:styleId="GeneratedStyle{0}"><w:name w:val="Generated Style {0}"/></w:style>'.format(index)
+            for index in range(self._styles)
+        )
+        return '<w:styles {0}>{1}</w:styles>'.format(_namespaces, styles)
+
+    def footnotes_xml(self):
+        return '<w:footnotes {0}>{1}</w:footnotes>'.format(_namespaces, "".join(
+            '<w:footnote w:id="{0}">{1}</w:footnote>'.format(footnote_id, body)
+            for footnote_id, body in self._footnotes
+        ))
+
+    def comments_xml(self):
+        return '<w:comments {0}>{1}</w:comments>'.format(_namespaces, "".join(
+            '<w:comment w:id="{0}" w:author="Author" w:initials="A">{1}</w:comment>'.format(comment_id, body)
+            for comment_id, body in self._comments
+        ))
+
+
+def _document_xml(blocks):
+    return '<w:document {0}><w:body>{1}<w:sectPr/></w:body></w:document>'.format(_namespaces, "".join(blocks))
+
+
+def _numbering_xml(list_depth):
+    levels = "".join(
+        '<w:lvl w:ilvl="{0}"><w:start w:val="1"/><w:numFmt w:val="{1}"/><w:lvlText w:val="%{2}."/></w:lvl>'.format(
+            level,
+            "decimal" if level % 2 == 0 else "lowerLetter",
+            level + 1,
+        )
+        for level in range(list_depth)
+    )
+    return (
+        '<w:numbering {0}>'
+        '<w:abstractNum w:abstractNumId="0">{1}</w:abstractNum>'
+        '<w:num w:numId="{2}"><w:abstractNumId w:val="0"/></w:num>'
+        '</w:numbering>'
+    ).format(_namespaces, levels, _list_num_id)
+
+
+_content_types_xml = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Default Extension="png" ContentType="image/png"/>'
+    '<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+
+_package_relationships_xml = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>'
+    '</Relationships>'
+)
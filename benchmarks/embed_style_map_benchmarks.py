@@ -0,0 +1,23 @@
+import io
+import shutil
+
+import mammoth
+
+
+def benchmark_embed_style_map(benchmark, large_docx, large_style_map):
+    def setup():
+        return (io.BytesIO(large_docx), large_style_map), {}
+
+    benchmark.pedantic(mammoth.embed_style_map, setup=setup, rounds=20)
+
+
+def benchmark_embed_style_map_in_paths(benchmark, tmp_path, large_docx, large_style_map):
+    paths = [str(tmp_path / "{0}.docx".format(index)) for index in range(10)]
+
+    def setup():
+        for path in paths:
+            with open(path, "wb") as fileobj:
+                shutil.copyfileobj(io.BytesIO(large_docx), fileobj)
+        return (paths, large_style_map), {}
+
+    benchmark.pedantic(mammoth.embed_style_map_in_paths, setup=setup, rounds=5)
@@ -0,0 +1,43 @@
+import os
+import re
+import subprocess
+import sys
+
+
+# Importing mammoth should stay cheap, since command line and serverless
+# invocations pay for it on every cold start.
+_import_budget_seconds = 0.02
+
+
+def benchmark_import_mammoth(benchmark):
+    import_seconds = benchmark.pedantic(_measure_import_time, args=("mammoth", ), rounds=10)
+    benchmark.extra_info["import_seconds"] = import_seconds
+    assert import_seconds < _import_budget_seconds
+
+
+def benchmark_import_mammoth_and_convert(benchmark):
+    path = os.path.join(os.path.dirname(__file__), "..", "tests", "test-data", "single-paragraph.docx")
+    source = "import mammoth\nwith open({0!r}, 'rb') as fileobj: mammoth.convert_to_html(fileobj)".format(path)
+    output = benchmark.pedantic(_run_python, args=(source, ), rounds=5)
+    assert output == ""
+
+
+def _measure_import_time(module_name):
+    output = _run_python("import {0}".format(module_name), "-X", "importtime")
+    for line in output.splitlines():
+        # Lines are of the form "import time: self [us] | cumulative | name"
+        match = re.match(r"^import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)$", line)
+        if match is not None and match.group(2) == "" and match.group(3) == module_name:
+            return int(match.group(1)) / 1000000.0
+
+    raise AssertionError("Could not find import time of " + module_name)
+
+
+def _run_python(source, *args):
+    process = subprocess.run(
+        [sys.executable] + list(args) + ["-c", source],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        universal_newlines=True,
+    )
+    return process.stdout
@@ -0,0 +1,134 @@
+import glob
+import os
+import zipfile
+
+import pytest
+
+import mammoth
+from mammoth import conversion, html, options, results, writers, zips
+from mammoth.docx import body_xml, office_xml, xmlparser
+from mammoth.docx.content_types_xml import read_content_types_xml_element
+from mammoth.docx.numbering_xml import read_numbering_xml_element, Numbering
+from mammoth.docx.relationships_xml import read_relationships_xml_element, Relationships
+from mammoth.docx.styles_xml import read_styles_xml_element, Styles
+
+from .memory import measure_peak_memory
+
+
+_test_data_path = os.path.join(os.path.dirname(__file__), "..", "tests", "test-data")
+
+
+@pytest.fixture(scope="module", name="document_xml_bytes")
+def _fixture_document_xml_bytes(large_docx, open_docx):
+    with zipfile.ZipFile(open_docx(large_docx)) as zip_file:
+        return zip_file.read("word/document.xml")
+
+
+@pytest.fixture(scope="module", name="document")
+def _fixture_document(large_docx, open_docx):
+    return mammoth.docx.read(open_docx(large_docx)).value
+
+
+@pytest.fixture(scope="module", name="html_nodes")
+def _fixture_html_nodes(document):
+    converter = conversion._DocumentConverter(
+        messages=results.MessageSink(),
+        style_map=options.read_options({}).value["style_map"],
+        convert_image=mammoth.images.reference(),
+        id_prefix="",
+        ignore_empty_paragraphs=True,
+        note_references=[],
+        comments=dict((comment.comment_id, comment) for comment in document.comments),
+    )
+    nodes = converter.visit(document, conversion._ConversionContext(is_table_header=False))
+    return html.strip_empty(nodes)
+
+
+def benchmark_parse_xml(benchmark, document_xml_bytes, open_docx):
+    benchmark(lambda: xmlparser.parse_xml(open_docx(document_xml_bytes), office_xml._namespaces))
+
+
+def benchmark_read_body(benchmark, large_docx, open_docx):
+    _benchmark_read_body(benchmark, open_docx(large_docx))
+
+
+@pytest.mark.parametrize("path", sorted(glob.glob(os.path.join(_test_data_path, "*.docx"))), ids=os.path.basename)
+def benchmark_read_body_of_test_data(benchmark, path):
+    with open(path, "rb") as fileobj:
+        _benchmark_read_body(benchmark, fileobj)
+
+
+def _benchmark_read_body(benchmark, fileobj):
+    with zips.open_zip(fileobj, "r") as zip_file:
+        def read_part(name, reader, default):
+            if zip_file.exists(name):
+                with zip_file.open(name) as fileobj:
+                    return reader(office_xml.read(fileobj))
+            else:
+                return default
+
+        styles = read_part("word/styles.xml", read_styles_xml_element, Styles.EMPTY)
+        reader = body_xml.reader(
+            numbering=read_part(
+                "word/numbering.xml",
+                lambda element: read_numbering_xml_element(element, styles=styles),
+                Numbering.EMPTY,
+            ),
+            content_types=read_part("[Content_Types].xml", read_content_types_xml_element, None),
+            relationships=read_part("word/_rels/document.xml.rels", read_relationships_xml_element, Relationships.EMPTY),
+            styles=styles,
+            docx_file=zip_file,
+        )
+        body = read_part("word/document.xml", lambda element: element.find_child("w:body"), None)
+
+        benchmark.extra_info["peak_memory_bytes"] = measure_peak_memory(lambda: reader.read_all(body.children))
+        benchmark(lambda: reader.read_all(body.children))
+
+
+def benchmark_convert_document_element(benchmark, document):
+    benchmark(lambda: conversion.convert_document_element_to_html(
+        document,
+        style_map=options.read_options({}).value["style_map"],
+        convert_image=mammoth.images.reference(),
+    ))
+
+
+def benchmark_strip_empty(benchmark, html_nodes):
+    benchmark.extra_info["peak_memory_bytes"] = measure_peak_memory(lambda: html.strip_empty(html_nodes))
+    benchmark(lambda: html.strip_empty(html_nodes))
+
+
+def benchmark_collapse(benchmark, html_nodes):
+    benchmark.extra_info["peak_memory_bytes"] = measure_peak_memory(lambda: html.collapse(html_nodes))
+    benchmark(lambda: html.collapse(html_nodes))
+
+
+def benchmark_html_writer(benchmark, html_nodes):
+    nodes = html.collapse(html_nodes)
+
+    def write():
+        writer = writers.writer("html")
+        html.write(writer, nodes)
+        return writer.as_string()
+
+    benchmark(write)
+
+
+def benchmark_markdown_writer(benchmark, html_nodes):
+    nodes = html.collapse(html_nodes)
+
+    def write():
+        writer = writers.writer("markdown")
+        html.write(writer, nodes)
+        return writer.as_string()
+
+    benchmark(write)
+
+
+def benchmark_raw_text(benchmark, document):
+    benchmark(lambda: mammoth.extract_raw_text_from_element(document))
+
+
+def benchmark_transform_document(benchmark, document):
+    transform = mammoth.transforms.paragraph(lambda paragraph: paragraph)
+    benchmark(lambda: transform(document))
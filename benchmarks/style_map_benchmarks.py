@@ -0,0 +1,32 @@
+import pytest
+
+from mammoth import options
+from mammoth.styles.parser.tokeniser import tokenise
+
+from .docx_generator import generate_style_map
+
+
+@pytest.fixture(scope="module", name="huge_style_map")
+def _huge_style_map():
+    return generate_style_map(10000)
+
+
+def benchmark_tokenise_style_map(benchmark, huge_style_map):
+    lines = huge_style_map.split("\n")
+
+    def tokenise_all():
+        for line in lines:
+            tokenise(line)
+
+    benchmark(tokenise_all)
+
+
+def benchmark_read_style_map(benchmark, huge_style_map):
+    def read_style_map():
+        # Parsed style maps are cached, so the cache is cleared to measure
+        # parsing rather than cache hits.
+        options._parse_style_map.cache_clear()
+        return options.read_options({"style_map": huge_style_map})
+
+    result = benchmark(read_style_map)
+    assert not result.messages
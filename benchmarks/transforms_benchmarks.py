@@ -0,0 +1,92 @@
+import pytest
+
+import mammoth
+from mammoth import transforms
+
+from .memory import measure_peak_memory
+
+
+@pytest.fixture(scope="module", name="document")
+def _fixture_document(large_docx, open_docx):
+    return mammoth.docx.read(open_docx(large_docx)).value
+
+
+def _remap_one_style(paragraph):
+    if paragraph.style_id == "GeneratedStyle0":
+        return paragraph.copy(style_id="GeneratedStyle1", style_name="Generated Style 1")
+    else:
+        return paragraph
+
+
+@pytest.mark.parametrize("transform_paragraph", [
+    pytest.param(lambda paragraph: paragraph, id="no-op"),
+    pytest.param(_remap_one_style, id="sparse"),
+])
+def benchmark_paragraph_transform(benchmark, document, transform_paragraph):
+    transform = transforms.paragraph(transform_paragraph)
+    benchmark.extra_info["peak_memory_bytes"] = measure_peak_memory(lambda: transform(document))
+    benchmark(transform, document)
+
+
+def _paragraph_and_run_transforms():
+    return [
+        transforms.paragraph(_remap_one_style),
+        transforms.run(lambda run: run.copy(is_bold=True) if run.is_italic else run),
+        transforms.paragraph(lambda paragraph: paragraph),
+        transforms.run(lambda run: run.copy(font_size=None) if run.font_size else run),
+        transforms.element_of_type(mammoth.documents.Text, lambda text: text),
+    ]
+
+
+def benchmark_sequential_transforms(benchmark, document):
+    element_transforms = _paragraph_and_run_transforms()
+
+    def transform(document):
+        for element_transform in element_transforms:
+            document = element_transform(document)
+        return document
+
+    benchmark(transform, document)
+
+
+def benchmark_composed_transforms(benchmark, document):
+    benchmark(transforms.compose(*_paragraph_and_run_transforms()), document)
+
+
+def _queries(get_elements_of_type, get_paragraphs_with_style_id):
+    def query(document):
+        for _ in range(10):
+            get_elements_of_type(document, mammoth.documents.Image)
+            get_elements_of_type(document, mammoth.documents.Bookmark)
+            get_paragraphs_with_style_id(document, "GeneratedStyle0")
+
+    return query
+
+
+def benchmark_queries_by_walking_document(benchmark, document):
+    def get_elements_of_type(document, element_type):
+        return [
+            element
+            for element in transforms.get_descendants(document)
+            if isinstance(element, element_type)
+        ]
+
+    def get_paragraphs_with_style_id(document, style_id):
+        return [
+            paragraph
+            for paragraph in get_elements_of_type(document, mammoth.documents.Paragraph)
+            if paragraph.style_id == style_id
+        ]
+
+    benchmark(_queries(get_elements_of_type, get_paragraphs_with_style_id), document)
+
+
+def benchmark_queries_using_document_index(benchmark, document):
+    def query(document):
+        document = document.copy()
+        _queries(
+            lambda document, element_type: document.index.elements_of_type(element_type),
+            lambda document, style_id: document.index.paragraphs_with_style_id(style_id),
+        )(document)
+
+    benchmark(query, document)
@@ -1,10 +1,54 @@
-from . import docx, conversion, options, images, transforms, underline
-from .raw_text import extract_raw_text_from_element
-from .docx.style_map import write_style_map, read_style_map
+import importlib
+
 
 __all__ = ["convert_to_html", "extract_raw_text", "images", "transforms", "underline"]
 
 
+# Submodules are only imported when they're first used, so that importing
+# mammoth (for instance, to start the CLI) doesn't pay for reading docx
+# files, converting documents and parsing style maps up front.
+_lazy_submodules = set([
+    "conversion",
+    "document_matchers",
+    "docx",
+    "documents",
+    "html",
+    "html_paths",
+    "images",
+    "lists",
+    "options",
+    "profiling",
+    "raw_text",
+    "results",
+    "server",
+    "styles",
+    "transforms",
+    "underline",
+    "writers",
+    "zips",
+])
+
+_lazy_attributes = {
+    "extract_raw_text_from_element": "raw_text",
+    "read_style_map": "docx.style_map",
+    "write_style_map": "docx.style_map",
+}
+
+
+def __getattr__(name):
+    if name in _lazy_submodules:
+        return importlib.import_module("." + name, __name__)
+    elif name in _lazy_attributes:
+        module = importlib.import_module("." + _lazy_attributes[name], __name__)
+        return getattr(module, name)
+    else:
+        raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | _lazy_submodules | set(_lazy_attributes))
+
+
 _undefined = object()
 
 
@@ -18,12 +62,86 @@ def convert_to_markdown(*args, **kwargs):
 
 def convert(
     fileobj,
-    transform_document=None,
     id_prefix=None,
+    profiler=None,
+    on_message=None,
+    style_classes=False,
+    output_stream=None,
+    **kwargs
+):
+    from . import conversion, profiling, results
+
+    if profiler is None:
+        phase_profiler = profiling.null_profiler
+    else:
+        phase_profiler = profiler
+
+    if style_classes and kwargs.get("output_format") not in (None, "html"):
+        raise ValueError("style_classes can only be used with HTML output")
+
+    message_sink = results.MessageSink(on_message)
+
+    if style_classes:
+        stylesheet = conversion.Stylesheet()
+    else:
+        stylesheet = None
+
+    result = _read_document_for_conversion(fileobj, phase_profiler, message_sink, **kwargs) \
+        .bind(lambda document_and_options:
+            conversion.convert_document_element_to_html(
+                document_and_options[0],
+                id_prefix=id_prefix,
+                profiler=phase_profiler,
+                message_sink=message_sink,
+                stylesheet=stylesheet,
+                output_stream=output_stream,
+                **document_and_options[1]
+            )
+        )
+    result.message_counts = message_sink.counts()
+    result.stylesheet = None if stylesheet is None else stylesheet.as_string()
+
+    if profiler is not None:
+        result.profile = profiler.phases
+
+    return result
+
+
+def convert_to_html_in_chunks(fileobj, split_on, id_prefix=None, on_message=None, **kwargs):
+    from . import conversion, profiling, results
+
+    message_sink = results.MessageSink(on_message)
+    document_and_options = _read_document_for_conversion(
+        fileobj,
+        profiling.null_profiler,
+        message_sink,
+        output_format="html",
+        **kwargs
+    ).value
+
+    return conversion.convert_document_element_to_html_in_chunks(
+        document_and_options[0],
+        split_on=split_on,
+        id_prefix=id_prefix,
+        message_sink=message_sink,
+        **document_and_options[1]
+    )
+
+
+def _read_document_for_conversion(
+    fileobj,
+    phase_profiler,
+    message_sink,
+    transform_document=None,
     include_embedded_style_map=_undefined,
     external_file_access=_undefined,
+    max_blocks=None,
+    coalesce_runs=False,
     **kwargs
 ):
+    from . import docx, options
+    from .docx.style_map import read_style_map
+
     if include_embedded_style_map is _undefined:
         include_embedded_style_map = True
 
@@ -36,23 +154,48 @@ def convert(
     if external_file_access is _undefined:
         external_file_access = False
 
-    return options.read_options(kwargs).bind(lambda convert_options:
-        docx.read(fileobj, external_file_access=external_file_access).map(transform_document).bind(lambda document:
-            conversion.convert_document_element_to_html(
-                document,
-                id_prefix=id_prefix,
-                **convert_options
-            )
-        )
+    def send_messages(result):
+        message_sink.extend(result.messages)
+        return result
+
+    def transform(document):
+        with phase_profiler.phase("transform document"):
+            return transform_document(document)
+
+    with phase_profiler.phase("read options"):
+        options_result = send_messages(options.read_options(kwargs))
+
+    return options_result.bind(lambda convert_options:
+        send_messages(docx.read(
+            fileobj,
+            external_file_access=external_file_access,
+            max_blocks=max_blocks,
+            coalesce_runs=coalesce_runs,
+            profiler=phase_profiler,
+        )).map(transform).map(lambda document: (document, convert_options))
     )
 
 
 def extract_raw_text(fileobj):
+    from . import docx
+    from .raw_text import extract_raw_text_from_element
+
     return docx.read(fileobj).map(extract_raw_text_from_element)
 
 
 def embed_style_map(fileobj, style_map):
+    from .docx.style_map import write_style_map
+
     write_style_map(fileobj, style_map)
 
+
+def embed_style_map_in_paths(paths, style_map):
+    from .docx.style_map import write_style_map_to_paths
+
+    write_style_map_to_paths(paths, style_map)
+
+
 def read_embedded_style_map(fileobj):
+    from .docx.style_map import read_style_map
+
     return read_style_map(fileobj)
@@ -1,8 +1,10 @@
 import argparse
 import io
+import json
 import os
 import shutil
 import sys
+import time
 
 import mammoth
 from . import writers
@@ -10,6 +12,10 @@ from . import writers
 
 def main():
     args = _parse_args()
+
+    if args.serve_stdio:
+        _serve_stdio(sys.stdin, sys.stdout)
+        return
     
     if args.style_map is None:
         style_map = None
@@ -26,18 +32,116 @@ def main():
             output_filename = "{0}.html".format(os.path.basename(args.path).rpartition(".")[0])
             output_path = os.path.join(args.output_dir, output_filename)
         
+        if args.profile:
+            profiler = mammoth.profiling.Profiler()
+        else:
+            profiler = None
+
         result = mammoth.convert(
             docx_fileobj,
             style_map=style_map,
             convert_image=convert_image,
             output_format=args.output_format,
+            profiler=profiler,
+            style_classes=args.style_classes,
         )
         for message in result.messages:
             sys.stderr.write(message.message)
             sys.stderr.write("\n")
         
+        if result.stylesheet:
+            output = "<style>\n{0}</style>\n{1}".format(result.stylesheet, result.value)
+        else:
+            output = result.value
+
+        _write_output(output_path, output)
+
+        if profiler is not None:
+            sys.stderr.write(mammoth.profiling.format_phases(result.profile))
+            sys.stderr.write("\n")
+
+
+def _serve_stdio(input_lines, output):
+    style_maps = _StyleMapCache()
+
+    for line in input_lines:
+        if not line.strip():
+            continue
+
+        start_time = time.perf_counter()
+        job_id = None
+        try:
+            job = json.loads(line)
+            job_id = job.get("id")
+            response = _run_job(job, style_maps)
+        except Exception as error:
+            response = {"ok": False, "error": "{0}: {1}".format(type(error).__name__, error)}
+
+        response["id"] = job_id
+        response["seconds"] = time.perf_counter() - start_time
+        output.write(json.dumps(response))
+        output.write("\n")
+        output.flush()
+
+
+def _run_job(job, style_maps):
+    path = job["path"]
+    output_dir = job.get("output_dir")
+    style_classes = job.get("style_classes", False)
+
+    if output_dir is None:
+        convert_image = None
+        output_path = job.get("output")
+    else:
+        convert_image = mammoth.images.img_element(ImageWriter(output_dir))
+        output_filename = "{0}.html".format(os.path.basename(path).rpartition(".")[0])
+        output_path = os.path.join(output_dir, output_filename)
+
+    with open(path, "rb") as docx_fileobj:
+        result = mammoth.convert(
+            docx_fileobj,
+            style_map=style_maps.read(job.get("style_map")),
+            convert_image=convert_image,
+            output_format=job.get("output_format"),
+            style_classes=style_classes,
+        )
+
+    response = {
+        "ok": True,
+        "output": output_path,
+        "messages": [
+            {"type": message.type, "message": message.message}
+            for message in result.messages
+        ],
+    }
+    if style_classes:
+        response["stylesheet"] = result.stylesheet
+    if output_path is None:
+        response["value"] = result.value
+    else:
         _write_output(output_path, result.value)
 
+    return response
+
+
+class _StyleMapCache(object):
+    # Style maps are re-read only when the file changes, so that parsed style
+    # maps stay cached for jobs that share the same style map.
+    def __init__(self):
+        self._style_maps = {}
+
+    def read(self, path):
+        if path is None:
+            return None
+
+        modified_time = os.stat(path).st_mtime_ns
+        cached = self._style_maps.get(path)
+        if cached is None or cached[0] != modified_time:
+            with open(path) as style_map_fileobj:
+                cached = self._style_maps[path] = (modified_time, style_map_fileobj.read())
+
+        return cached[1]
+
 
 class ImageWriter(object):
     def __init__(self, output_dir):
@@ -74,6 +178,7 @@ def _parse_args():
     parser = argparse.ArgumentParser()
     parser.add_argument(
         "path",
+        nargs="?",
         metavar="docx-path",
         help="Path to the .docx file to convert.")
     
@@ -96,7 +201,22 @@ def _parse_args():
         "--style-map",
         required=False,
         help="File containg a style map.")
-    return parser.parse_args()
+    parser.add_argument(
+        "--style-classes",
+        action="store_true",
+        help="Write colours as classes defined in a <style> element at the start of the output, rather than as inline styles.")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print the time spent in each phase of the conversion to stderr.")
+    parser.add_argument(
+        "--serve-stdio",
+        action="store_true",
+        help="Read conversion jobs as JSON lines from stdin, writing a JSON line for each result to stdout.")
+    args = parser.parse_args()
+    if args.path is None and not args.serve_stdio:
+        parser.error("the following arguments are required: docx-path")
+    return args
 
 
 if __name__ == "__main__":
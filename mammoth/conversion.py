@@ -2,13 +2,15 @@
 
 from __future__ import unicode_literals
 
-from functools import partial
+import collections
 import copy
+import io
+import types
 import cobble
 
 from .docx.numbering_xml import to_numbering_level
 
-from . import documents, results, html_paths, images, writers, html
+from . import documents, results, html_paths, images, writers, html, transforms, profiling, list_numbering
 from .docx.files import InvalidFileReferenceError
 from .lists import find_index
 
@@ -18,7 +20,147 @@ def convert_document_element_to_html(element,
         convert_image=None,
         id_prefix=None,
         output_format=None,
-        ignore_empty_paragraphs=True):
+        ignore_empty_paragraphs=True,
+        split_on=None,
+        max_output_bytes=None,
+        profiler=None,
+        message_sink=None,
+        stylesheet=None,
+        output_stream=None):
+
+    if split_on is not None and output_stream is not None:
+        raise ValueError("output_stream can't be used when splitting the document into chunks")
+
+    if profiler is None:
+        profiler = profiling.null_profiler
+
+    if message_sink is None:
+        message_sink = results.MessageSink()
+
+    converter_kwargs = dict(
+        style_map=style_map,
+        convert_image=convert_image,
+        id_prefix=id_prefix,
+        ignore_empty_paragraphs=ignore_empty_paragraphs,
+        max_output_bytes=max_output_bytes,
+        profiler=profiler,
+        message_sink=message_sink,
+        stylesheet=stylesheet,
+    )
+
+    if split_on is None and (max_output_bytes is None or not isinstance(element, documents.Document)):
+        converter = _create_converter(element, **converter_kwargs)
+        with profiler.phase("convert document"):
+            nodes = converter._visit_all([element], _ConversionContext(is_table_header=False))
+        return results.Result(_write_nodes(nodes, output_format, profiler, output_stream), message_sink.messages)
+    else:
+        chunks = list(convert_document_element_to_html_in_chunks(
+            element,
+            split_on,
+            output_format=output_format,
+            **converter_kwargs
+        ))
+        if output_stream is not None:
+            output_stream.write(chunks[0])
+            value = None
+        elif split_on is None:
+            [value] = chunks
+        else:
+            value = chunks
+        return results.Result(value, message_sink.messages)
+
+
+def convert_document_element_to_html_in_chunks(element, split_on, profiler=None, message_sink=None, output_format=None, **kwargs):
+    # Each chunk is converted and written only when it's asked for, so that
+    # callers can start using the first chunk before the rest of the
+    # document has been converted. Messages are added to the message sink
+    # as they're generated. Each block is written as soon as it's visited,
+    # so that the size of the output so far is known when limiting the size
+    # of the output.
+    if profiler is None:
+        profiler = profiling.null_profiler
+
+    if message_sink is None:
+        message_sink = results.MessageSink()
+
+    if not isinstance(element, documents.Document):
+        element = documents.document([element])
+
+    converter = _create_converter(
+        element,
+        profiler=profiler,
+        message_sink=message_sink,
+        **kwargs
+    )
+    output = _ChunkWriter(output_format)
+    block_nodes = converter.visit_document_in_chunks(
+        element,
+        _ConversionContext(is_table_header=False),
+        split_on,
+        output_size=output.output_size,
+    )
+    while True:
+        with profiler.phase("convert document"):
+            nodes = next(block_nodes, None)
+        if nodes is None:
+            return
+        elif nodes is _end_of_chunk:
+            with profiler.phase("write"):
+                chunk = output.end_chunk()
+            yield chunk
+        else:
+            with profiler.phase("write"):
+                output.add(nodes)
+
+
+class _ChunkWriter(object):
+    def __init__(self, output_format):
+        self._output_format = output_format
+        self._previous_chunks_size = 0
+        self._start_chunk()
+
+    def _start_chunk(self):
+        self._stream = _ByteCountingStream()
+        self._writer = html.IncrementalWriter(writers.writer(self._output_format, stream=self._stream))
+
+    def add(self, nodes):
+        self._writer.add(nodes)
+
+    def end_chunk(self):
+        self._writer.finish()
+        chunk = self._stream.getvalue()
+        self._previous_chunks_size += self._stream.byte_count
+        self._start_chunk()
+        return chunk
+
+    def output_size(self):
+        unstarted_stream = _ByteCountingStream()
+        self._writer.write_unstarted(writers.writer(self._output_format, stream=unstarted_stream))
+        return self._previous_chunks_size + self._stream.byte_count + unstarted_stream.byte_count
+
+
+class _ByteCountingStream(io.StringIO):
+    def __init__(self):
+        io.StringIO.__init__(self)
+        self.byte_count = 0
+
+    def write(self, text):
+        if text.isascii():
+            self.byte_count += len(text)
+        else:
+            self.byte_count += len(text.encode("utf-8"))
+        return io.StringIO.write(self, text)
+
+
+def _create_converter(element,
+        style_map=None,
+        convert_image=None,
+        id_prefix=None,
+        ignore_empty_paragraphs=True,
+        max_output_bytes=None,
+        profiler=None,
+        message_sink=None,
+        stylesheet=None):
 
     if style_map is None:
         style_map = []
@@ -37,22 +179,64 @@ def convert_document_element_to_html(element,
     else:
         comments = {}
 
-    messages = []
-    converter = _DocumentConverter(
-        messages=messages,
+    return _DocumentConverter(
+        messages=message_sink,
         style_map=style_map,
         convert_image=convert_image,
         id_prefix=id_prefix,
         ignore_empty_paragraphs=ignore_empty_paragraphs,
         note_references=[],
         comments=comments,
+        max_output_bytes=max_output_bytes,
+        profiler=profiler,
+        stylesheet=stylesheet,
     )
-    context = _ConversionContext(is_table_header=False)
-    nodes = converter.visit(element, context)
 
-    writer = writers.writer(output_format)
-    html.write(writer, html.collapse(html.strip_empty(nodes)))
-    return results.Result(writer.as_string(), messages)
+
+def _write_nodes(nodes, output_format, profiler=profiling.null_profiler, output_stream=None):
+    with profiler.phase("strip empty"):
+        nodes = html.strip_empty(nodes)
+
+    with profiler.phase("collapse"):
+        nodes = html.collapse(nodes)
+
+    with profiler.phase("write"):
+        writer = writers.writer(output_format, stream=output_stream)
+        html.write(writer, nodes)
+        if output_stream is None:
+            return writer.as_string()
+        else:
+            return None
+
+
+class Stylesheet(object):
+    # Each distinct style declaration is given a single class, so that
+    # formatting such as colours is written once in the stylesheet rather
+    # than on every run.
+    def __init__(self, class_prefix="mammoth-c"):
+        self._class_prefix = class_prefix
+        self._class_names = {}
+
+    def class_name(self, declaration):
+        class_name = self._class_names.get(declaration)
+        if class_name is None:
+            class_name = self._class_names[declaration] = "{0}{1}".format(
+                self._class_prefix,
+                len(self._class_names) + 1,
+            )
+        return class_name
+
+    def as_string(self):
+        return "".join(
+            ".{0} {{ {1} }}\n".format(class_name, declaration)
+            for declaration, class_name in self._class_names.items()
+        )
+
+
+_end_of_chunk = object()
+
+
+_RunPaths = collections.namedtuple("_RunPaths", ["paths", "is_ignored", "is_style_unrecognised"])
 
 
 @cobble.data
@@ -64,7 +248,7 @@ class _ConversionContext(object):
 
 
 class _DocumentConverter(documents.element_visitor(args=1)):
-    def __init__(self, messages, style_map, convert_image, id_prefix, ignore_empty_paragraphs, note_references, comments):
+    def __init__(self, messages, style_map, convert_image, id_prefix, ignore_empty_paragraphs, note_references, comments, max_output_bytes=None, profiler=None, stylesheet=None):
         self._messages = messages
         self._style_map = style_map
         self._id_prefix = id_prefix
@@ -73,115 +257,177 @@ class _DocumentConverter(documents.element_visitor(args=1)):
         self._referenced_comments = []
         self._convert_image = convert_image
         self._comments = comments
-        self._li_counters = {}
+        self._li_counters = list_numbering.ListCounters()
+        self._run_paths = {}
+        self._max_output_bytes = max_output_bytes
+        self._profiler = profiler or profiling.null_profiler
+        self._stylesheet = stylesheet
 
     def visit_image(self, image, context):
         try:
-            result = self._convert_image(image)
+            with self._profiler.phase("convert image"):
+                result = self._convert_image(image)
             return result
         except InvalidFileReferenceError as error:
-            self._messages.append(results.warning(str(error)))
+            self._messages.add(results.warning(str(error)))
             return []
 
     def visit_document(self, document, context):
-        nodes = self._visit_all(document.children, context)
+        nodes = [
+            html_node
+            for child, child_nodes in self._visit_blocks(document, context)
+            for html_node in child_nodes
+        ]
+        return nodes + self._visit_referents(
+            document,
+            self._note_references,
+            self._referenced_comments,
+            context,
+        )
+
+    def visit_document_in_chunks(self, document, context, split_on, output_size=None):
+        # The nodes for each block are yielded as soon as the block is
+        # visited, and _end_of_chunk is yielded at the end of each chunk.
+        # Each chunk includes the notes and comments referenced within it.
+        # Numbering continues across chunks so that generated IDs stay unique.
+        note_start = 0
+        comment_start = 0
+        is_chunk_empty = True
+        has_chunks = False
+
+        def end_chunk(note_end, comment_end):
+            nonlocal note_start, comment_start, is_chunk_empty, has_chunks
+            yield self._visit_referents(
+                document,
+                self._note_references[note_start:note_end],
+                self._referenced_comments[comment_start:comment_end],
+                context,
+            )
+            yield _end_of_chunk
+            note_start = note_end
+            comment_start = comment_end
+            is_chunk_empty = True
+            has_chunks = True
+
+        note_end = 0
+        comment_end = 0
+        for child, nodes in self._visit_blocks(document, context, output_size):
+            if not is_chunk_empty and _starts_chunk(child, nodes, split_on):
+                yield from end_chunk(note_end, comment_end)
+
+            yield nodes
+            if nodes:
+                is_chunk_empty = False
+
+            note_end = len(self._note_references)
+            comment_end = len(self._referenced_comments)
+
+            if _ends_chunk(child, split_on):
+                yield from end_chunk(note_end, comment_end)
+
+        if not is_chunk_empty or not has_chunks:
+            yield from end_chunk(len(self._note_references), len(self._referenced_comments))
+
+    def _visit_blocks(self, document, context, output_size=None):
+        for index, child in enumerate(document.children):
+            if (
+                self._max_output_bytes is not None and
+                output_size is not None and
+                output_size() >= self._max_output_bytes
+            ):
+                self._messages.warning(
+                    "Output was truncated after {0} of {1} blocks to fit within {2} bytes",
+                    index, len(document.children), self._max_output_bytes,
+                )
+                return
+
+            yield child, self._visit_all([child], context)
+
+    def _visit_referents(self, document, note_references, referenced_comments, context):
         notes = [
             document.notes.resolve(reference)
-            for reference in self._note_references
+            for reference in note_references
         ]
         notes_list = html.element("ol", {}, self._visit_all(notes, context))
         comments = html.element("dl", {}, [
             html_node
-            for referenced_comment in self._referenced_comments
+            for referenced_comment in referenced_comments
             for html_node in self.visit_comment(referenced_comment, context)
         ])
-        return nodes + [notes_list, comments]
+        return [notes_list, comments]
 
 
     def visit_paragraph(self, paragraph, context):
-        def children():
-            content = self._visit_all(paragraph.children, context)
-            if self._ignore_empty_paragraphs:
-                return content
-            else:
-                return [html.force_write] + content
-
         html_path = self._find_html_path_for_paragraph(paragraph)
         
         extra_attrs = {}
         self._numbered_ol( paragraph, html_path, extra_attrs)
-                       
-        elements = html_path.wrap(children, extra_attrs)
-        return elements
 
-    def _numbered_ol(self, paragraph, html_path, extra_attrs):
-        ## Add a start attr to OL
-        
-       
-        if paragraph.numbering is not None:                    
-     
-            if paragraph.list_id is not None: 
-                # Keep track of the order for lists that continue from annothe lists
-                list_key = ( paragraph.list_id, paragraph.numbering.level_index)
-
-                # List counters are only valid for list items under the same parent.
-                # When the parent changes, reset all counters for nested li's
-
-                para_level_index =  int(paragraph.numbering.level_index)
-                for li_counter_key in list(self._li_counters.keys()):
-                    lic_list_id, lic_level_index = li_counter_key
-                    lic_level_index = int(lic_level_index)
-
-                    if lic_list_id == paragraph.list_id and lic_level_index > para_level_index:
-                        del self._li_counters[li_counter_key]
- 
-                if self._li_counters.get( list_key ) is None:                 
-                    if paragraph.numbering.start_num is not None and paragraph.numbering.start_num != '1':
-                        self._li_counters[list_key] = int(paragraph.numbering.start_num)
-                    else:
-                        self._li_counters[list_key] = 1
-                else:
-                    self._li_counters[list_key] += 1
-                
-                li_count = self._li_counters[list_key]
+        if html_path is html_paths.ignore:
+            return []
 
+        content = yield paragraph.children, context
+        if not self._ignore_empty_paragraphs:
+            content = [html.force_write] + content
 
-                for path_elem in reversed(html_path.elements):
-                    if path_elem.tag.tag_name == 'li':
-                        extra_attrs[id(path_elem)] = {"data-li-order": str(li_count)}
-                        break
-        
-            type = None
-            paren_list_tag = "ol"
-            if paragraph.numbering.numbering_format == "lowerLetter":
-                type = "a"
-            elif paragraph.numbering.numbering_format == "upperLetter":
-                type = "A" 
-            elif paragraph.numbering.numbering_format == "lowerRoman":
-                type = "i"
-            elif paragraph.numbering.numbering_format == "upperRoman":
-                type = "I"
-            elif paragraph.numbering.numbering_format == "bullet":
-                paren_list_tag = "ul"
-                if paragraph.numbering.level_text == "o":
-                    type = "circle"
-                else:
-                    bullet_char = ":".join("{:02x}".format(
-                        ord(c)) for c in paragraph.numbering.level_text)
-                    if bullet_char == "f0a7":
-                        type = "square"
-                    elif bullet_char == "f0b7":
-                        type = "disc"
+        return html_path.wrap_nodes(content, extra_attrs)
+
+    def _numbered_ol(self, paragraph, html_path, extra_attrs):
+        if paragraph.numbering is None:
+            return
+
+        # Keep track of the order for lists that continue from other lists
+        if paragraph.list_id is not None:
+            li_count = self._li_counters.next(
+                paragraph.list_id,
+                paragraph.numbering.level_index,
+                paragraph.numbering.start_num,
+            )
+            path_elem = _find_last_path_element(html_path, "li")
+            if path_elem is not None:
+                extra_attrs[id(path_elem)] = {"data-li-order": str(li_count)}
 
-            if type is not None:
-                for path_elem in reversed(html_path.elements):
-                    if path_elem.tag.tag_name == paren_list_tag:
-                        extra_attrs[id(path_elem)] = {"type":type}
-                        break    
+        parent_list_tag, type = list_numbering.list_type(paragraph.numbering)
+        if type is not None:
+            path_elem = _find_last_path_element(html_path, parent_list_tag)
+            if path_elem is not None:
+                extra_attrs[id(path_elem)] = {"type": type}
 
 
     def visit_run(self, run, context):
-        nodes = lambda: self._visit_all(run.children, context)
+        # Documents usually only use a handful of distinct combinations of
+        # run formatting, so the HTML paths are found once per combination.
+        signature = (
+            run.style_id,
+            run.style_name,
+            run.highlight,
+            run.is_small_caps,
+            run.is_all_caps,
+            run.is_strikethrough,
+            run.is_underline,
+            run.vertical_alignment,
+            run.is_italic,
+            run.is_bold,
+            run.highlight_color,
+            run.font_color,
+        )
+        run_paths = self._run_paths.get(signature)
+        if run_paths is None:
+            run_paths = self._run_paths[signature] = self._find_html_paths_for_run(run)
+        elif run_paths.is_style_unrecognised:
+            self._warn_unrecognised_style(run, "run")
+
+        if run_paths.is_ignored:
+            nodes = []
+        else:
+            nodes = yield run.children, context
+
+        for path in run_paths.paths:
+            nodes = path.wrap_nodes(nodes)
+
+        return nodes
+
+    def _find_html_paths_for_run(self, run):
         paths = []
         if run.highlight is not None:
             style = self._find_style(Highlight(color=run.highlight), "highlight")
@@ -205,16 +451,40 @@ class _DocumentConverter(documents.element_visitor(args=1)):
             paths.append(self._find_style_for_run_property("bold", default="strong"))
         if run.highlight_color is not None:
             color = documents.highlight_color_map.get(run.highlight_color, run.highlight_color)
-            paths.append(html_paths.element(["span"], attributes={"style":f"background-color:{color}"}, fresh=False))
+            paths.append(self._styled_span(f"background-color:{color}"))
         if run.font_color is not None:
-            paths.append(html_paths.element(["span"], attributes={"style": f"color: #{run.font_color}"}, fresh=False))
-        paths.append(self._find_html_path_for_run(run))
-
-        for path in paths:
-            nodes = partial(path.wrap, nodes)
+            paths.append(self._styled_span(f"color: #{run.font_color}"))
+
+        style = self._find_style(run, "run")
+        if style is None:
+            paths.append(html_paths.empty)
+            is_style_unrecognised = run.style_id is not None
+            if is_style_unrecognised:
+                self._warn_unrecognised_style(run, "run")
+        else:
+            paths.append(style.html_path)
+            is_style_unrecognised = False
+
+        # An ignored path discards the nodes it wraps without generating
+        # them, so the children of the run are never visited.
+        outer_paths_start = 0
+        for index, path in enumerate(paths):
+            if path is html_paths.ignore:
+                outer_paths_start = index + 1
+
+        return _RunPaths(
+            paths=paths[outer_paths_start:],
+            is_ignored=outer_paths_start > 0,
+            is_style_unrecognised=is_style_unrecognised,
+        )
 
-        return nodes()
 
+    def _styled_span(self, declaration):
+        if self._stylesheet is None:
+            attributes = {"style": declaration}
+        else:
+            attributes = {"class": self._stylesheet.class_name(declaration)}
+        return html_paths.element(["span"], attributes=attributes, fresh=False)
 
     def _find_style_for_run_property(self, element_type, default=None):
         style = self._find_style(None, element_type)
@@ -240,7 +510,7 @@ class _DocumentConverter(documents.element_visitor(args=1)):
         if hyperlink.target_frame is not None:
             attributes["target"] = hyperlink.target_frame
 
-        nodes = self._visit_all(hyperlink.children, context)
+        nodes = yield hyperlink.children, context
         return [html.collapsible_element("a", attributes, nodes)]
 
 
@@ -267,10 +537,10 @@ class _DocumentConverter(documents.element_visitor(args=1)):
     _default_table_path = html_paths.path([html_paths.element(["table"], fresh=True)])
 
     def visit_table(self, table, context):
-        return self._find_html_path(table, "table", self._default_table_path) \
-            .wrap(lambda: self._convert_table_children(table, context))
+        html_path = self._find_html_path(table, "table", self._default_table_path)
+        if html_path is html_paths.ignore:
+            return []
 
-    def _convert_table_children(self, table, context):
         body_index = find_index(
             lambda child: not isinstance(child, documents.TableRow) or not child.is_header,
             table.children,
@@ -279,20 +549,21 @@ class _DocumentConverter(documents.element_visitor(args=1)):
             body_index = len(table.children)
 
         if body_index == 0:
-            children = self._visit_all(table.children, context.copy(is_table_header=False))
+            children = yield table.children, context.copy(is_table_header=False)
         else:
-            head_rows = self._visit_all(table.children[:body_index], context.copy(is_table_header=True))
-            body_rows = self._visit_all(table.children[body_index:], context.copy(is_table_header=False))
+            head_rows = yield table.children[:body_index], context.copy(is_table_header=True)
+            body_rows = yield table.children[body_index:], context.copy(is_table_header=False)
             children = [
                 html.element("thead", {}, head_rows),
                 html.element("tbody", {}, body_rows),
             ]
 
-        return [html.force_write] + children
+        return html_path.wrap_nodes([html.force_write] + children)
 
 
     def visit_table_row(self, table_row, context):
-        return [html.element("tr", {}, [html.force_write] + self._visit_all(table_row.children, context))]
+        nodes = yield table_row.children, context
+        return [html.element("tr", {}, [html.force_write] + nodes)]
 
 
     def visit_table_cell(self, table_cell, context):
@@ -305,7 +576,8 @@ class _DocumentConverter(documents.element_visitor(args=1)):
             attributes["colspan"] = str(table_cell.colspan)
         if table_cell.rowspan != 1:
             attributes["rowspan"] = str(table_cell.rowspan)
-        nodes = [html.force_write] + self._visit_all(table_cell.children, context)
+        nodes = yield table_cell.children, context
+        nodes = [html.force_write] + nodes
         return [
             html.element(tag_name, attributes, nodes)
         ]
@@ -339,7 +611,7 @@ class _DocumentConverter(documents.element_visitor(args=1)):
 
 
     def visit_note(self, note, context):
-        note_body = self._visit_all(note.body, context) + [
+        note_body = (yield note.body, context) + [
             html.collapsible_element("p", {}, [
                 html.text(" "),
                 html.element("a", {"href": "#" + self._note_ref_html_id(note)}, [
@@ -396,11 +668,39 @@ class _DocumentConverter(documents.element_visitor(args=1)):
 
 
     def _visit_all(self, elements, context):
-        return [
-            html_node
-            for element in elements
-            for html_node in self.visit(element, context)
-        ]
+        # Visit methods for elements with children are generators that yield
+        # the children and the context to visit them with, and are sent the
+        # nodes for those children. The generators are suspended on an
+        # explicit stack rather than recursing, so that deeply nested
+        # documents can't exceed the recursion limit.
+        all_nodes = []
+        stack = [(iter(elements), context, all_nodes, None, None)]
+        visit = self.visit
+        generator_type = types.GeneratorType
+
+        def resume(visiting, children_nodes, parent_nodes):
+            try:
+                children, children_context = visiting.send(children_nodes)
+            except StopIteration as stop:
+                parent_nodes += stop.value
+            else:
+                stack.append((iter(children), children_context, [], visiting, parent_nodes))
+
+        while stack:
+            elements, context, nodes, visiting, parent_nodes = stack[-1]
+            for element in elements:
+                element_nodes = visit(element, context)
+                if isinstance(element_nodes, generator_type):
+                    resume(element_nodes, None, nodes)
+                    break
+                else:
+                    nodes += element_nodes
+            else:
+                stack.pop()
+                if visiting is not None:
+                    resume(visiting, nodes, parent_nodes)
+
+        return all_nodes
 
 
     def _find_html_path_for_paragraph(self, paragraph):
@@ -414,23 +714,22 @@ class _DocumentConverter(documents.element_visitor(args=1)):
         default = html_paths.path([html_paths.element("p", attributes=attrs, fresh=True)])
         return self._find_html_path(paragraph, "paragraph", default, warn_unrecognised=True)
 
-    def _find_html_path_for_run(self, run):
-        return self._find_html_path(run, "run", default=html_paths.empty, warn_unrecognised=True)
-
-
     def _find_html_path(self, element, element_type, default, warn_unrecognised=False):
         style = self._find_style(element, element_type)
         if style is not None:
             return style.html_path
 
         if warn_unrecognised and getattr(element, "style_id", None) is not None:
-            self._messages.append(results.warning(
-                "Unrecognised {0} style: {1} (Style ID: {2})".format(
-                    element_type, element.style_name, element.style_id)
-            ))
+            self._warn_unrecognised_style(element, element_type)
 
         return default
 
+    def _warn_unrecognised_style(self, element, element_type):
+        self._messages.warning(
+            "Unrecognised {0} style: {1} (Style ID: {2})",
+            element_type, element.style_name, element.style_id,
+        )
+
     def _find_style(self, element, element_type):
         for style in self._style_map:
             document_matcher = style.document_matcher
@@ -487,6 +786,45 @@ def _document_matcher_matches(matcher, element, element_type):
         )
 
 
+def _find_last_path_element(html_path, tag_name):
+    for path_elem in reversed(html_path.elements):
+        if path_elem.tag.tag_name == tag_name:
+            return path_elem
+
+    return None
+
+
+def _starts_chunk(element, nodes, split_on):
+    if isinstance(split_on, documents.Break):
+        return _find_break_position(element, split_on) == "before"
+    else:
+        return (
+            len(nodes) > 0 and
+            isinstance(nodes[0], html.Element) and
+            nodes[0].tag_name == split_on
+        )
+
+
+def _ends_chunk(element, split_on):
+    return (
+        isinstance(split_on, documents.Break) and
+        _find_break_position(element, split_on) == "after"
+    )
+
+
+def _find_break_position(element, break_):
+    # Chunks are split between top-level elements: a break before any text
+    # starts a new chunk with this element, otherwise the chunk ends after it.
+    has_text = False
+    for descendant in transforms.get_descendants(element):
+        if descendant == break_:
+            return "after" if has_text else "before"
+        elif isinstance(descendant, documents.Text) and descendant.value:
+            has_text = True
+
+    return None
+
+
 def _comment_author_label(comment):
     return comment.author_initials or ""
 
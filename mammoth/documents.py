@@ -1,22 +1,104 @@
+import hashlib
+
 import cobble
 
+from .slots import slotted
+
 
 class Element(object):
+    __slots__ = ()
+
     def copy(self, **kwargs):
         return cobble.copy(self, **kwargs)
 
 
 class HasChildren(Element):
+    __slots__ = ()
+
     children = cobble.field()
 
 
+@slotted
 @cobble.data
 class Document(HasChildren):
+    __slots__ = ("_index", )
+
     notes = cobble.field()
     comments = cobble.field()
 
+    @property
+    def index(self):
+        # The index is built the first time it's needed. Copying a document
+        # creates a new document without an index, so the index can't go
+        # stale when a document is transformed.
+        index = getattr(self, "_index", None)
+        if index is None:
+            index = self._index = DocumentIndex(self)
+        return index
+
+
+class DocumentIndex(object):
+    def __init__(self, document):
+        self._elements = _descendants(document)
+        self._elements_by_type = {}
+        self._paragraphs_by_style_id = {}
+        self._runs_by_style_id = {}
+        self._bookmarks_by_name = {}
+
+        for element in self._elements:
+            if isinstance(element, Paragraph):
+                self._paragraphs_by_style_id.setdefault(element.style_id, []).append(element)
+            elif isinstance(element, Run):
+                self._runs_by_style_id.setdefault(element.style_id, []).append(element)
+            elif isinstance(element, Bookmark):
+                self._bookmarks_by_name.setdefault(element.name, element)
+
+    def elements_of_type(self, element_type):
+        elements = self._elements_by_type.get(element_type)
+        if elements is None:
+            elements = self._elements_by_type[element_type] = [
+                element
+                for element in self._elements
+                if isinstance(element, element_type)
+            ]
+        return list(elements)
+
+    def paragraphs_with_style_id(self, style_id):
+        return list(self._paragraphs_by_style_id.get(style_id, ()))
+
+    def runs_with_style_id(self, style_id):
+        return list(self._runs_by_style_id.get(style_id, ()))
+
+    def bookmark(self, name):
+        return self._bookmarks_by_name.get(name)
+
+
+def _descendants(element):
+    # Descendants are listed with each element after its descendants. An
+    # explicit stack is used rather than recursion so that deeply nested
+    # documents can't exceed the recursion limit.
+    descendants = []
+    stack = [(element, iter(element.children))]
+    while stack:
+        parent, children = stack[-1]
+        for child in children:
+            if isinstance(child, HasChildren):
+                stack.append((child, iter(child.children)))
+                break
+            else:
+                descendants.append(child)
+        else:
+            stack.pop()
+            if stack:
+                descendants.append(parent)
+
+    return descendants
+
+@slotted
 @cobble.data
 class Paragraph(HasChildren):
+    __slots__ = ()
+
     style_id = cobble.field()
     style_name = cobble.field()
     numbering = cobble.field()
@@ -25,24 +107,33 @@ class Paragraph(HasChildren):
     indent = cobble.field()
 
 
+@slotted
 @cobble.data
 class ParagraphIndent(object):
+    __slots__ = ()
+
     start = cobble.field()
     end = cobble.field()
     first_line = cobble.field()
     hanging = cobble.field()
 
 
+@slotted
 @cobble.data
 class Indent(object):
+    __slots__ = ()
+
     left = cobble.field()
     right = cobble.field()
     first_line = cobble.field()
     hanging = cobble.field()
 
 
+@slotted
 @cobble.data
 class Run(HasChildren):
+    __slots__ = ()
+
     style_id = cobble.field()
     style_name = cobble.field()
     is_bold = cobble.field()
@@ -58,33 +149,51 @@ class Run(HasChildren):
     font_color = cobble.field()
     highlight = cobble.field()
 
+@slotted
 @cobble.data
 class Text(Element):
+    __slots__ = ()
+
     value = cobble.field()
 
+@slotted
 @cobble.data
 class Hyperlink(HasChildren):
+    __slots__ = ()
+
     href = cobble.field()
     anchor = cobble.field()
     target_frame = cobble.field()
 
+@slotted
 @cobble.data
 class Checkbox(Element):
+    __slots__ = ()
+
     checked = cobble.field()
 
 checkbox = Checkbox
 
+@slotted
 @cobble.data
 class Table(HasChildren):
+    __slots__ = ()
+
     style_id = cobble.field()
     style_name = cobble.field()
 
+@slotted
 @cobble.data
 class TableRow(HasChildren):
+    __slots__ = ()
+
     is_header = cobble.field()
 
+@slotted
 @cobble.data
 class TableCell(HasChildren):
+    __slots__ = ()
+
     colspan = cobble.field()
     rowspan = cobble.field()
 
@@ -101,12 +210,18 @@ class TableCellUnmerged:
     def copy(self, **kwargs):
         return cobble.copy(self, **kwargs)
 
+@slotted
 @cobble.data
 class Break(Element):
+    __slots__ = ()
+
     break_type = cobble.field()
 
+@slotted
 @cobble.data
 class Size(object):
+    __slots__ = ()
+
     width = cobble.field()
     height = cobble.field()
 
@@ -115,18 +230,62 @@ page_break = Break("page")
 column_break = Break("column")
 
 
+@slotted
 @cobble.data
 class Tab(Element):
-    pass
+    __slots__ = ()
 
 
+@slotted
 @cobble.data
 class Image(Element):
+    __slots__ = ()
+
     alt_text = cobble.field()
     content_type = cobble.field()
     open = cobble.field()
     size = cobble.field(default=None)
     attributes = cobble.field(default=None)
+    path = cobble.field(default=None)
+    info = cobble.field(default=None)
+
+
+class ImageInfo(object):
+    def __init__(self, read_zip_info, open):
+        self._read_zip_info = read_zip_info
+        self._zip_info = None
+        self._open = open
+        self._digests = {}
+
+    def _get_zip_info(self):
+        if self._zip_info is None:
+            self._zip_info = self._read_zip_info()
+        return self._zip_info
+
+    @property
+    def compressed_size(self):
+        return self._get_zip_info().compress_size
+
+    @property
+    def uncompressed_size(self):
+        return self._get_zip_info().file_size
+
+    @property
+    def crc(self):
+        return self._get_zip_info().CRC
+
+    def digest(self, algorithm="sha256"):
+        digest = self._digests.get(algorithm)
+        if digest is None:
+            hasher = hashlib.new(algorithm)
+            with self._open() as fileobj:
+                for chunk in iter(lambda: fileobj.read(_digest_chunk_size), b""):
+                    hasher.update(chunk)
+            digest = self._digests[algorithm] = hasher.hexdigest()
+        return digest
+
+
+_digest_chunk_size = 64 * 1024
 
 
 def document(children, notes=None, comments=None):
@@ -143,8 +302,13 @@ def paragraph(children, style_id=None, style_name=None, numbering=None, list_id=
     return Paragraph(children, style_id, style_name, numbering, list_id=list_id, alignment=alignment, indent=indent)
 
 def paragraph_indent(start=None, end=None, first_line=None, hanging=None):
+    if start is None and end is None and first_line is None and hanging is None:
+        return _empty_paragraph_indent
     return ParagraphIndent(start=start, end=end, first_line=first_line, hanging=hanging)
 
+# Most paragraphs have no indentation, so they share the same indent.
+_empty_paragraph_indent = ParagraphIndent(start=None, end=None, first_line=None, hanging=None)
+
 def run(
     children,
     style_id=None,
@@ -221,8 +385,11 @@ def hyperlink(children, href=None, anchor=None, target_frame=None):
     return Hyperlink(href=href, anchor=anchor, target_frame=target_frame, children=children)
 
 
+@slotted
 @cobble.data
 class Bookmark(Element):
+    __slots__ = ()
+
     name = cobble.field()
 
 bookmark = Bookmark
@@ -252,8 +419,11 @@ class _NumberingLevel(object):
     level_index = cobble.field()
     is_ordered = cobble.field()
 
+@slotted
 @cobble.data
 class Note(Element):
+    __slots__ = ()
+
     note_type = cobble.field()
     note_id = cobble.field()
     body = cobble.field()
@@ -287,8 +457,11 @@ def notes(notes_list):
 def _note_key(note):
     return (note.note_type, note.note_id)
 
+@slotted
 @cobble.data
 class NoteReference(Element):
+    __slots__ = ()
+
     note_type = cobble.field()
     note_id = cobble.field()
 
@@ -310,8 +483,11 @@ def comment(comment_id, body, author_name=None, author_initials=None):
         author_initials=author_initials,
     )
 
+@slotted
 @cobble.data
 class CommentReference(Element):
+    __slots__ = ()
+
     comment_id = cobble.field()
 
 comment_reference = CommentReference
@@ -3,7 +3,7 @@ import os
 
 import cobble
 
-from .. import results, lists, zips
+from .. import results, lists, zips, profiling
 from .document_xml import read_document_xml_element
 from .content_types_xml import empty_content_types, read_content_types_xml_element
 from .relationships_xml import read_relationships_xml_element, Relationships
@@ -19,23 +19,56 @@ from ..zips import open_zip
 _empty_result = results.success([])
 
 
-def read(fileobj, external_file_access=False):
-    zip_file = open_zip(fileobj, "r")
-    part_paths = _find_part_paths(zip_file)
+def read(
+    fileobj,
+    external_file_access=False,
+    max_blocks=None,
+    profiler=None,
+    build_index=False,
+    coalesce_runs=False,
+):
+    if profiler is None:
+        profiler = profiling.null_profiler
+
+    with profiler.phase("open zip"):
+        zip_file = open_zip(fileobj, "r")
+
+    part_paths = _find_part_paths(zip_file, profiler=profiler)
     read_part_with_body = _part_with_body_reader(
         getattr(fileobj, "name", None),
         zip_file,
         part_paths=part_paths,
         external_file_access=external_file_access,
+        coalesce_runs=coalesce_runs,
+        profiler=profiler,
     )
 
-    return results.combine([
-        _read_notes(read_part_with_body, part_paths),
-        _read_comments(read_part_with_body, part_paths),
+    with profiler.phase("read notes"):
+        notes_result = _read_notes(read_part_with_body, part_paths)
+
+    with profiler.phase("read comments"):
+        comments_result = _read_comments(read_part_with_body, part_paths)
+
+    document_result = results.combine([
+        notes_result,
+        comments_result,
     ]).bind(lambda referents:
-        _read_document(zip_file, read_part_with_body, notes=referents[0], comments=referents[1], part_paths=part_paths)
+        _read_document(
+            zip_file,
+            read_part_with_body,
+            notes=referents[0],
+            comments=referents[1],
+            part_paths=part_paths,
+            max_blocks=max_blocks,
+        )
     )
 
+    if build_index:
+        with profiler.phase("build index"):
+            document_result.value.index
+
+    return document_result
+
 
 @cobble.data
 class _PartPaths(object):
@@ -47,13 +80,14 @@ class _PartPaths(object):
     styles = cobble.field()
 
 
-def _find_part_paths(zip_file):
-    package_relationships = _read_relationships(zip_file, "_rels/.rels")
+def _find_part_paths(zip_file, profiler=profiling.null_profiler):
+    package_relationships = _read_relationships(zip_file, "_rels/.rels", profiler=profiler)
     document_filename = _find_document_filename(zip_file, package_relationships)
 
     document_relationships = _read_relationships(
         zip_file,
         _find_relationships_path_for(document_filename),
+        profiler=profiler,
     )
 
     def find(name):
@@ -124,23 +158,25 @@ def _read_comments(read_part_with_body, part_paths):
     )
 
 
-def _read_document(zip_file, read_part_with_body, notes, comments, part_paths):
+def _read_document(zip_file, read_part_with_body, notes, comments, part_paths, max_blocks):
     return read_part_with_body(
         part_paths.main_document,
         partial(
             read_document_xml_element,
             notes=notes,
             comments=comments,
+            max_blocks=max_blocks,
         ),
     )
 
 
-def _part_with_body_reader(document_path, zip_file, part_paths, external_file_access):
+def _part_with_body_reader(document_path, zip_file, part_paths, external_file_access, coalesce_runs, profiler):
     content_types = _try_read_entry_or_default(
         zip_file,
         "[Content_Types].xml",
         read_content_types_xml_element,
         empty_content_types,
+        profiler=profiler,
     )
 
     styles = _try_read_entry_or_default(
@@ -148,6 +184,7 @@ def _part_with_body_reader(document_path, zip_file, part_paths, external_file_ac
         part_paths.styles,
         read_styles_xml_element,
         Styles.EMPTY,
+        profiler=profiler,
     )
 
     numbering = _try_read_entry_or_default(
@@ -155,6 +192,7 @@ def _part_with_body_reader(document_path, zip_file, part_paths, external_file_ac
         part_paths.numbering,
         lambda element: read_numbering_xml_element(element, styles=styles),
         default=Numbering.EMPTY,
+        profiler=profiler,
     )
 
     files = Files(
@@ -163,7 +201,7 @@ def _part_with_body_reader(document_path, zip_file, part_paths, external_file_ac
     )
 
     def read_part(name, reader, default=_undefined):
-        relationships = _read_relationships(zip_file, _find_relationships_path_for(name))
+        relationships = _read_relationships(zip_file, _find_relationships_path_for(name), profiler=profiler)
 
         body_reader = body_xml.reader(
             numbering=numbering,
@@ -172,12 +210,19 @@ def _part_with_body_reader(document_path, zip_file, part_paths, external_file_ac
             styles=styles,
             docx_file=zip_file,
             files=files,
+            coalesce_runs=coalesce_runs,
         )
 
         if default is _undefined:
-            return _read_entry(zip_file, name, partial(reader, body_reader=body_reader))
+            return _read_entry(zip_file, name, partial(reader, body_reader=body_reader), profiler=profiler)
         else:
-            return _try_read_entry_or_default(zip_file, name, partial(reader, body_reader=body_reader), default=default)
+            return _try_read_entry_or_default(
+                zip_file,
+                name,
+                partial(reader, body_reader=body_reader),
+                default=default,
+                profiler=profiler,
+            )
 
     return read_part
 
@@ -188,24 +233,29 @@ def _find_relationships_path_for(name):
     return zips.join_path(dirname, "_rels", basename + ".rels")
 
 
-def _read_relationships(zip_file, name):
+def _read_relationships(zip_file, name, profiler):
     return _try_read_entry_or_default(
         zip_file,
         name,
         read_relationships_xml_element,
         default=Relationships.EMPTY,
+        profiler=profiler,
     )
 
-def _try_read_entry_or_default(zip_file, name, reader, default):
+def _try_read_entry_or_default(zip_file, name, reader, default, profiler):
     if zip_file.exists(name):
-        return _read_entry(zip_file, name, reader)
+        return _read_entry(zip_file, name, reader, profiler=profiler)
     else:
         return default
 
 
-def _read_entry(zip_file, name, reader):
+def _read_entry(zip_file, name, reader, profiler):
     with zip_file.open(name) as fileobj:
-        return reader(office_xml.read(fileobj))
+        with profiler.phase("parse " + name):
+            element = office_xml.read(fileobj)
+
+    with profiler.phase("read " + name):
+        return reader(element)
 
 
 _undefined = object()
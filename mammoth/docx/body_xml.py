@@ -6,10 +6,8 @@ from mammoth import results
 
 from .. import documents
 from .. import results
-from .. import lists
 from .. import transforms
 from . import complex_fields
-from .dingbats import dingbats
 from .xmlparser import node_types, XmlElement, null_xml_element
 from .styles_xml import Styles
 from .uris import replace_fragment, uri_to_zip_entry_name
@@ -26,7 +24,8 @@ def reader(
     relationships=None,
     styles=None,
     docx_file=None,
-    files=None
+    files=None,
+    coalesce_runs=False,
 ):
 
     if styles is None:
@@ -39,6 +38,7 @@ def reader(
         styles=styles,
         docx_file=docx_file,
         files=files,
+        coalesce_runs=coalesce_runs,
     )
     return _BodyReader(read_all)
 
@@ -49,13 +49,21 @@ class _BodyReader(object):
         self._read_all = read_all
 
     def read_all(self, elements):
-        result = self._read_all(elements)
-        return results.Result(result.elements, result.messages)
+        return self._read_all(elements)
 
 
-def _create_reader(numbering, content_types, relationships, styles, docx_file, files):
+def _create_reader(numbering, content_types, relationships, styles, docx_file, files, coalesce_runs):
     current_instr_text = []
     complex_field_stack = []
+    # Rather than building intermediate results for every XML element, each
+    # handler appends its output to the list of elements for its parent, and
+    # warnings and extra elements (such as the contents of w:pict) are
+    # collected as a side effect.
+    message_sink = None
+    extra_stack = []
+
+    def warn(template, *args):
+        message_sink.warning(template, *args)
 
     # When a paragraph is marked as deleted, its contents should be combined
     _ignored_elements = set([
@@ -80,17 +88,17 @@ def _create_reader(numbering, content_types, relationships, styles, docx_file, f
         "w:tcPr",
     ])
 
-    def text(element):
-        return _success(documents.Text(_inner_text(element)))
+    def text(element, elements):
+        elements.append(documents.Text(_inner_text(element)))
 
-    def run(element):
+    def run(element, elements):
         properties = element.find_child_or_null("w:rPr")
-        vertical_alignment = properties \
+        vertical_alignment = _intern(properties \
             .find_child_or_null("w:vertAlign") \
-            .attributes.get("w:val")
-        font = properties.find_child_or_null("w:rFonts").attributes.get("w:ascii")
-        highlight_color = properties.find_child_or_null("w:highlight").attributes.get("w:val")
-        font_color = properties.find_child_or_null("w:color").attributes.get("w:val")
+            .attributes.get("w:val"))
+        font = _intern(properties.find_child_or_null("w:rFonts").attributes.get("w:ascii"))
+        highlight_color = _intern(properties.find_child_or_null("w:highlight").attributes.get("w:val"))
+        font_color = _intern(properties.find_child_or_null("w:color").attributes.get("w:val"))
 
 
         font_size_string = properties.find_child_or_null("w:sz").attributes.get("w:val")
@@ -108,33 +116,29 @@ def _create_reader(numbering, content_types, relationships, styles, docx_file, f
         is_small_caps = read_boolean_element(properties.find_child("w:smallCaps"))
         highlight = read_highlight_value(properties.find_child_or_null("w:highlight").attributes.get("w:val"))
 
-        def add_complex_field_hyperlink(children):
-            hyperlink_kwargs = current_hyperlink_kwargs()
-            if hyperlink_kwargs is None:
-                return children
-            else:
-                return [documents.hyperlink(children=children, **hyperlink_kwargs)]
-
-        return _ReadResult.map_results(
-            _read_run_style(properties),
-            _read_xml_elements(element.children).map(add_complex_field_hyperlink),
-            lambda style, children: documents.run(
-                children=children,
-                style_id=style[0],
-                style_name=style[1],
-                is_bold=is_bold,
-                is_italic=is_italic,
-                is_underline=is_underline,
-                is_strikethrough=is_strikethrough,
-                is_all_caps=is_all_caps,
-                is_small_caps=is_small_caps,
-                vertical_alignment=vertical_alignment,
-                font=font,
-                font_size=font_size,
-                highlight_color=highlight_color,
-                font_color=font_color,
-                highlight=highlight,
-            ))
+        style_id, style_name = _read_run_style(properties)
+        children = yield element.children
+        hyperlink_kwargs = current_hyperlink_kwargs()
+        if hyperlink_kwargs is not None:
+            children = [documents.hyperlink(children=children, **hyperlink_kwargs)]
+
+        elements.append(documents.run(
+            children=children,
+            style_id=style_id,
+            style_name=style_name,
+            is_bold=is_bold,
+            is_italic=is_italic,
+            is_underline=is_underline,
+            is_strikethrough=is_strikethrough,
+            is_all_caps=is_all_caps,
+            is_small_caps=is_small_caps,
+            vertical_alignment=vertical_alignment,
+            font=font,
+            font_size=font_size,
+            highlight_color=highlight_color,
+            font_color=font_color,
+            highlight=highlight,
+        ))
 
     def _read_run_style(properties):
         return _read_style(properties, "w:rStyle", "Run", styles.find_character_style_by_id)
@@ -157,27 +161,31 @@ def _create_reader(numbering, content_types, relationships, styles, docx_file, f
         else:
             return value
 
-    def paragraph(element):
+    def paragraph(element, elements):
         properties = element.find_child_or_null("w:pPr")
         alignment = properties.find_child_or_null("w:jc").attributes.get("w:val")
         indent = _read_paragraph_indent(properties.find_child_or_null("w:ind"))
         pr_element = properties.find_child_or_null("w:numPr")
 
-        return _ReadResult.map_results(
-            _read_paragraph_style(properties),
-            _read_xml_elements(element.children),
-            lambda style, children: documents.paragraph(
-                children=children,
-                style_id=style[0],
-                style_name=style[1],
-                numbering=_read_numbering_properties(
-                    paragraph_style_id=style[0],
-                    element=pr_element,
-                ),
-                list_id=_read_order_list_id(pr_element),
-                alignment=alignment,
-                indent=indent,
-            )).append_extra()
+        style_id, style_name = _read_paragraph_style(properties)
+        extra = []
+        extra_stack.append(extra)
+        children = yield element.children
+        extra_stack.pop()
+
+        elements.append(documents.paragraph(
+            children=_inline_elements(children),
+            style_id=style_id,
+            style_name=style_name,
+            numbering=_read_numbering_properties(
+                paragraph_style_id=style_id,
+                element=pr_element,
+            ),
+            list_id=_read_order_list_id(pr_element),
+            alignment=alignment,
+            indent=indent,
+        ))
+        elements.extend(extra)
 
     def _read_paragraph_style(properties):
         return _read_style(properties, "w:pStyle", "Paragraph", styles.find_paragraph_style_by_id)
@@ -189,7 +197,7 @@ def _create_reader(numbering, content_types, relationships, styles, docx_file, f
 
         return None
 
-    def read_fld_char(element):
+    def read_fld_char(element, elements):
         fld_char_type = element.attributes.get("w:fldCharType")
         if fld_char_type == "begin":
             complex_field_stack.append(complex_fields.begin(fld_char=element))
@@ -202,7 +210,7 @@ def _create_reader(numbering, content_types, relationships, styles, docx_file, f
                     complex_field = parse_current_instr_text(complex_field)
 
                 if isinstance(complex_field, complex_fields.Checkbox):
-                    return _success(documents.checkbox(checked=complex_field.checked))
+                    elements.append(documents.checkbox(checked=complex_field.checked))
 
         elif fld_char_type == "separate":
             if len(complex_field_stack) > 0:
@@ -212,8 +220,6 @@ def _create_reader(numbering, content_types, relationships, styles, docx_file, f
                 complex_field = complex_fields.unknown
             complex_field_stack.append(complex_field)
 
-        return _empty_result
-
     def parse_current_instr_text(complex_field):
         instr_text = "".join(current_instr_text)
 
@@ -255,15 +261,13 @@ def _create_reader(numbering, content_types, relationships, styles, docx_file, f
 
         return None
 
-    def read_instr_text(element):
+    def read_instr_text(element, elements):
         current_instr_text.append(_inner_text(element))
-        return _empty_result
 
     def _read_style(properties, style_tag_name, style_type, find_style_by_id):
-        messages = []
-        style_id = properties \
+        style_id = _intern(properties \
             .find_child_or_null(style_tag_name) \
-            .attributes.get("w:val")
+            .attributes.get("w:val"))
 
         if style_id is None:
             style_name = None
@@ -271,14 +275,14 @@ def _create_reader(numbering, content_types, relationships, styles, docx_file, f
             style = find_style_by_id(style_id)
             if style is None:
                 style_name = None
-                messages.append(_undefined_style_warning(style_type, style_id))
+                _warn_undefined_style(style_type, style_id)
             else:
                 style_name = style.name
 
-        return _ReadResult([style_id, style_name], [], messages)
+        return style_id, style_name
 
-    def _undefined_style_warning(style_type, style_id):
-        return results.warning("{0} style with ID {1} was referenced but not defined in the document".format(style_type, style_id))
+    def _warn_undefined_style(style_type, style_id):
+        warn("{0} style with ID {1} was referenced but not defined in the document", style_type, style_id)
 
     def _read_numbering_properties(paragraph_style_id, element):
         num_id_element = element.find_child_or_null("w:numId")
@@ -318,73 +322,66 @@ def _create_reader(numbering, content_types, relationships, styles, docx_file, f
             hanging=attributes.get("w:hanging"),
         )
 
-    def tab(element):
-        return _success(documents.tab())
+    def tab(element, elements):
+        elements.append(documents.tab())
 
 
-    def no_break_hyphen(element):
-        return _success(documents.text(unichr(0x2011)))
+    def no_break_hyphen(element, elements):
+        elements.append(documents.text(unichr(0x2011)))
 
 
-    def soft_hyphen(element):
-        return _success(documents.text(u"\u00ad"))
+    def soft_hyphen(element, elements):
+        elements.append(documents.text(u"\u00ad"))
 
-    def symbol(element):
+    def symbol(element, elements):
         # See 17.3.3.30 sym (Symbol Character) of ECMA-376 4th edition Part 1
         font = element.attributes.get("w:font")
         char = element.attributes.get("w:char")
 
+        dingbats = _dingbats()
         unicode_code_point = dingbats.get((font, int(char, 16)))
 
         if unicode_code_point is None and re.match("^F0..", char):
             unicode_code_point = dingbats.get((font, int(char[2:], 16)))
 
         if unicode_code_point is None:
-            warning = results.warning("A w:sym element with an unsupported character was ignored: char {0} in font {1}".format(
-                char,
-                font,
-            ))
-            return _empty_result_with_message(warning)
+            warn("A w:sym element with an unsupported character was ignored: char {0} in font {1}", char, font)
         else:
-            return _success(documents.text(unichr(unicode_code_point)))
+            elements.append(documents.text(unichr(unicode_code_point)))
 
 
-    def table(element):
+    def table(element, elements):
         properties = element.find_child_or_null("w:tblPr")
-        return _ReadResult.map_results(
-            read_table_style(properties),
-            _read_xml_elements(element.children)
-                .flat_map(calculate_row_spans),
-
-            lambda style, children: documents.table(
-                children=children,
-                style_id=style[0],
-                style_name=style[1],
-            ),
-        )
+        style_id, style_name = read_table_style(properties)
+        children = yield element.children
+        elements.append(documents.table(
+            children=calculate_row_spans(children),
+            style_id=style_id,
+            style_name=style_name,
+        ))
 
 
     def read_table_style(properties):
         return _read_style(properties, "w:tblStyle", "Table", styles.find_table_style_by_id)
 
 
-    def table_row(element):
+    def table_row(element, elements):
         properties = element.find_child_or_null("w:trPr")
 
         # See 17.13.5.12 del (Deleted Table Row) of ECMA-376 4th edition Part 1
         is_deleted = bool(properties.find_child("w:del"))
         if is_deleted:
-            return _empty_result
+            return
 
         is_header = bool(properties.find_child("w:tblHeader"))
-        return _read_xml_elements(element.children) \
-            .map(lambda children: documents.table_row(
-                children=children,
-                is_header=is_header,
-            ))
+        children = yield element.children
+        elements.append(documents.table_row(
+            children=children,
+            is_header=is_header,
+        ))
 
 
-    def table_cell(element):
+    def table_cell(element, elements):
         properties = element.find_child_or_null("w:tcPr")
         gridspan = properties \
             .find_child_or_null("w:gridSpan") \
@@ -395,13 +392,13 @@ def _create_reader(numbering, content_types, relationships, styles, docx_file, f
         else:
             colspan = int(gridspan)
 
-        return _read_xml_elements(element.children) \
-            .map(lambda children: documents.table_cell_unmerged(
-                children=children,
-                colspan=colspan,
-                rowspan=1,
-                vmerge=read_vmerge(properties),
-            ))
+        children = yield element.children
+        elements.append(documents.table_cell_unmerged(
+            children=children,
+            colspan=colspan,
+            rowspan=1,
+            vmerge=read_vmerge(properties),
+        ))
 
     def read_vmerge(properties):
         vmerge_element = properties.find_child("w:vMerge")
@@ -418,10 +415,8 @@ def _create_reader(numbering, content_types, relationships, styles, docx_file, f
             for row in rows
         )
         if unexpected_non_rows:
-            rows = remove_unmerged_table_cells(rows)
-            return _elements_result_with_messages(rows, [results.warning(
-                "unexpected non-row element in table, cell merging may be incorrect"
-            )])
+            warn("unexpected non-row element in table, cell merging may be incorrect")
+            return remove_unmerged_table_cells(rows)
 
         unexpected_non_cells = any(
             not isinstance(cell, documents.TableCellUnmerged)
@@ -429,10 +424,8 @@ def _create_reader(numbering, content_types, relationships, styles, docx_file, f
             for cell in row.children
         )
         if unexpected_non_cells:
-            rows = remove_unmerged_table_cells(rows)
-            return _elements_result_with_messages(rows, [results.warning(
-                "unexpected non-cell element in table row, cell merging may be incorrect"
-            )])
+            warn("unexpected non-cell element in table row, cell merging may be incorrect")
+            return remove_unmerged_table_cells(rows)
 
         columns = {}
         for row in rows:
@@ -456,7 +449,7 @@ def _create_reader(numbering, content_types, relationships, styles, docx_file, f
                 if not cell.vmerge
             ]
 
-        return _success(rows)
+        return rows
 
 
     def remove_unmerged_table_cells(rows):
@@ -473,22 +466,23 @@ def _create_reader(numbering, content_types, relationships, styles, docx_file, f
         ))
 
 
-    def read_child_elements(element):
-        return _read_xml_elements(element.children)
+    def read_child_elements(element, elements):
+        elements.extend((yield element.children))
 
 
-    def pict(element):
-        return read_child_elements(element).to_extra()
+    def pict(element, elements):
+        extra = extra_stack[-1]
+        extra.extend((yield element.children))
 
 
-    def hyperlink(element):
+    def hyperlink(element, elements):
         relationship_id = element.attributes.get("r:id")
         anchor = element.attributes.get("w:anchor")
         target_frame = element.attributes.get("w:tgtFrame") or None
-        children_result = _read_xml_elements(element.children)
+        children = _inline_elements((yield element.children))
 
         def create(**kwargs):
-            return children_result.map(lambda children: documents.hyperlink(
+            elements.append(documents.hyperlink(
                 children=children,
                 target_frame=target_frame,
                 **kwargs
@@ -499,36 +493,33 @@ def _create_reader(numbering, content_types, relationships, styles, docx_file, f
             if anchor is not None:
                 href = replace_fragment(href, anchor)
 
-            return create(href=href)
+            create(href=href)
         elif anchor is not None:
-            return create(anchor=anchor)
+            create(anchor=anchor)
         else:
-            return children_result
+            elements.extend(children)
 
 
-    def bookmark_start(element):
+    def bookmark_start(element, elements):
         name = element.attributes.get("w:name")
-        if name == "_GoBack":
-            return _empty_result
-        else:
-            return _success(documents.bookmark(name))
+        if name != "_GoBack":
+            elements.append(documents.bookmark(name))
 
 
-    def break_(element):
+    def break_(element, elements):
         break_type = element.attributes.get("w:type")
 
         if not break_type or break_type == "textWrapping":
-            return _success(documents.line_break)
+            elements.append(documents.line_break)
         elif break_type == "page":
-            return _success(documents.page_break)
+            elements.append(documents.page_break)
         elif break_type == "column":
-            return _success(documents.column_break)
+            elements.append(documents.column_break)
         else:
-            warning = results.warning("Unsupported break type: {0}".format(break_type))
-            return _empty_result_with_message(warning)
+            warn("Unsupported break type: {0}", break_type)
 
 
-    def inline(element):
+    def inline(element, elements):
         properties_element = element.find_child_or_null("wp:docPr")
 
         properties = properties_element.attributes
@@ -567,49 +558,41 @@ def _create_reader(numbering, content_types, relationships, styles, docx_file, f
             any(getattr(child, "name", None) == "a:ln" for child in shape_props.children)
         )
 
-        return _read_blips(blips, alt_text, size, has_border, href)
+        for blip in blips:
+            _read_blip(blip, elements, alt_text, size, has_border, href)
 
     def _emu_to_pixel(emu):
         return int(round(float(emu) / EMU_PER_PIXEL))
 
-    def _read_blips(blips, alt_text, size, has_border, href=None):
-        return _ReadResult.concat(lists.map(
-            lambda blip: _read_blip(blip, alt_text, size, has_border, href),
-            blips
-        ))
-
-    def _read_blip(element, alt_text, size, has_border, href=None):
-        return _read_image(lambda: _find_blip_image(element), alt_text, size, has_border, href)
-
-    def _read_image(find_image, alt_text, size=None, has_border=False, href=None):
-        find_result = find_image()
+    def _read_blip(element, elements, alt_text, size, has_border, href=None):
+        find_result = _find_blip_image(element)
 
         if find_result is None:
-            warning = results.warning("Could not find image file for a:blip element")
-            return _empty_result_with_message(warning)
+            warn("Could not find image file for a:blip element")
         else:
-            image_path, open_image = find_result
+            image_path, open_image, info = find_result
             content_type = content_types.find_content_type(image_path)
-            image = documents.image(alt_text=alt_text, content_type=content_type, size=size, open=open_image)
+            image = documents.image(
+                alt_text=alt_text,
+                content_type=content_type,
+                size=size,
+                open=open_image,
+                path=image_path,
+                info=info,
+            )
             if image.attributes is None:
                 image.attributes = {}
 
             if has_border:
                 image.attributes["class"] = "fr-bordered"
 
-            if content_type in ["image/png", "image/gif", "image/jpeg", "image/svg+xml", "image/tiff"]:
-                messages = []
-            else:
-                messages = [results.warning("Image of type {0} is unlikely to display in web browsers".format(content_type))]
+            if content_type not in ["image/png", "image/gif", "image/jpeg", "image/svg+xml", "image/tiff"]:
+                warn("Image of type {0} is unlikely to display in web browsers", content_type)
 
-            result = _element_result_with_messages(image, messages)
             if href is None:
-                return result
+                elements.append(image)
             else:
-                return result.map(lambda image_elements: documents.hyperlink(
-                    image_elements,
-                    href=href,
-                ))
+                elements.append(documents.hyperlink([image], href=href))
 
     def _find_blip_image(element):
         embed_relationship_id = element.attributes.get("r:embed")
@@ -632,7 +615,14 @@ def _create_reader(numbering, content_types, relationships, styles, docx_file, f
             else:
                 return contextlib.closing(image_file)
 
-        return image_path, open_image
+        # Reading the entry's metadata never decompresses the image, so
+        # converters that only need sizes or a reference stay cheap.
+        info = documents.ImageInfo(
+            read_zip_info=lambda: docx_file.info(image_path),
+            open=open_image,
+        )
+
+        return image_path, open_image, info
 
 
     def _find_linked_image(relationship_id):
@@ -641,15 +631,16 @@ def _create_reader(numbering, content_types, relationships, styles, docx_file, f
         def open_image():
             return files.open(image_path)
 
-        return image_path, open_image
+        return image_path, open_image, None
 
-    def shape(element):
+    def shape(element, elements):
         if len(element.children) == 1:
             imagedata = element.find_child("v:imagedata")
             if imagedata:
                 size = _read_shape_size(element)
-                return read_imagedata(imagedata, size)
-        return read_child_elements(element)
+                read_imagedata(imagedata, elements, size)
+                return
+        yield from read_child_elements(element, elements)
 
     def _read_shape_size(element):
         style_attribute = element.attributes.get("style")
@@ -666,40 +657,42 @@ def _create_reader(numbering, content_types, relationships, styles, docx_file, f
         raw_size = next(iter(filter(lambda s: s.startswith(with_column), style)))
         return raw_size.replace(with_column, "")
 
-    def read_imagedata(element, style=None):
+    def read_imagedata(element, elements, style=None):
         relationship_id = element.attributes.get("r:id")
         if relationship_id is None:
-            warning = results.warning("A v:imagedata element without a relationship ID was ignored")
-            return _empty_result_with_message(warning)
+            warn("A v:imagedata element without a relationship ID was ignored")
+            return
         
         title = element.attributes.get("o:title")
         attrs = dict(element.attributes or {})
         
-        image_path, open_image = _find_embedded_image(relationship_id)
+        image_path, open_image, info = _find_embedded_image(relationship_id)
         
         image = documents.Image(
             alt_text=title,
             content_type="image/png",
             open=open_image,
             size=style,
-            attributes=attrs
+            attributes=attrs,
+            path=image_path,
+            info=info,
         )
             
-        return _success([image])
+        elements.append(image)
     def note_reference_reader(note_type):
-        def note_reference(element):
-            return _success(documents.note_reference(note_type, element.attributes["w:id"]))
+        def note_reference(element, elements):
+            elements.append(documents.note_reference(note_type, element.attributes["w:id"]))
 
         return note_reference
 
-    def read_comment_reference(element):
-        return _success(documents.comment_reference(element.attributes["w:id"]))
+    def read_comment_reference(element, elements):
+        elements.append(documents.comment_reference(element.attributes["w:id"]))
 
-    def alternate_content(element):
-        return read_child_elements(element.find_child_or_null("mc:Fallback"))
+    def alternate_content(element, elements):
+        return read_child_elements(element.find_child_or_null("mc:Fallback"), elements)
 
-    def read_sdt(element):
-        content_result = read_child_elements(element.find_child_or_null("w:sdtContent"))
+    def read_sdt(element, elements):
+        content = yield element.find_child_or_null("w:sdtContent").children
 
         def handle_content(content):
             # From the WordML standard: https://learn.microsoft.com/en-us/openspecs/office_standards/ms-docx/3350cb64-931f-41f7-8824-f18b2568ce66
@@ -739,9 +732,9 @@ def _create_reader(numbering, content_types, relationships, styles, docx_file, f
             if has_checkbox:
                 return replaced_content
             else:
-                return document_checkbox
+                return [document_checkbox]
 
-        return content_result.map(handle_content)
+        elements.extend(handle_content(content))
 
     handlers = {
         "w:t": text,
@@ -780,99 +773,151 @@ def _create_reader(numbering, content_types, relationships, styles, docx_file, f
         "w:sdt": read_sdt
     }
 
-    def read(element):
-        handler = handlers.get(element.name)
-        if handler is None:
-            if element.name not in _ignored_elements:
-                warning = results.warning("An unrecognised element was ignored: {0}".format(element.name))
-                return _empty_result_with_message(warning)
+    def _read_xml_elements(nodes):
+        elements = []
+        _read_xml_elements_into(nodes, elements)
+        return elements
+
+    def _inline_elements(elements):
+        if coalesce_runs:
+            return _coalesce_runs(elements)
+        else:
+            return elements
+
+    def _read_xml_elements_into(nodes, elements):
+        # Handlers that read the children of an element are generators that
+        # yield the child nodes, and are sent the elements read from them.
+        # The handlers are suspended on an explicit stack rather than
+        # recursing, so that deeply nested documents can't exceed the
+        # recursion limit. Elements that are only read for their children,
+        # such as w:ins and text boxes, are read directly into the elements
+        # of their parent.
+        stack = [(iter(nodes), elements, None)]
+        while stack:
+            nodes, elements, reading = stack[-1]
+            for node in nodes:
+                if isinstance(node, XmlElement):
+                    handler = handlers.get(node.name)
+                    if handler is read_child_elements:
+                        stack.append((iter(node.children), elements, None))
+                        break
+                    elif handler is not None:
+                        child_reading = handler(node, elements)
+                        if child_reading is not None:
+                            child_nodes = next(child_reading, None)
+                            if child_nodes is not None:
+                                stack.append((iter(child_nodes), [], child_reading))
+                                break
+                    elif node.name not in _ignored_elements:
+                        warn("An unrecognised element was ignored: {0}", node.name)
             else:
-                return _empty_result
+                stack.pop()
+                if reading is not None:
+                    try:
+                        child_nodes = reading.send(elements)
+                    except StopIteration:
+                        pass
+                    else:
+                        stack.append((iter(child_nodes), [], reading))
+
+    def read_all(nodes):
+        nonlocal message_sink
+        previous_message_sink = message_sink
+        message_sink = results.MessageSink()
+        # Extra elements outside of any paragraph are discarded
+        extra_stack_depth = len(extra_stack)
+        extra_stack.append([])
+        try:
+            elements = _read_xml_elements(nodes)
+            return results.Result(elements, message_sink.messages)
+        finally:
+            del extra_stack[extra_stack_depth:]
+            message_sink = previous_message_sink
+
+    return read_all
+
+
+def _intern(value):
+    # Each attribute value read from the XML is a separate string, so values
+    # that are repeated across many elements, such as style IDs and fonts,
+    # are interned so that elements share a single copy.
+    if value is None:
+        return None
+    else:
+        return sys.intern(value)
+
+
+def _coalesce_runs(elements):
+    # Word often splits text with the same formatting across several runs,
+    # for instance to record revisions or spelling errors. Adjacent runs
+    # with the same properties are combined into a single run, with adjacent
+    # text combined into a single text element.
+    coalesced = []
+    merged_run = None
+    for element in elements:
+        if (
+            type(element) is documents.Run and
+            coalesced and
+            type(coalesced[-1]) is documents.Run and
+            _run_properties(coalesced[-1]) == _run_properties(element)
+        ):
+            if coalesced[-1] is not merged_run:
+                merged_run = coalesced[-1] = coalesced[-1].copy(children=list(coalesced[-1].children))
+            _append_run_children(merged_run.children, element.children)
         else:
-            return handler(element)
+            coalesced.append(element)
 
+    return coalesced
 
-    def _read_xml_elements(nodes):
-        elements = filter(lambda node: isinstance(node, XmlElement), nodes)
-        return _ReadResult.concat(lists.map(read, elements))
 
-    return _read_xml_elements
+def _append_run_children(children, new_children):
+    for child in new_children:
+        if type(child) is documents.Text and children and type(children[-1]) is documents.Text:
+            children[-1] = documents.Text(children[-1].value + child.value)
+        else:
+            children.append(child)
+
+
+def _run_properties(run):
+    return (
+        run.style_id,
+        run.style_name,
+        run.is_bold,
+        run.is_italic,
+        run.is_underline,
+        run.is_strikethrough,
+        run.is_all_caps,
+        run.is_small_caps,
+        run.vertical_alignment,
+        run.font,
+        run.font_size,
+        run.highlight_color,
+        run.font_color,
+        run.highlight,
+    )
 
 
 def _inner_text(node):
     if node.node_type == node_types.text:
         return node.value
-    else:
-        return "".join(_inner_text(child) for child in node.children)
 
+    text = []
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node.node_type == node_types.text:
+            text.append(node.value)
+        else:
+            stack.extend(reversed(node.children))
+    return "".join(text)
 
 
-class _ReadResult(object):
-    @staticmethod
-    def concat(results):
-        return _ReadResult(
-            lists.flat_map(lambda result: result.elements, results),
-            lists.flat_map(lambda result: result.extra, results),
-            lists.flat_map(lambda result: result.messages, results))
-
-
-    @staticmethod
-    def map_results(first, second, func):
-        return _ReadResult(
-            [func(first.elements, second.elements)],
-            first.extra + second.extra,
-            first.messages + second.messages)
-
-    def __init__(self, elements, extra, messages):
-        self.elements = elements
-        self.extra = extra
-        self.messages = messages
-
-    def map(self, func):
-        elements = func(self.elements)
-        if not isinstance(elements, list):
-            elements = [elements]
-        return _ReadResult(
-            elements,
-            self.extra,
-            self.messages)
-
-    def flat_map(self, func):
-        result = func(self.elements)
-        return _ReadResult(
-            result.elements,
-            self.extra + result.extra,
-            self.messages + result.messages)
-
-
-    def to_extra(self):
-        return _ReadResult([], _concat(self.extra, self.elements), self.messages)
-
-    def append_extra(self):
-        return _ReadResult(_concat(self.elements, self.extra), [], self.messages)
-
-def _success(elements):
-    if not isinstance(elements, list):
-        elements = [elements]
-    return _ReadResult(elements, [], [])
-
-def _element_result_with_messages(element, messages):
-    return _elements_result_with_messages([element], messages)
-
-def _elements_result_with_messages(elements, messages):
-    return _ReadResult(elements, [], messages)
-
-_empty_result = _ReadResult([], [], [])
-
-def _empty_result_with_message(message):
-    return _ReadResult([], [], [message])
 
-def _concat(*values):
-    result = []
-    for value in values:
-        for element in value:
-            result.append(element)
-    return result
+def _dingbats():
+    # The table of dingbats is large and rarely needed, so it's only loaded
+    # once a document uses a symbol.
+    from .dingbats import dingbats
+    return dingbats
 
 
 def _is_int(value):
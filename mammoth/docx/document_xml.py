@@ -1,11 +1,12 @@
-from .. import documents
+from .. import documents, results
 
 
 def read_document_xml_element(
         element,
         body_reader,
         notes=None,
-        comments=None):
+        comments=None,
+        max_blocks=None):
 
     if notes is None:
         notes = []
@@ -18,9 +19,34 @@ def read_document_xml_element(
     else:
         children = body_element.children
 
-    return body_reader.read_all(children) \
+    if max_blocks is None:
+        children_result = body_reader.read_all(children)
+    else:
+        children_result = _read_blocks(body_reader, children, max_blocks)
+
+    return children_result \
         .map(lambda children: documents.document(
             children,
             notes=documents.notes(notes),
             comments=comments
         ))
+
+
+def _read_blocks(body_reader, children, max_blocks):
+    # Read one block more than the limit so that we know whether the
+    # document was actually truncated, then ignore the rest of the body.
+    blocks = []
+    messages = []
+    for child in children:
+        if len(blocks) > max_blocks:
+            break
+        result = body_reader.read_all([child])
+        blocks += result.value
+        messages += result.messages
+
+    if len(blocks) > max_blocks:
+        messages.append(results.warning(
+            "Document was truncated to the first {0} blocks".format(max_blocks)
+        ))
+
+    return results.Result(blocks[:max_blocks], messages)
@@ -116,8 +116,20 @@ class Numbering(object):
         )
         self._nums = nums
         self._styles = styles
+        self._levels = {}
 
     def find_level(self, num_id, level):
+        if not self._nums:
+            return None
+
+        key = (num_id, level)
+        if key in self._levels:
+            return self._levels[key]
+        else:
+            abstract_num_level = self._levels[key] = self._find_level(num_id, level)
+            return abstract_num_level
+
+    def _find_level(self, num_id, level):
         num = self._nums.get(num_id)
         if num is None:
             return None
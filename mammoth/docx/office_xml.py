@@ -1,4 +1,3 @@
-from ..lists import flat_map
 from .xmlparser import parse_xml, XmlElement
 
 
@@ -35,11 +34,25 @@ def read(fileobj):
 
 
 def _collapse_alternate_content(node):
-    if isinstance(node, XmlElement):
-        if node.name == "mc:AlternateContent":
-            return node.find_child_or_null("mc:Fallback").children
-        else:
-            node.children = flat_map(_collapse_alternate_content, node.children)
-            return [node]
-    else:
-        return [node]
+    # Each list of children is collapsed in place, using an explicit stack
+    # rather than recursion so that deeply nested documents can't exceed the
+    # recursion limit.
+    nodes = [node]
+    pending = [nodes]
+    while pending:
+        children = pending.pop()
+        collapsed_children = []
+        remaining = list(reversed(children))
+        while remaining:
+            child = remaining.pop()
+            if isinstance(child, XmlElement):
+                if child.name == "mc:AlternateContent":
+                    remaining.extend(reversed(child.find_child_or_null("mc:Fallback").children))
+                else:
+                    collapsed_children.append(child)
+                    pending.append(child.children)
+            else:
+                collapsed_children.append(child)
+        children[:] = collapsed_children
+
+    return nodes
@@ -10,12 +10,23 @@ _content_types_path = "[Content_Types].xml"
 
 
 def write_style_map(fileobj, style_map):
+    _write_encoded_style_map(fileobj, style_map.encode("utf8"))
+
+
+def write_style_map_to_paths(paths, style_map):
+    encoded_style_map = style_map.encode("utf8")
+    for path in paths:
+        with open(path, "r+b") as fileobj:
+            _write_encoded_style_map(fileobj, encoded_style_map)
+
+
+def _write_encoded_style_map(fileobj, encoded_style_map):
     with open_zip(fileobj, "r") as zip_file:
         relationships_xml = _generate_relationships_xml(zip_file.read_str(_relationships_path))
         content_types_xml = _generate_content_types_xml(zip_file.read_str(_content_types_path))
     
     update_zip(fileobj, {
-        _style_map_path: style_map.encode("utf8"),
+        _style_map_path: encoded_style_map,
         _relationships_path: relationships_xml,
         _content_types_path: content_types_xml,
     })
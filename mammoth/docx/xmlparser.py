@@ -83,13 +83,23 @@ def parse_xml(fileobj, namespace_mapping=None):
 
     document = xml.dom.minidom.parse(fileobj)
 
-    def convert_node(node):
-        if node.nodeType == xml.dom.Node.ELEMENT_NODE:
-            return convert_element(node)
-        elif node.nodeType == xml.dom.Node.TEXT_NODE:
-            return XmlText(node.nodeValue)
-        else:
-            return None
+    # The tree is converted using an explicit stack, rather than recursively,
+    # so that deeply nested documents can't exceed the recursion limit.
+    def convert_tree(root):
+        converted_root = convert_element(root)
+        stack = [(root, converted_root)]
+        while stack:
+            element, converted_element = stack.pop()
+            converted_children = converted_element.children
+            for child_node in element.childNodes:
+                if child_node.nodeType == xml.dom.Node.ELEMENT_NODE:
+                    converted_child = convert_element(child_node)
+                    converted_children.append(converted_child)
+                    stack.append((child_node, converted_child))
+                elif child_node.nodeType == xml.dom.Node.TEXT_NODE:
+                    converted_children.append(XmlText(child_node.nodeValue))
+
+        return converted_root
 
     def convert_element(element):
         converted_name = convert_name(element)
@@ -100,13 +110,7 @@ def parse_xml(fileobj, namespace_mapping=None):
             if attribute.namespaceURI != "http://www.w3.org/2000/xmlns/"
         )
 
-        converted_children = []
-        for child_node in element.childNodes:
-            converted_child_node = convert_node(child_node)
-            if converted_child_node is not None:
-                converted_children.append(converted_child_node)
-
-        return XmlElement(converted_name, converted_attributes, converted_children)
+        return XmlElement(converted_name, converted_attributes, [])
 
     def convert_name(node):
         if node.namespaceURI is None:
@@ -118,4 +122,4 @@ def parse_xml(fileobj, namespace_mapping=None):
             else:
                 return "%s:%s" % (prefix, node.localName)
 
-    return convert_node(document.documentElement)
+    return convert_tree(document.documentElement)
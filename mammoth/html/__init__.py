@@ -1,5 +1,6 @@
-from ..lists import flat_map
-from .nodes import TextNode, Tag, Element, ForceWrite, NodeVisitor
+import operator
+
+from .nodes import TextNode, Tag, Element, ForceWrite
 
 
 def text(value):
@@ -29,114 +30,245 @@ def collapsible_element(tag_names, attributes=None, children=None):
 force_write = ForceWrite()
 
 
-def strip_empty(nodes):
-    return flat_map(_strip_empty_node, nodes)
+# The HTML tree is walked using explicit stacks rather than recursion so
+# that deeply nested documents can't exceed the recursion limit.
 
 
-def _strip_empty_node(node):
-    return StripEmpty().visit(node)
+def strip_empty(nodes):
+    stripped = []
+    stack = [(None, iter(nodes), stripped)]
+    while stack:
+        element, children, stripped_children = stack[-1]
+        for node in children:
+            if isinstance(node, Element):
+                stack.append((node, iter(node.children), []))
+                break
+            elif isinstance(node, TextNode):
+                if node.value:
+                    stripped_children.append(node)
+            else:
+                stripped_children.append(node)
+        else:
+            stack.pop()
+            if element is not None and (stripped_children or element.is_void()):
+                stack[-1][2].append(_with_children(element, stripped_children))
 
+    return stripped
 
-class StripEmpty(NodeVisitor):
-    def visit_text_node(self, node):
-        if node.value:
-            return [node]
-        else:
-            return []
-    
-    def visit_element(self, element):
-        children = strip_empty(element.children)
-        if len(children) == 0 and not element.is_void():
-            return []
-        else:
-            return [Element(element.tag, children, element.extra_attributes)]
-    
-    def visit_force_write(self, node):
-        return [node]
+
+def _with_children(element, children):
+    # Most elements are unchanged by normalisation, so the element is only
+    # copied if its children have changed.
+    if len(children) == len(element.children) and all(map(operator.is_, children, element.children)):
+        return element
+    else:
+        return Element(element.tag, children, element.extra_attributes)
 
 
 def collapse(nodes):
     collapsed = []
-    
-    for node in nodes:
-        _collapsing_add(collapsed, node)
-    
+    # Elements that are reused from the original tree are copied before any
+    # nodes are collapsed into them, so that the original tree is unchanged.
+    copied_ids = set()
+    stack = [(None, iter(nodes), collapsed)]
+    while stack:
+        element, children, collapsed_children = stack[-1]
+        for node in children:
+            if isinstance(node, Element):
+                stack.append((node, iter(node.children), []))
+                break
+            else:
+                _collapsing_add(collapsed_children, node, copied_ids)
+        else:
+            stack.pop()
+            if element is not None:
+                collapsed_element = _with_children(element, collapsed_children)
+                if collapsed_element is not element:
+                    copied_ids.add(id(collapsed_element))
+                _collapsing_add(stack[-1][2], collapsed_element, copied_ids)
+
     return collapsed
 
-class _CollapseNode(NodeVisitor):
-    def visit_text_node(self, node):
-        return node
-    
-    def visit_element(self, element):
-        return Element(element.tag, collapse(element.children), element.extra_attributes)
-    
-    def visit_force_write(self, node):
-        return node
-    
-_collapse_node = _CollapseNode().visit
-
-
-def _collapsing_add(collapsed, node):
-    collapsed_node = _collapse_node(node)
-    if not _try_collapse(collapsed, collapsed_node):
-        collapsed.append(collapsed_node)
-    
-def _try_collapse(collapsed, node):
+
+def _collapsing_add(collapsed, node, copied_ids):
+    # Adds an already collapsed node. When the node is collapsed into the
+    # previous node, its children are added to the children of the previous
+    # node, and may in turn be collapsed.
+    stack = [(collapsed, iter([node]))]
+    while stack:
+        collapsed, nodes = stack[-1]
+        for node in nodes:
+            if _can_collapse(collapsed, node):
+                last = collapsed[-1]
+                if id(last) not in copied_ids:
+                    last = collapsed[-1] = Element(last.tag, list(last.children), last.extra_attributes)
+                    copied_ids.add(id(last))
+                if node.separator:
+                    last.children.append(text(node.separator))
+                stack.append((last.children, iter(node.children)))
+                break
+            else:
+                collapsed.append(node)
+        else:
+            stack.pop()
+
+
+def _can_collapse(collapsed, node):
     if not collapsed:
         return False
 
     last = collapsed[-1]
     if not isinstance(last, Element) or not isinstance(node, Element):
         return False
-    
+
     if not node.collapsible:
         return False
-        
-    if not _is_match(last, node):
-        return False
-    
-    if node.separator:
-        last.children.append(text(node.separator))
-    
-    for child in node.children:
-        _collapsing_add(last.children, child)
-        
-    return True
+
+    return _is_match(last, node)
+
 
 def _is_match(first, second):
     return first.tag_name in second.tag_names and first.attributes == second.attributes
 
 
 def write(writer, nodes):
-    visitor = _NodeWriter(writer)
-    visitor.visit_all(nodes)
-        
+    stack = [(None, iter(nodes))]
+    while stack:
+        tag_name, children = stack[-1]
+        for node in children:
+            if isinstance(node, Element):
+                attributes = _write_attributes(node)
+                if node.is_void():
+                    writer.self_closing(node.tag_name, attributes)
+                else:
+                    writer.start(node.tag_name, attributes)
+                    stack.append((node.tag_name, iter(node.children)))
+                    break
+            elif isinstance(node, TextNode):
+                writer.text(node.value)
+        else:
+            stack.pop()
+            if tag_name is not None:
+                writer.end(tag_name)
 
-class _NodeWriter(NodeVisitor):
+
+def _write_attributes(element):
+    if element.extra_attributes is None:
+        return element.attributes
+    else:
+        attributes = element.attributes.copy()
+        attributes.update(element.extra_attributes)
+        return attributes
+
+
+class IncrementalWriter(object):
+    # Strips, collapses and writes nodes as they're added, giving the same
+    # output as doing so for all of the nodes at once. Later nodes can only
+    # be collapsed into the last node at each level of the tree, so all
+    # other nodes are written straight away. Only the end tags of the open
+    # elements along the last path are delayed.
     def __init__(self, writer):
         self._writer = writer
-    
-    def visit_text_node(self, node):
-        self._writer.text(node.value)
-    
-    def visit_element(self, element):
-      
-        if element.extra_attributes is not None:
-            attrs = element.attributes.copy()
-            attrs.update( element.extra_attributes )
-        else:
-            attrs = element.attributes
+        self._nodes = []
+        self._copied_ids = set()
+        # The state of the root and of each open element along the last
+        # path. The open element below each level is the child at the index
+        # of the number of children written so far at that level.
+        self._open = [_OpenElement()]
 
-        if element.is_void():
-            self._writer.self_closing(element.tag_name, attrs)
-        else:
-            self._writer.start(element.tag_name, attrs)
-            self.visit_all(element.children)
-            self._writer.end(element.tag_name)
-    
-    def visit_force_write(self, element):
-        pass
-    
-    def visit_all(self, nodes):
-        for node in nodes:
-            self.visit(node)
+    def add(self, nodes):
+        for node in strip_empty(nodes):
+            for collapsed_node in collapse([node]):
+                _collapsing_add(self._nodes, collapsed_node, self._copied_ids)
+
+        self._write_closed_nodes()
+
+    def finish(self):
+        if len(self._open) > 1:
+            self._close_open_path(self._nodes, 0)
+        write(self._writer, self._nodes[self._open[0].written:])
+        self._nodes = []
+        self._copied_ids = set()
+        self._open = [_OpenElement()]
+
+    def write_unstarted(self, writer):
+        # The last open element along the last path isn't written until it
+        # has children or is closed, since an element without children may
+        # be written as a self-closing element. Writing it separately allows
+        # the size of the output so far to be measured.
+        children = self._nodes
+        element = None
+        for depth in range(1, len(self._open)):
+            element = children[self._open[depth - 1].written]
+            children = element.children
+
+        if element is not None and not self._open[-1].is_started:
+            write(writer, [element])
+
+    def _write_closed_nodes(self):
+        depth = 0
+        children = self._nodes
+        while True:
+            state = self._open[depth]
+            last_index = len(children) - 1
+            if state.written < last_index:
+                if depth + 1 < len(self._open):
+                    self._close_open_path(children, depth)
+                write(self._writer, children[state.written:last_index])
+                state.written = last_index
+
+            if state.written != last_index:
+                break
+
+            last = children[last_index]
+            if not isinstance(last, Element):
+                write(self._writer, [last])
+                state.written += 1
+                break
+
+            if depth + 1 == len(self._open):
+                self._open.append(_OpenElement())
+            child_state = self._open[depth + 1]
+            if last.children and not child_state.is_started:
+                self._writer.start(last.tag_name, _write_attributes(last))
+                child_state.is_started = True
+
+            children = last.children
+            depth += 1
+
+        # Nodes that have been written at the top level are discarded. Copies
+        # made while collapsing may have been discarded with them, so their
+        # IDs are forgotten before they can be reused.
+        root = self._open[0]
+        if root.written > 0:
+            del self._nodes[:root.written]
+            root.written = 0
+            self._copied_ids.clear()
+
+    def _close_open_path(self, children, depth):
+        # Writes the rest of the open element below the given level, and of
+        # every open element below that.
+        path = []
+        for child_depth in range(depth + 1, len(self._open)):
+            element = children[self._open[child_depth - 1].written]
+            path.append((element, self._open[child_depth]))
+            children = element.children
+
+        has_open_child = False
+        for element, state in reversed(path):
+            if state.is_started:
+                written = state.written + 1 if has_open_child else state.written
+                write(self._writer, element.children[written:])
+                self._writer.end(element.tag_name)
+            else:
+                write(self._writer, [element])
+            has_open_child = True
+
+        del self._open[depth + 1:]
+        self._open[depth].written += 1
+
+
+class _OpenElement(object):
+    def __init__(self):
+        self.written = 0
+        self.is_started = False
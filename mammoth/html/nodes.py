@@ -1,17 +1,25 @@
 import cobble
 
+from ..slots import slotted
+
 
 class Node(object):
-    pass
+    __slots__ = ()
 
 
+@slotted
 @cobble.data
 class TextNode(Node):
+    __slots__ = ()
+
     value = cobble.field()
 
 
+@slotted
 @cobble.data
 class Tag(object):
+    __slots__ = ()
+
     tag_names = cobble.field()
     attributes = cobble.field()
     collapsible = cobble.field()
@@ -30,8 +38,11 @@ class Tag(object):
         return Tag(tag_names=self.tag_names, attributes=cloned_attrs, collapsible=self.collapsible, separator=self.separator)
 
 
+@slotted
 @cobble.data
 class Element(Node):
+    __slots__ = ()
+
     tag = cobble.field()
     children = cobble.field()
     extra_attributes = cobble.field(default=None)
@@ -65,7 +76,7 @@ class Element(Node):
 
 @cobble.visitable
 class ForceWrite(Node):
-    pass
+    __slots__ = ()
 
 
 NodeVisitor = cobble.visitor(Node)
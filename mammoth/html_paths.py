@@ -30,12 +30,12 @@ class HtmlPath(object):
     elements = cobble.field()
 
     def wrap(self, generate_nodes, extra_attributes={}):
-        nodes = generate_nodes()
+        return self.wrap_nodes(generate_nodes(), extra_attributes)
 
+    def wrap_nodes(self, nodes, extra_attributes={}):
         for element in reversed(self.elements):
             nodes = element.wrap_nodes(nodes, extra_attributes)
 
-
         return nodes
 
 
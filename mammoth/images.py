@@ -29,3 +29,17 @@ def data_uri(image):
     return {
         "src": "data:{0};base64,{1}".format(image.content_type, encoded_src)
     }
+
+
+def reference(prefix=""):
+    @img_element
+    def convert_image(image):
+        if image.path is None:
+            return {}
+        elif image.info is None:
+            # Linked images already refer to a location outside of the docx
+            return {"src": image.path}
+        else:
+            return {"src": prefix + image.path}
+
+    return convert_image
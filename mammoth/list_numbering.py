@@ -0,0 +1,68 @@
+# Each list keeps a stack of (level, count) pairs in ascending order of level,
+# so moving to a shallower level discards the counters of deeper levels
+# without scanning every counter.
+class ListCounters(object):
+    def __init__(self):
+        self._stacks = {}
+
+    def next(self, list_id, level_index, start_num):
+        level = int(level_index)
+        stack = self._stacks.get(list_id)
+        if stack is None:
+            stack = self._stacks[list_id] = []
+
+        # Counters are only valid for list items under the same parent, so
+        # when the parent changes, counters for nested items are reset.
+        while stack and stack[-1][0] > level:
+            stack.pop()
+
+        if stack and stack[-1][0] == level:
+            count = stack[-1][1] + 1
+            stack[-1] = (level, count)
+        else:
+            count = _start_count(start_num)
+            stack.append((level, count))
+
+        return count
+
+
+def _start_count(start_num):
+    if start_num is not None and start_num != "1":
+        return int(start_num)
+    else:
+        return 1
+
+
+def list_type(numbering_level):
+    key = (numbering_level.numbering_format, numbering_level.level_text)
+    result = _list_types.get(key)
+    if result is None:
+        result = _list_types[key] = _read_list_type(*key)
+    return result
+
+
+_list_types = {}
+
+
+def _read_list_type(numbering_format, level_text):
+    if numbering_format == "bullet":
+        if level_text == "o":
+            return "ul", "circle"
+        else:
+            bullet_char = ":".join("{:02x}".format(ord(c)) for c in level_text or "")
+            return "ul", _bullet_types.get(bullet_char)
+    else:
+        return "ol", _ordered_types.get(numbering_format)
+
+
+_ordered_types = {
+    "lowerLetter": "a",
+    "upperLetter": "A",
+    "lowerRoman": "i",
+    "upperRoman": "I",
+}
+
+_bullet_types = {
+    "f0a7": "square",
+    "f0b7": "disc",
+}
@@ -1,5 +1,8 @@
+import functools
+
+from .styles import Style
 from .styles.parser import read_style_mapping
-from . import lists, results
+from . import documents, document_matchers, html_paths, lists, results
 
 
 def read_options(options):
@@ -24,9 +27,21 @@ def read_options(options):
 
 
 def _read_style_map(style_text):
+    # Each call returns new lists, so that changing one result can't change
+    # the style map used by later conversions.
+    style_map, messages = _parse_style_map(style_text)
+    return results.Result(list(style_map), list(messages))
+
+
+# Parsed style maps are cached so that repeated conversions with the same
+# custom or embedded style map, such as in a long running worker, only
+# parse it once.
+@functools.lru_cache(maxsize=32)
+def _parse_style_map(style_text):
     lines = filter(None, map(_get_line, style_text.split("\n")))
-    return results.combine(lists.map(read_style_mapping, lines)) \
+    result = results.combine(lists.map(read_style_mapping, lines)) \
         .map(lambda style_mappings: lists.filter(None, style_mappings))
+    return tuple(result.value), tuple(result.messages)
 
 
 def _get_line(line):
@@ -37,65 +52,96 @@ def _get_line(line):
         return line
 
 
-_default_style_map_result = _read_style_map("""
-p.Heading1 => h1:fresh
-p.Heading2 => h2:fresh
-p.Heading3 => h3:fresh
-p.Heading4 => h4:fresh
-p.Heading5 => h5:fresh
-p.Heading6 => h6:fresh
-p[style-name='Heading 1'] => h1:fresh
-p[style-name='Heading 2'] => h2:fresh
-p[style-name='Heading 3'] => h3:fresh
-p[style-name='Heading 4'] => h4:fresh
-p[style-name='Heading 5'] => h5:fresh
-p[style-name='Heading 6'] => h6:fresh
-p[style-name='heading 1'] => h1:fresh
-p[style-name='heading 2'] => h2:fresh
-p[style-name='heading 3'] => h3:fresh
-p[style-name='heading 4'] => h4:fresh
-p[style-name='heading 5'] => h5:fresh
-p[style-name='heading 6'] => h6:fresh
-
-# Apple Pages
-p.Heading => h1:fresh
-p[style-name='Heading'] => h1:fresh
-
-r[style-name='Strong'] => strong
-
-p[style-name='footnote text'] => p:fresh
-r[style-name='footnote reference'] =>
-p[style-name='endnote text'] => p:fresh
-r[style-name='endnote reference'] =>
-p[style-name='annotation text'] => p:fresh
-r[style-name='annotation reference'] =>
-
-# LibreOffice
-p[style-name='Footnote'] => p:fresh
-r[style-name='Footnote anchor'] =>
-p[style-name='Endnote'] => p:fresh
-r[style-name='Endnote anchor'] =>
-
-p:unordered-list(1) => ul > li:fresh
-p:unordered-list(2) => ul|ol > li > ul > li:fresh
-p:unordered-list(3) => ul|ol > li > ul|ol > li > ul > li:fresh
-p:unordered-list(4) => ul|ol > li > ul|ol > li > ul|ol > li > ul > li:fresh
-p:unordered-list(5) => ul|ol > li > ul|ol > li > ul|ol > li > ul|ol > li > ul > li:fresh
-p:ordered-list(1) => ol > li:fresh
-p:ordered-list(2) => ul|ol > li > ol > li:fresh
-p:ordered-list(3) => ul|ol > li > ul|ol > li > ol > li:fresh
-p:ordered-list(4) => ul|ol > li > ul|ol > li > ul|ol > li > ol > li:fresh
-p:ordered-list(5) => ul|ol > li > ul|ol > li > ul|ol > li > ul|ol > li > ol > li:fresh
-
-r[style-name='Hyperlink'] =>
-
-p[style-name='Normal'] => p:fresh
-
-# Apple Pages
-p.Body => p:fresh
-p[style-name='Body'] => p:fresh
-""")
-
-
-assert not _default_style_map_result.messages
-_default_style_map = _default_style_map_result.value
+# The default style map is built directly rather than parsed from its
+# textual form, so that using it doesn't require tokenising and parsing
+# dozens of style mappings. Each mapping is shown in its textual form.
+
+def _paragraph(style_id=None, style_name=None, numbering=None):
+    if style_name is not None:
+        style_name = document_matchers.equal_to(style_name)
+    return document_matchers.paragraph(style_id=style_id, style_name=style_name, numbering=numbering)
+
+
+def _run(style_name):
+    return document_matchers.run(style_name=document_matchers.equal_to(style_name))
+
+
+def _path(*tag_names, fresh=False):
+    elements = [
+        html_paths.element(names)
+        for names in tag_names[:-1]
+    ]
+    elements.append(html_paths.element(tag_names[-1], fresh=fresh))
+    return html_paths.path(elements)
+
+
+def _list_path(level_index, is_ordered):
+    # For instance, p:ordered-list(3) => ul|ol > li > ul|ol > li > ol > li:fresh
+    tag_names = [["ul", "ol"], ["li"]] * level_index
+    tag_names.append(["ol"] if is_ordered else ["ul"])
+    tag_names.append(["li"])
+    return _path(*tag_names, fresh=True)
+
+
+def _create_default_style_map():
+    style_map = []
+
+    def add(document_matcher, html_path):
+        style_map.append(Style(document_matcher, html_path))
+
+    # p.Heading1 => h1:fresh
+    for level in range(1, 7):
+        add(_paragraph(style_id="Heading{0}".format(level)), _path(["h{0}".format(level)], fresh=True))
+    # p[style-name='Heading 1'] => h1:fresh
+    for level in range(1, 7):
+        add(_paragraph(style_name="Heading {0}".format(level)), _path(["h{0}".format(level)], fresh=True))
+    # p[style-name='heading 1'] => h1:fresh
+    for level in range(1, 7):
+        add(_paragraph(style_name="heading {0}".format(level)), _path(["h{0}".format(level)], fresh=True))
+
+    # Apple Pages
+    # p.Heading => h1:fresh
+    add(_paragraph(style_id="Heading"), _path(["h1"], fresh=True))
+    # p[style-name='Heading'] => h1:fresh
+    add(_paragraph(style_name="Heading"), _path(["h1"], fresh=True))
+
+    # r[style-name='Strong'] => strong
+    add(_run("Strong"), _path(["strong"]))
+
+    # p[style-name='footnote text'] => p:fresh
+    # r[style-name='footnote reference'] =>
+    for note_type in ["footnote", "endnote", "annotation"]:
+        add(_paragraph(style_name="{0} text".format(note_type)), _path(["p"], fresh=True))
+        add(_run("{0} reference".format(note_type)), html_paths.empty)
+
+    # LibreOffice
+    # p[style-name='Footnote'] => p:fresh
+    # r[style-name='Footnote anchor'] =>
+    for note_type in ["Footnote", "Endnote"]:
+        add(_paragraph(style_name=note_type), _path(["p"], fresh=True))
+        add(_run("{0} anchor".format(note_type)), html_paths.empty)
+
+    # p:unordered-list(1) => ul > li:fresh
+    for is_ordered in [False, True]:
+        for level_index in range(0, 5):
+            add(
+                _paragraph(numbering=documents.numbering_level(level_index, is_ordered=is_ordered)),
+                _list_path(level_index, is_ordered=is_ordered),
+            )
+
+    # r[style-name='Hyperlink'] =>
+    add(_run("Hyperlink"), html_paths.empty)
+
+    # p[style-name='Normal'] => p:fresh
+    add(_paragraph(style_name="Normal"), _path(["p"], fresh=True))
+
+    # Apple Pages
+    # p.Body => p:fresh
+    add(_paragraph(style_id="Body"), _path(["p"], fresh=True))
+    # p[style-name='Body'] => p:fresh
+    add(_paragraph(style_name="Body"), _path(["p"], fresh=True))
+
+    return style_map
+
+
+_default_style_map = _create_default_style_map()
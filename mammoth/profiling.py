@@ -0,0 +1,68 @@
+import collections
+import contextlib
+import sys
+import time
+
+
+Phase = collections.namedtuple("Phase", ["name", "calls", "seconds", "allocated_blocks"])
+
+
+class Profiler(object):
+    def __init__(self):
+        self._phases = {}
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        # Phases are stored in the order they start so that nested phases
+        # are listed after the phase that contains them.
+        stats = self._phases.get(name)
+        if stats is None:
+            stats = self._phases[name] = [0, 0.0, 0]
+
+        start_blocks = _allocated_blocks()
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            stats[0] += 1
+            stats[1] += time.perf_counter() - start_time
+            stats[2] += _allocated_blocks() - start_blocks
+
+    @property
+    def phases(self):
+        return [
+            Phase(name=name, calls=calls, seconds=seconds, allocated_blocks=allocated_blocks)
+            for name, (calls, seconds, allocated_blocks) in self._phases.items()
+        ]
+
+
+def _allocated_blocks():
+    # Not all implementations track allocated blocks, in which case this
+    # always returns zero.
+    get_allocated_blocks = getattr(sys, "getallocatedblocks", None)
+    if get_allocated_blocks is None:
+        return 0
+    else:
+        return get_allocated_blocks()
+
+
+class _NullProfiler(object):
+    _null_phase = contextlib.nullcontext()
+
+    def phase(self, name):
+        return self._null_phase
+
+
+null_profiler = _NullProfiler()
+
+
+def format_phases(phases):
+    lines = ["{0:<48} {1:>8} {2:>12} {3:>14}".format("phase", "calls", "time (ms)", "net blocks")]
+    for phase in phases:
+        lines.append("{0:<48} {1:>8} {2:>12.3f} {3:>14}".format(
+            phase.name,
+            phase.calls,
+            phase.seconds * 1000,
+            phase.allocated_blocks,
+        ))
+    return "\n".join(lines)
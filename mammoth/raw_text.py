@@ -1,14 +1,25 @@
 from . import documents
 
 
+_paragraph_end = object()
+
+
 def extract_raw_text_from_element(element):
-    if isinstance(element, documents.Text):
-        return element.value
-    elif isinstance(element, documents.Tab):
-        return "\t"
-    else:
-        text = "".join(map(extract_raw_text_from_element, getattr(element, "children", [])))
-        if isinstance(element, documents.Paragraph):
-            return text + "\n\n"
+    # An explicit stack is used rather than recursion so that deeply nested
+    # documents can't exceed the recursion limit.
+    text = []
+    stack = [element]
+    while stack:
+        element = stack.pop()
+        if element is _paragraph_end:
+            text.append("\n\n")
+        elif isinstance(element, documents.Text):
+            text.append(element.value)
+        elif isinstance(element, documents.Tab):
+            text.append("\t")
         else:
-            return text
+            if isinstance(element, documents.Paragraph):
+                stack.append(_paragraph_end)
+            stack.extend(reversed(getattr(element, "children", [])))
+
+    return "".join(text)
@@ -13,7 +13,13 @@ class Result(object):
     
     def bind(self, func):
         result = func(self.value)
-        return Result(result.value, self.messages + result.messages)
+        if not result.messages:
+            messages = self.messages
+        elif not self.messages:
+            messages = result.messages
+        else:
+            messages = self.messages + result.messages
+        return Result(result.value, messages)
 
 
 Message = collections.namedtuple("Message", ["type", "message"])
@@ -23,6 +29,42 @@ def warning(message):
     return Message("warning", message)
 
 
+class MessageSink(object):
+    def __init__(self, on_message=None):
+        self._on_message = on_message
+        self._formatted = {}
+        self._counts = {}
+
+    def add(self, message):
+        count = self._counts.get(message)
+        if count is None:
+            self._counts[message] = 1
+            if self._on_message is not None:
+                self._on_message(message)
+        else:
+            self._counts[message] = count + 1
+
+    def extend(self, messages):
+        for message in messages:
+            self.add(message)
+
+    def warning(self, template, *args):
+        # Formatting is deferred until a warning is first seen, so repeating
+        # the same warning only costs a dictionary lookup.
+        key = (template, args)
+        message = self._formatted.get(key)
+        if message is None:
+            message = self._formatted[key] = warning(template.format(*args))
+        self.add(message)
+
+    @property
+    def messages(self):
+        return list(self._counts)
+
+    def counts(self):
+        return list(self._counts.items())
+
+
 def success(value):
     return Result(value, [])
 
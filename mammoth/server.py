@@ -0,0 +1,463 @@
+import argparse
+import bisect
+import contextlib
+import http.server
+import importlib
+import io
+import json
+import multiprocessing
+import os
+import signal
+import threading
+import time
+import urllib.parse
+import xml.parsers.expat
+import zipfile
+import zlib
+
+import mammoth
+from . import options
+
+
+def create_server(
+    address=("127.0.0.1", 8000),
+    style_maps=None,
+    workers=None,
+    max_request_size=None,
+    timeout=None,
+    max_jobs_per_worker=None,
+):
+    if style_maps is None:
+        style_maps = {}
+
+    if workers is None:
+        if hasattr(os, "fork"):
+            workers = os.cpu_count() or 1
+        else:
+            workers = 0
+
+    if max_request_size is None:
+        max_request_size = 32 * 1024 * 1024
+
+    if timeout is None:
+        timeout = 30
+
+    _preload(style_maps)
+
+    return _Server(
+        address=address,
+        style_maps=style_maps,
+        workers=workers,
+        max_request_size=max_request_size,
+        timeout=timeout,
+        max_jobs_per_worker=max_jobs_per_worker,
+    )
+
+
+_preloaded_modules = [".conversion", ".docx", ".docx.dingbats", ".writers"]
+
+
+def _preload(style_maps):
+    # Everything that's shared between requests is loaded before forking so
+    # that workers start warm, and share the memory copy-on-write.
+    for module_name in _preloaded_modules:
+        importlib.import_module(module_name, __package__)
+
+    for style_map in style_maps.values():
+        options._parse_style_map(style_map)
+
+
+class _Server(object):
+    def __init__(self, address, style_maps, workers, max_request_size, timeout, max_jobs_per_worker):
+        self._workers = workers
+        self._max_jobs_per_worker = max_jobs_per_worker
+        self._worker_pids = set()
+        self._is_shutting_down = False
+        self._metrics = _Metrics()
+        self._http_server = _HttpServer(
+            address,
+            _RequestHandler,
+            style_maps=style_maps,
+            max_request_size=max_request_size,
+            timeout=timeout,
+            metrics=self._metrics,
+            workers=workers,
+        )
+
+    @property
+    def server_address(self):
+        return self._http_server.server_address
+
+    def serve_forever(self):
+        try:
+            if self._workers == 0:
+                self._http_server.serve_forever()
+            else:
+                self._supervise_workers()
+        finally:
+            self._http_server.server_close()
+
+    def shutdown(self):
+        self._is_shutting_down = True
+        if self._workers == 0:
+            self._http_server.shutdown()
+        else:
+            self._stop_workers()
+
+    def _supervise_workers(self):
+        try:
+            while not self._is_shutting_down:
+                while len(self._worker_pids) < self._workers:
+                    self._fork_worker()
+
+                pid, status = os.wait()
+                self._worker_pids.discard(pid)
+        finally:
+            self._stop_workers()
+
+    def _fork_worker(self):
+        # Signals are blocked while forking so that a signal can't arrive
+        # before the worker has reset its signal handlers, or before the
+        # server has recorded the worker's pid.
+        signal.pthread_sigmask(signal.SIG_BLOCK, _shutdown_signals)
+        try:
+            pid = os.fork()
+            if pid == 0:
+                exit_code = 1
+                try:
+                    for signum in _shutdown_signals:
+                        signal.signal(signum, signal.SIG_DFL)
+                    signal.pthread_sigmask(signal.SIG_UNBLOCK, _shutdown_signals)
+                    self._run_worker()
+                    exit_code = 0
+                finally:
+                    os._exit(exit_code)
+            else:
+                self._worker_pids.add(pid)
+        finally:
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, _shutdown_signals)
+
+    def _run_worker(self):
+        # Workers are recycled after a number of jobs so that any memory
+        # growth in a worker is bounded.
+        jobs = 0
+        while self._max_jobs_per_worker is None or jobs < self._max_jobs_per_worker:
+            self._http_server.handle_request()
+            jobs += 1
+
+    def _stop_workers(self):
+        for pid in list(self._worker_pids):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass
+
+        for pid in list(self._worker_pids):
+            try:
+                os.waitpid(pid, 0)
+            except OSError:
+                pass
+            self._worker_pids.discard(pid)
+
+
+_shutdown_signals = (signal.SIGINT, signal.SIGTERM)
+
+
+class _HttpServer(http.server.HTTPServer):
+    def __init__(self, address, handler_class, style_maps, max_request_size, timeout, metrics, workers):
+        self.style_maps = style_maps
+        self.max_request_size = max_request_size
+        self.request_timeout = timeout
+        self.metrics = metrics
+        self.workers = workers
+        http.server.HTTPServer.__init__(self, address, handler_class)
+
+
+class _RequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.0"
+
+    def setup(self):
+        self.timeout = self.server.request_timeout
+        http.server.BaseHTTPRequestHandler.setup(self)
+
+    def do_GET(self):
+        if urllib.parse.urlsplit(self.path).path == "/metrics":
+            self._send_json(200, self.server.metrics.summary(workers=self.server.workers))
+        else:
+            self._send_error(404, "Not found")
+
+    def do_POST(self):
+        url = urllib.parse.urlsplit(self.path)
+        if url.path != "/convert":
+            self._send_error(404, "Not found")
+            return
+
+        start_time = time.perf_counter()
+        status, response = self._convert(urllib.parse.parse_qs(url.query))
+        self.server.metrics.record(
+            status=status,
+            seconds=time.perf_counter() - start_time,
+        )
+        self._send_json(status, response)
+
+    def _convert(self, query):
+        content_length = self.headers.get("Content-Length")
+        if content_length is None:
+            return 411, {"error": "Content-Length is required"}
+
+        try:
+            content_length = int(content_length)
+        except ValueError:
+            return 400, {"error": "Invalid Content-Length"}
+
+        if content_length > self.server.max_request_size:
+            self.close_connection = True
+            return 413, {"error": "Request body is larger than {0} bytes".format(self.server.max_request_size)}
+
+        output_format = _query_value(query, "output_format", "html")
+        if output_format not in ("html", "markdown"):
+            return 400, {"error": "Unknown output format: {0}".format(output_format)}
+
+        style_map_name = _query_value(query, "style_map", None)
+        if style_map_name is None:
+            style_map = None
+        elif style_map_name in self.server.style_maps:
+            style_map = self.server.style_maps[style_map_name]
+        else:
+            return 400, {"error": "Unknown style map: {0}".format(style_map_name)}
+
+        try:
+            with _time_limit(self.server.request_timeout):
+                body = self.rfile.read(content_length)
+                cache_info = options._parse_style_map.cache_info()
+                result = mammoth.convert(
+                    io.BytesIO(body),
+                    style_map=style_map,
+                    output_format=output_format,
+                )
+        except _Timeout:
+            self.close_connection = True
+            return 504, {"error": "Conversion took longer than {0} seconds".format(self.server.request_timeout)}
+        except _invalid_document_errors as error:
+            return 400, {"error": "{0}: {1}".format(type(error).__name__, error)}
+        except Exception as error:
+            return 500, {"error": "{0}: {1}".format(type(error).__name__, error)}
+
+        self.server.metrics.record_style_map_cache(cache_info, options._parse_style_map.cache_info())
+
+        return 200, {
+            "value": result.value,
+            "messages": [
+                {"type": message.type, "message": message.message}
+                for message in result.messages
+            ],
+        }
+
+    def _send_error(self, status, message):
+        self._send_json(status, {"error": message})
+
+    def _send_json(self, status, value):
+        body = json.dumps(value).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+# Errors raised when the uploaded document isn't a valid .docx file, such
+# as when it isn't a zip file, a part is missing (reading the main document
+# part raises an IOError, and other parts a KeyError), or a part isn't
+# well-formed XML.
+_invalid_document_errors = (
+    zipfile.BadZipFile,
+    zlib.error,
+    KeyError,
+    IOError,
+    xml.parsers.expat.ExpatError,
+)
+
+
+def _query_value(query, name, default):
+    values = query.get(name)
+    if values:
+        return values[-1]
+    else:
+        return default
+
+
+class _Timeout(Exception):
+    pass
+
+
+@contextlib.contextmanager
+def _time_limit(seconds):
+    # Conversions can only be interrupted by a signal in the main thread,
+    # which is where requests are handled by forked workers.
+    if not hasattr(signal, "setitimer") or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def handle_alarm(signum, frame):
+        raise _Timeout()
+
+    previous_handler = signal.signal(signal.SIGALRM, handle_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+# Upper bounds of the latency histogram, from 1ms doubling up to about 9
+# minutes. Latencies above the last bound fall into an overflow bucket.
+_latency_bounds = [0.001 * 2 ** index for index in range(20)]
+
+_counter_names = [
+    "requests",
+    "client_errors",
+    "server_errors",
+    "style_map_cache_hits",
+    "style_map_cache_misses",
+]
+
+
+class _Metrics(object):
+    # Metrics are kept in shared memory allocated before forking, so that
+    # any worker can report on the requests handled by all workers.
+    def __init__(self):
+        self._started_at = time.time()
+        self._counters = multiprocessing.Array("q", len(_counter_names))
+        self._latency_buckets = multiprocessing.Array("q", len(_latency_bounds) + 1)
+
+    def record(self, status, seconds):
+        with self._counters.get_lock():
+            self._counters[_counter_names.index("requests")] += 1
+            if 400 <= status < 500:
+                self._counters[_counter_names.index("client_errors")] += 1
+            elif status >= 500:
+                self._counters[_counter_names.index("server_errors")] += 1
+
+        with self._latency_buckets.get_lock():
+            self._latency_buckets[bisect.bisect_left(_latency_bounds, seconds)] += 1
+
+    def record_style_map_cache(self, before, after):
+        with self._counters.get_lock():
+            self._counters[_counter_names.index("style_map_cache_hits")] += after.hits - before.hits
+            self._counters[_counter_names.index("style_map_cache_misses")] += after.misses - before.misses
+
+    def summary(self, workers):
+        with self._counters.get_lock():
+            counters = dict(zip(_counter_names, self._counters))
+        with self._latency_buckets.get_lock():
+            latency_buckets = list(self._latency_buckets)
+
+        uptime = time.time() - self._started_at
+        style_map_cache_lookups = counters["style_map_cache_hits"] + counters["style_map_cache_misses"]
+
+        return {
+            "workers": workers,
+            "uptime_seconds": uptime,
+            "requests": counters["requests"],
+            "client_errors": counters["client_errors"],
+            "server_errors": counters["server_errors"],
+            "requests_per_second": counters["requests"] / uptime if uptime > 0 else 0,
+            "latency_seconds": {
+                "p50": _percentile(latency_buckets, 0.5),
+                "p90": _percentile(latency_buckets, 0.9),
+                "p99": _percentile(latency_buckets, 0.99),
+            },
+            "style_map_cache": {
+                "hits": counters["style_map_cache_hits"],
+                "misses": counters["style_map_cache_misses"],
+                "hit_rate": (
+                    counters["style_map_cache_hits"] / style_map_cache_lookups
+                    if style_map_cache_lookups else None
+                ),
+            },
+        }
+
+
+def _percentile(latency_buckets, fraction):
+    total = sum(latency_buckets)
+    if total == 0:
+        return None
+
+    cumulative = 0
+    for index, count in enumerate(latency_buckets):
+        cumulative += count
+        if cumulative >= fraction * total:
+            if index < len(_latency_bounds):
+                return _latency_bounds[index]
+            else:
+                return float("inf")
+
+
+def main():
+    args = _parse_args()
+
+    style_maps = {}
+    for style_map_arg in args.style_map:
+        name, _, path = style_map_arg.partition("=")
+        with open(path) as style_map_fileobj:
+            style_maps[name] = style_map_fileobj.read()
+
+    server = create_server(
+        address=(args.host, args.port),
+        style_maps=style_maps,
+        workers=args.workers,
+        max_request_size=args.max_request_size,
+        timeout=args.timeout,
+        max_jobs_per_worker=args.max_jobs_per_worker,
+    )
+
+    def handle_signal(signum, frame):
+        raise KeyboardInterrupt()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+
+    host, port = server.server_address[:2]
+    print("Serving on http://{0}:{1}".format(host, port), flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(
+        description="Serve conversions of .docx files over HTTP.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of worker processes to fork. Use 0 to handle requests in the server process.")
+    parser.add_argument(
+        "--style-map",
+        action="append",
+        default=[],
+        metavar="NAME=PATH",
+        help="Style map that can be selected by name using the style_map query parameter. Can be repeated.")
+    parser.add_argument(
+        "--max-request-size",
+        type=int,
+        help="Maximum size of an uploaded document in bytes.")
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        help="Maximum time in seconds to read and convert a document.")
+    parser.add_argument(
+        "--max-jobs-per-worker",
+        type=int,
+        help="Number of requests each worker handles before it is replaced.")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
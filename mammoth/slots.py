@@ -0,0 +1,17 @@
+def slotted(cls):
+    # Documents and HTML trees can contain hundreds of thousands of nodes,
+    # so fields are stored in slots rather than a __dict__ for each node.
+    # Slots can't be declared in the same class as cobble's fields, so
+    # they're declared by a subclass that inherits the methods generated by
+    # cobble. Each class in the hierarchy must declare __slots__ for
+    # instances to have no __dict__.
+    slots = tuple(
+        name
+        for name, field in cls._cobble_fields
+        if not any(name in getattr(base, "__slots__", ()) for base in cls.__mro__)
+    )
+    return type(cls)(cls.__name__, (cls, ), {
+        "__slots__": slots,
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+    })
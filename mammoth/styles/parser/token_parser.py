@@ -22,6 +22,8 @@ _ESCAPE_SEQUENCE_REGEX = re.compile(r"\\(.)")
 
 
 def decode_escape_sequences(value):
+    if "\\" not in value:
+        return value
     return _ESCAPE_SEQUENCE_REGEX.sub(_decode_escape_sequence, value)
     
     
@@ -17,42 +17,47 @@ class TokenType(object):
 
 
 def regex_tokeniser(rules):
-    rules = [(token_type, _to_regex(regex)) for token_type, regex in rules]
-    rules.append(("unknown", re.compile(".")))
-    
-    def tokenise(value):
-        tokens = []
-        index = 0
-        while index < len(value):
-            for token_type, regex in rules:
-                match = regex.match(value, index)
-                if match is not None:
-                    tokens.append(Token(index, token_type, match.group(0)))
-                    index = match.end()
-                    break
-            else:
-                # Should be impossible
-                raise Exception("Remaining: " + value[index:])
-
-        tokens.append(Token(index, TokenType.END, ""))
+    # Python tries the alternatives of a regex in order, so a single regex
+    # gives the same tokens as trying each rule in turn at each position.
+    # The final alternative matches any character, so every character of
+    # the value is part of some token.
+    rules = list(rules) + [("unknown", "(?s:.)")]
+    regex = re.compile("|".join(
+        "(?P<t{0}>{1})".format(index, _to_pattern(rule_regex))
+        for index, (token_type, rule_regex) in enumerate(rules)
+    ))
+    group_token_types = dict(
+        ("t{0}".format(index), token_type)
+        for index, (token_type, rule_regex) in enumerate(rules)
+    )
 
+    def tokenise(value):
+        tokens = [
+            _new_token(Token, (match.start(), group_token_types[match.lastgroup], match.group()))
+            for match in regex.finditer(value)
+        ]
+        tokens.append(Token(len(value), TokenType.END, ""))
         return tokens
 
     return tokenise
-    
 
-def _to_regex(value):
-    if hasattr(value, "match"):
-        return value
+
+# Creating tokens directly with tuple.__new__ skips the argument handling
+# of the namedtuple constructor, which dominates the cost of tokenising.
+_new_token = tuple.__new__
+
+
+def _to_pattern(value):
+    if hasattr(value, "pattern"):
+        return value.pattern
     else:
-        return re.compile(value)
+        return value
 
 
 _string_prefix = r"'(?:\\.|[^'])*"
-_identifier_character = r"(?:[a-zA-Z\-_]|\\.)"
 
 tokenise = regex_tokeniser([
-    (TokenType.IDENTIFIER, _identifier_character + "(?:" + _identifier_character + "|[0-9])*"),
+    (TokenType.IDENTIFIER, r"(?:[a-zA-Z\-_]|\\.)[a-zA-Z0-9\-_]*(?:\\.[a-zA-Z0-9\-_]*)*"),
     (TokenType.SYMBOL, r":|>|=>|\^=|=|\(|\)|\[|\]|\||!|\."),
     (TokenType.WHITESPACE, r"\s+"),
     (TokenType.STRING, _string_prefix + "'"),
@@ -1,3 +1,5 @@
+import operator
+
 from . import documents
 
 
@@ -10,24 +12,195 @@ def run(transform_run):
 
 
 def element_of_type(element_type, transform):
-    def transform_element(element):
-        if isinstance(element, element_type):
-            return transform(element)
-        else:
-            return element
-
-    return _each_element(transform_element)
+    return _ElementTransform(element_type, transform)
 
 
 def _each_element(transform_element):
-    def transform_element_and_children(element):
-        if isinstance(element, (documents.HasChildren, documents.TableCellUnmerged)):
-            children = list(map(transform_element_and_children, element.children))
-            element = element.copy(children=children)
+    return _ElementTransform(object, transform_element)
+
+
+class _ElementTransform(object):
+    def __init__(self, element_type, transform):
+        self.element_type = element_type
+        self.transform = transform
+
+    def __call__(self, element):
+        element_type = self.element_type
+        transform = self.transform
+
+        def transform_element(element, children):
+            # Elements are only copied when one of their children has
+            # changed, so that unchanged subtrees are shared with the
+            # original document.
+            if children is not None and any(map(operator.is_not, children, element.children)):
+                element = element.copy(children=children)
+
+            if isinstance(element, element_type):
+                return transform(element)
+            else:
+                return element
+
+        return _transform_tree(element, transform_element)
+
+
+def _transform_tree(root, transform_element):
+    # Calls transform_element on each element after its children, passing
+    # the results for its children (or None if the element can't have
+    # children). An explicit stack is used rather than recursion so that
+    # deeply nested documents can't exceed the recursion limit.
+    if not _has_children(root):
+        return transform_element(root, None)
+
+    stack = [(root, iter(root.children), [])]
+    while True:
+        element, children, results = stack[-1]
+        for child in children:
+            if _has_children(child):
+                stack.append((child, iter(child.children), []))
+                break
+            else:
+                results.append(transform_element(child, None))
+        else:
+            stack.pop()
+            result = transform_element(element, results)
+            if stack:
+                stack[-1][2].append(result)
+            else:
+                return result
+
+
+def _has_children(element):
+    return isinstance(element, (documents.HasChildren, documents.TableCellUnmerged))
+
+
+def compose(*transforms):
+    # Consecutive element transforms are applied together in a single
+    # traversal of the document. Any other transforms are applied to the
+    # whole document in turn.
+    steps = []
+    for transform in transforms:
+        if isinstance(transform, _ElementTransform):
+            if steps and isinstance(steps[-1], list):
+                steps[-1].append(transform)
+            else:
+                steps.append([transform])
+        else:
+            steps.append(transform)
+
+    def transform_document(document):
+        for step in steps:
+            if isinstance(step, list):
+                document = _apply_element_transforms(step, document)
+            else:
+                document = step(document)
+        return document
+
+    return transform_document
+
+
+def _apply_element_transforms(element_transforms, root):
+    if len(element_transforms) == 1:
+        return element_transforms[0](root)
+
+    # Applying the transforms in a single traversal must give the same result
+    # as applying each transform to the whole document in turn. Since each
+    # transform sees the element after the earlier transforms have been
+    # applied to that element and its descendants, but before the later
+    # ones, each element's history is tracked as a list of (stage, element)
+    # pairs, where the stage is the number of transforms that have been
+    # applied. Most elements are never changed, so have a single entry.
+    def history_of(element, start):
+        return _transform_tree(
+            element,
+            lambda element, child_histories: history_from(element, start, child_histories),
+        )
+
+    def history_from(element, start, child_histories):
+        history = [(start, element)]
+        matches, matches_end = matches_for_type(type(element))
+
+        if child_histories is not None:
+            child_change_stages = _change_stages(child_histories)
+            if child_change_stages:
+                end = max(matches_end, max(child_change_stages))
+            else:
+                end = matches_end
+        elif matches_end <= start:
+            return history
+        else:
+            child_change_stages = ()
+            end = matches_end
+
+        current = element
+        index = start
+        while index < end:
+            stage = index + 1
+
+            if stage in child_change_stages:
+                current = current.copy(children=[
+                    _element_at_stage(child_history, stage)
+                    for child_history in child_histories
+                ])
+
+            if matches[index]:
+                result = element_transforms[index].transform(current)
+                if result is not current:
+                    if not _has_children(result):
+                        child_histories = None
+                        child_change_stages = ()
+                    elif not (_has_children(current) and _is_same_children(result.children, current.children)):
+                        # The transform has introduced new children, which
+                        # the remaining transforms still need to be applied to.
+                        child_histories = [history_of(child, stage) for child in result.children]
+                        child_change_stages = _change_stages(child_histories)
+                    current = result
+                    matches, matches_end = matches_for_type(type(current))
+                    end = max(matches_end, max(child_change_stages, default=0))
+
+            if current is not history[-1][1]:
+                history.append((stage, current))
+
+            index = stage
+
+        return history
+
+    # For each type of element, which transforms apply to it, and the number
+    # of transforms up to and including the last one that applies.
+    matches_by_type = {}
+
+    def matches_for_type(element_type):
+        try:
+            return matches_by_type[element_type]
+        except KeyError:
+            matches = [
+                issubclass(element_type, element_transform.element_type)
+                for element_transform in element_transforms
+            ]
+            matches_end = max((index + 1 for index, match in enumerate(matches) if match), default=0)
+            matches_by_type[element_type] = matches, matches_end
+            return matches, matches_end
+
+    return history_of(root, 0)[-1][1]
+
+
+def _change_stages(histories):
+    stages = ()
+    for history in histories:
+        if len(history) > 1:
+            if not stages:
+                stages = set()
+            stages.update(stage for stage, element in history[1:])
+    return stages
+
+
+def _element_at_stage(history, stage):
+    for history_stage, element in reversed(history):
+        if history_stage <= stage:
+            return element
 
-        return transform_element(element)
 
-    return transform_element_and_children
+def _is_same_children(first, second):
+    return len(first) == len(second) and all(map(operator.is_, first, second))
 
 
 def get_descendants_of_type(element, element_type):
@@ -38,19 +211,7 @@ def get_descendants_of_type(element, element_type):
 
 
 def get_descendants(element):
-    descendants = []
-
-    def visit(element):
-        descendants.append(element)
-
-    _visit_descendants(element, visit)
-
-    return descendants
-
-
-def _visit_descendants(element, visit):
     if isinstance(element, documents.HasChildren):
-        for child in element.children:
-            _visit_descendants(child, visit)
-            visit(child)
-
+        return documents._descendants(element)
+    else:
+        return []
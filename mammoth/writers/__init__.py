@@ -2,11 +2,11 @@ from .html import HtmlWriter
 from .markdown import MarkdownWriter
 
 
-def writer(output_format=None):
+def writer(output_format=None, stream=None):
     if output_format is None:
         output_format = "html"
     
-    return _writers[output_format]()
+    return _writers[output_format](stream)
 
 
 def formats():
@@ -1,36 +1,67 @@
 from __future__ import unicode_literals
-from xml.sax.saxutils import escape
+import io
+import re
 
 from .abc import Writer
 
 
 class HtmlWriter(Writer):
-    def __init__(self):
-        self._fragments = []
-    
+    def __init__(self, stream=None):
+        self._owns_stream = stream is None
+        if stream is None:
+            stream = io.StringIO()
+        self._buffer = stream
+        self._start_tags = {}
+        self._self_closing_tags = {}
+
     def text(self, text):
-        self._fragments.append(_escape_html(text))
-    
+        self._buffer.write(_escape_html(text))
+
     def start(self, name, attributes=None):
-        attribute_string = _generate_attribute_string(attributes)
-        self._fragments.append("<{0}{1}>".format(name, attribute_string))
+        self._buffer.write(_render_tag(self._start_tags, "<{0}{1}>", name, attributes))
 
     def end(self, name):
-        self._fragments.append("</{0}>".format(name))
-    
+        self._buffer.write("</{0}>".format(name))
+
     def self_closing(self, name, attributes=None):
-        attribute_string = _generate_attribute_string(attributes)
-        self._fragments.append("<{0}{1} />".format(name, attribute_string))
-    
+        self._buffer.write(_render_tag(self._self_closing_tags, "<{0}{1} />", name, attributes))
+
     def append(self, html):
-        self._fragments.append(html)
-    
+        self._buffer.write(html)
+
     def as_string(self):
-        return "".join(self._fragments)
+        if not self._owns_stream:
+            raise ValueError("as_string() can't be used when writing to a stream passed to the writer")
+        return self._buffer.getvalue()
+
+
+def _render_tag(cache, template, name, attributes):
+    # Most elements come from the style map and share the same few sets of
+    # attributes, so each distinct tag is only rendered once per writer.
+    if attributes:
+        key = (name, tuple(attributes.items()))
+    else:
+        key = name
+
+    try:
+        return cache[key]
+    except KeyError:
+        rendered = cache[key] = template.format(name, _generate_attribute_string(attributes))
+        return rendered
+
+
+_special_characters_pattern = re.compile('[&<>"]')
 
 
 def _escape_html(text):
-    return escape(text, {'"': "&quot;"})
+    if _special_characters_pattern.search(text) is None:
+        return text
+    else:
+        return text \
+            .replace("&", "&amp;") \
+            .replace("<", "&lt;") \
+            .replace(">", "&gt;") \
+            .replace('"', "&quot;")
 
 
 def _generate_attribute_string(attributes):
@@ -2,36 +2,20 @@ from __future__ import unicode_literals
 
 from .abc import Writer
 
+import io
 import re
 
 
-class _WriterOutput(object):
-    def __init__(self, start, end=None, generate_end=None, anchor_position=None):
-        if generate_end is None:
-            generate_end = _constant(end)
-        
-        self.start = start
-        self.generate_end = generate_end
-        self.anchor_position = anchor_position
-
-
-def _constant(value):
-    def get():
-        return value
-    
-    return get
-
-
 class _MarkdownState(object):
     def __init__(self):
         self._list_state_stack = []
         self.list_state = None
         self.list_item_has_closed = False
-    
+
     def update_list_state(self, list_state):
         self._list_state_stack.append(self.list_state)
         self.list_state = list_state
-    
+
     def pop_list_state(self):
         self.list_state = self._list_state_stack.pop()
 
@@ -43,161 +27,162 @@ class _MarkdownListState(object):
         self.indentation = indentation
 
 
-def _symmetric_wrapped(end):
-    return _Wrapped(end, end)
+# Each element is written according to its kind, and pushes a kind of end
+# onto the element stack along with any text for that end.
+_wrapped = "wrapped"
+_hyperlink = "hyperlink"
+_image = "image"
+_ordered_list = "ordered_list"
+_unordered_list = "unordered_list"
+_list_item = "list_item"
 
+_text_end = "text_end"
+_list_end = "list_end"
+_list_item_end = "list_item_end"
 
-class _Wrapped(object):
-    def __init__(self, start, end):
-        self._start = start
-        self._end = end
-    
-    def __call__(self, attributes, markdown_state):
-        return _WriterOutput(self._start, self._end)
 
+def _init_wrapped():
+    wrapped = {
+        "p": ("", "\n\n"),
+        "br": ("", "  \n"),
+        "strong": ("__", "__"),
+        "em": ("*", "*"),
+    }
+
+    for level in range(1, 7):
+        wrapped["h{0}".format(level)] = ("#" * level + " ", "\n\n")
+
+    return wrapped
 
-def _hyperlink(attributes, markdown_state):
-    href = attributes.get("href", "")
-    if href:
-        return _WriterOutput(
-            "[", "]({0})".format(href),
-            anchor_position="before",
-        )
-    else:
-        return _default_output
 
+_wrapped_elements = _init_wrapped()
 
-def _image(attributes, markdown_state):
-    src = attributes.get("src", "")
-    alt_text = attributes.get("alt", "")
-    if src or alt_text:
-        return _WriterOutput("![{0}]({1})".format(alt_text, src), "")
-    else:
-        return _default_output
+_element_kinds = dict((name, _wrapped) for name in _wrapped_elements)
+_element_kinds.update({
+    "a": _hyperlink,
+    "img": _image,
+    "ol": _ordered_list,
+    "ul": _unordered_list,
+    "li": _list_item,
+})
 
+_default_end = (_text_end, "")
+
+
+class MarkdownWriter(Writer):
+    def __init__(self, stream=None):
+        self._owns_stream = stream is None
+        if stream is None:
+            stream = io.StringIO()
+        self._stream = stream
+        self._write = stream.write
+        self._element_stack = []
+        self._markdown_state = _MarkdownState()
+
+    def text(self, text):
+        self._write(_escape_markdown(text))
+
+    def start(self, name, attributes=None):
+        if attributes is None:
+            attributes = {}
+
+        kind = _element_kinds.get(name)
+        if kind is _wrapped:
+            start, end = _wrapped_elements[name]
+            self._write(start)
+            self._write_anchor(attributes)
+            self._element_stack.append((_text_end, end))
+        elif kind is _hyperlink:
+            href = attributes.get("href", "")
+            if href:
+                self._write_anchor(attributes)
+                self._write("[")
+                self._element_stack.append((_text_end, "]({0})".format(href)))
+            else:
+                self._write_anchor(attributes)
+                self._element_stack.append(_default_end)
+        elif kind is _image:
+            src = attributes.get("src", "")
+            alt_text = attributes.get("alt", "")
+            if src or alt_text:
+                self._write("![{0}]({1})".format(alt_text, src))
+            self._write_anchor(attributes)
+            self._element_stack.append(_default_end)
+        elif kind is _ordered_list or kind is _unordered_list:
+            self._start_list(ordered=kind is _ordered_list)
+            self._write_anchor(attributes)
+        elif kind is _list_item:
+            self._start_list_item()
+            self._write_anchor(attributes)
+        else:
+            self._write_anchor(attributes)
+            self._element_stack.append(_default_end)
 
-def _list(ordered):
-    def call(attributes, markdown_state):
+    def _start_list(self, ordered):
+        markdown_state = self._markdown_state
         if markdown_state.list_state is None:
             start = ""
-            end_text = "\n"
+            end = "\n"
             indentation = 0
         else:
             start = "\n"
-            end_text = ""
+            end = ""
             indentation = markdown_state.list_state.indentation + 1
-        
-        def generate_end():
-            markdown_state.pop_list_state()
-            return end_text
-        
+
         markdown_state.update_list_state(_MarkdownListState(
             ordered=ordered,
             indentation=indentation,
         ))
-        
-        return _WriterOutput(start, generate_end=generate_end)
-    
-    return call
-
-
-def _list_item(attributes, markdown_state):
-    markdown_state.list_item_has_closed = False
-    
-    list_state = markdown_state.list_state or _MarkdownListState(ordered=False, indentation=0)
-    list_state.count += 1
-    
-    if list_state.ordered:
-        bullet = "{0}.".format(list_state.count)
-    else:
-        bullet = "-"
-    
-    def generate_end():
-        if markdown_state.list_item_has_closed:
-            return ""
-        else:
-            markdown_state.list_item_has_closed = True
-            return "\n"
-    
-    return _WriterOutput(
-        start=("\t" * list_state.indentation) + bullet + " ",
-        generate_end=generate_end
-    )
-
-
-def _init_writers():
-    writers = {
-        "p": _Wrapped("", "\n\n"),
-        "br": _Wrapped("", "  \n"),
-        "strong": _symmetric_wrapped("__"),
-        "em": _symmetric_wrapped("*"),
-        "a": _hyperlink,
-        "img": _image,
-        "ol": _list(ordered=True),
-        "ul": _list(ordered=False),
-        "li": _list_item,
-    }
-    
-    for level in range(1, 7):
-        writers["h{0}".format(level)] = _Wrapped("#" * level + " ", "\n\n")
-    
-    return writers
+        self._write(start)
+        self._element_stack.append((_list_end, end))
 
+    def _start_list_item(self):
+        markdown_state = self._markdown_state
+        markdown_state.list_item_has_closed = False
 
-_writers = _init_writers()
-_default_output = _WriterOutput("", "")
+        list_state = markdown_state.list_state or _MarkdownListState(ordered=False, indentation=0)
+        list_state.count += 1
 
-def _default_writer(attributes, markdown_state):
-    return _default_output
+        if list_state.ordered:
+            bullet = "{0}.".format(list_state.count)
+        else:
+            bullet = "-"
 
-
-class MarkdownWriter(Writer):
-    def __init__(self):
-        self._fragments = []
-        self._element_stack = []
-        self._markdown_state = _MarkdownState()
-    
-    def text(self, text):
-        self._fragments.append(_escape_markdown(text))
-    
-    def start(self, name, attributes=None):
-        if attributes is None:
-            attributes = {}
-        
-        output = _writers.get(name, _default_writer)(attributes, self._markdown_state)
-        self._element_stack.append(output.generate_end)
-        
-        anchor_before_start = output.anchor_position == "before"
-        if anchor_before_start:
-            self._write_anchor(attributes)
-        
-        self._fragments.append(output.start)
-        
-        if not anchor_before_start:
-            self._write_anchor(attributes)
-        
-        
+        self._write(("\t" * list_state.indentation) + bullet + " ")
+        self._element_stack.append((_list_item_end, None))
 
     def end(self, name):
-        end = self._element_stack.pop()
-        output = end()
-        self._fragments.append(output)
-    
+        end_kind, end = self._element_stack.pop()
+        if end_kind is _list_end:
+            self._markdown_state.pop_list_state()
+        elif end_kind is _list_item_end:
+            if self._markdown_state.list_item_has_closed:
+                end = ""
+            else:
+                self._markdown_state.list_item_has_closed = True
+                end = "\n"
+        self._write(end)
+
     def self_closing(self, name, attributes=None):
         self.start(name, attributes)
         self.end(name)
-    
+
     def append(self, other):
-        self._fragments.append(other)
-    
+        self._write(other)
+
     def as_string(self):
-        return "".join(self._fragments)
-    
+        if not self._owns_stream:
+            raise ValueError("as_string() can't be used when writing to a stream passed to the writer")
+        return self._stream.getvalue()
+
     def _write_anchor(self, attributes):
         html_id = attributes.get("id")
         if html_id:
-            self._fragments.append('<a id="{0}"></a>'.format(html_id))
+            self._write('<a id="{0}"></a>'.format(html_id))
+
+
+_escape_pattern = re.compile(r"([\\\`\*_\{\}\[\]\(\)\#\+\-\.\!])")
 
 
 def _escape_markdown(value):
-    return re.sub(r"([\`\*_\{\}\[\]\(\)\#\+\-\.\!])", r"\\\1", re.sub("\\\\", "\\\\\\\\", value))
+    return _escape_pattern.sub(r"\\\1", value)
@@ -1,6 +1,10 @@
 import contextlib
-import io
+import copy
+import os
 import shutil
+import struct
+import tempfile
+import zipfile
 
 from zipfile import ZipFile
 
@@ -29,31 +33,102 @@ class _Zip(object):
         except KeyError:
             return False
 
+    def info(self, name):
+        return self._zip_file.getinfo(name)
+
     def read_str(self, name):
         return self._zip_file.read(name).decode("utf8")
 
 
 def update_zip(fileobj, files):
-    source = ZipFile(fileobj, "r")
-    try:
-        destination_fileobj = io.BytesIO()
-        destination = ZipFile(destination_fileobj, "w")
-        try:
-            names = set(source.namelist()) | set(files.keys())
-            for name in names:
-                if name in files:
-                    contents = files[name]
-                else:
-                    contents = source.read(name)
-                destination.writestr(name, contents)
-        finally:
-            destination.close()
-    finally:
-        source.close()
-    
-    fileobj.seek(0)
-    destination_fileobj.seek(0)
-    shutil.copyfileobj(destination_fileobj, fileobj)
+    # Entries that aren't being replaced are copied using their compressed
+    # bytes where possible, so that updating a few small parts of a large
+    # archive doesn't require decompressing and recompressing every other
+    # part. Entries keep their order, with new entries added at the end.
+    with tempfile.TemporaryFile() as destination_fileobj:
+        with ZipFile(fileobj, "r") as source:
+            with ZipFile(destination_fileobj, "w", zipfile.ZIP_DEFLATED) as destination:
+                for info in source.infolist():
+                    if info.filename in files:
+                        destination.writestr(info.filename, files[info.filename])
+                    elif _can_copy_compressed_entry(info, destination):
+                        _copy_compressed_entry(fileobj, info, destination)
+                    else:
+                        destination.writestr(copy.copy(info), source.read(info))
+
+                for name, contents in files.items():
+                    if name not in source.NameToInfo:
+                        destination.writestr(name, contents)
+
+        fileobj.seek(0)
+        destination_fileobj.seek(0)
+        shutil.copyfileobj(destination_fileobj, fileobj)
+        fileobj.truncate()
+
+
+# ZipFile has no public API for writing compressed bytes directly, so
+# copying an entry relies on internals of the zipfile module. If they're
+# missing, or the entry needs more than a plain local header (such as a
+# data descriptor, encryption or zip64 sizes), the entry is decompressed and
+# written using ZipFile.writestr() instead.
+_zipfile_module_internals = ("structFileHeader", "sizeFileHeader", "_FH_FILENAME_LENGTH", "_FH_EXTRA_FIELD_LENGTH")
+_zip_file_internals = ("fp", "start_dir", "filelist", "NameToInfo")
+
+_encrypted_flag = 0x01
+_data_descriptor_flag = 0x08
+_zip64_extra_header_id = 0x0001
+
+
+def _can_copy_compressed_entry(info, destination):
+    return (
+        all(hasattr(zipfile, name) for name in _zipfile_module_internals) and
+        all(hasattr(destination, name) for name in _zip_file_internals) and
+        not info.flag_bits & (_encrypted_flag | _data_descriptor_flag) and
+        not _is_zip64_entry(info) and
+        destination.fp.tell() < zipfile.ZIP64_LIMIT
+    )
+
+
+def _is_zip64_entry(info):
+    if max(info.file_size, info.compress_size, info.header_offset) >= zipfile.ZIP64_LIMIT:
+        return True
+
+    extra = info.extra
+    while len(extra) >= 4:
+        header_id, size = struct.unpack("<HH", extra[:4])
+        if header_id == _zip64_extra_header_id:
+            return True
+        extra = extra[4 + size:]
+
+    return False
+
+
+def _copy_compressed_entry(source_fileobj, info, destination):
+    source_fileobj.seek(info.header_offset)
+    local_header = struct.unpack(zipfile.structFileHeader, source_fileobj.read(zipfile.sizeFileHeader))
+    source_fileobj.seek(
+        local_header[zipfile._FH_FILENAME_LENGTH] + local_header[zipfile._FH_EXTRA_FIELD_LENGTH],
+        os.SEEK_CUR,
+    )
+
+    # The entry is written in the same way as ZipFile.writestr() writes
+    # entries, with the sizes and CRC in the local header.
+    destination_info = copy.copy(info)
+    destination_info.header_offset = destination.fp.tell()
+    destination.fp.write(destination_info.FileHeader())
+    _copy_bytes(source_fileobj, destination.fp, info.compress_size)
+    destination.start_dir = destination.fp.tell()
+    destination.filelist.append(destination_info)
+    destination.NameToInfo[destination_info.filename] = destination_info
+
+
+def _copy_bytes(source, destination, length):
+    while length > 0:
+        chunk = source.read(min(length, 1024 * 1024))
+        if not chunk:
+            raise zipfile.BadZipFile("Unexpected end of data")
+        destination.write(chunk)
+        length -= len(chunk)
 
 
 def split_path(path):
@@ -1,5 +1,7 @@
-import os
 import base64
+import json
+import os
+import subprocess
 
 import spur
 import tempman
@@ -76,3 +78,103 @@ def test_output_format_markdown_option_generates_markdown_output():
     result = _local.run(["mammoth", docx_path, "--output-format=markdown"])
     assert_equal(b"", result.stderr_output)
     assert_equal(b"Walking on imported air\n\n", result.output)
+
+
+def test_when_style_classes_is_set_then_colours_are_written_as_classes():
+    docx_path = generate_test_path("font-colors.docx")
+    result = _local.run(["mammoth", docx_path, "--style-classes"])
+    assert result.output.startswith(b"<style>\n.mammoth-c1 { color: #")
+    assert b'<span class="mammoth-c1">' in result.output
+
+
+def test_style_classes_cannot_be_used_with_markdown_output():
+    docx_path = generate_test_path("font-colors.docx")
+    result = subprocess.run(
+        ["mammoth", docx_path, "--style-classes", "--output-format=markdown"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert result.returncode != 0
+    assert_equal(b"", result.stdout)
+    assert b"ValueError: style_classes can only be used with HTML output" in result.stderr
+
+
+def test_when_profile_is_set_then_phases_are_written_to_stderr():
+    docx_path = generate_test_path("single-paragraph.docx")
+    result = _local.run(["mammoth", docx_path, "--profile"])
+    assert_equal(b"<p>Walking on imported air</p>", result.output)
+    assert b"parse word/document.xml" in result.stderr_output
+
+
+def test_serve_stdio_writes_json_line_for_each_job():
+    docx_path = generate_test_path("single-paragraph.docx")
+    jobs = [
+        {"id": 1, "path": docx_path},
+        {"id": 2, "path": docx_path, "output_format": "markdown"},
+    ]
+
+    responses = _serve_stdio(jobs)
+
+    assert_equal([1, 2], [response["id"] for response in responses])
+    assert_equal([True, True], [response["ok"] for response in responses])
+    assert_equal("<p>Walking on imported air</p>", responses[0]["value"])
+    assert_equal("Walking on imported air\n\n", responses[1]["value"])
+    assert_equal([], responses[0]["messages"])
+    assert responses[0]["seconds"] >= 0
+
+
+def test_serve_stdio_writes_output_file_and_messages_using_style_map():
+    with tempman.create_temp_dir() as temp_dir:
+        output_path = os.path.join(temp_dir.path, "output.html")
+        style_map_path = os.path.join(temp_dir.path, "style-map")
+        with open(style_map_path, "w") as style_map_file:
+            style_map_file.write("p => span:fresh")
+
+        docx_path = generate_test_path("single-paragraph.docx")
+        responses = _serve_stdio([
+            {"path": docx_path, "output": output_path, "style_map": style_map_path},
+        ])
+
+        assert_equal(output_path, responses[0]["output"])
+        assert "value" not in responses[0]
+        with open(output_path) as output_file:
+            assert_equal("<span>Walking on imported air</span>", output_file.read())
+
+
+def test_serve_stdio_returns_stylesheet_if_style_classes_is_set():
+    docx_path = generate_test_path("font-colors.docx")
+    responses = _serve_stdio([
+        {"path": docx_path, "style_classes": True},
+        {"path": docx_path, "style_classes": True, "output_format": "markdown"},
+    ])
+
+    assert responses[0]["stylesheet"].startswith(".mammoth-c1 { color: #")
+    assert '<span class="mammoth-c1">' in responses[0]["value"]
+    assert not responses[0]["value"].startswith("<style>")
+    assert_equal(False, responses[1]["ok"])
+    assert_equal("ValueError: style_classes can only be used with HTML output", responses[1]["error"])
+
+
+def test_serve_stdio_reports_failed_jobs_and_continues():
+    docx_path = generate_test_path("single-paragraph.docx")
+    responses = _serve_stdio([
+        {"id": "missing", "path": generate_test_path("missing.docx")},
+        {"id": "present", "path": docx_path},
+    ])
+
+    assert_equal(False, responses[0]["ok"])
+    assert "FileNotFoundError" in responses[0]["error"]
+    assert_equal(True, responses[1]["ok"])
+
+
+def _serve_stdio(jobs):
+    job_lines = "".join(json.dumps(job) + "\n" for job in jobs)
+    result = subprocess.run(
+        ["mammoth", "--serve-stdio"],
+        input=job_lines.encode("utf-8"),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        check=True,
+    )
+    assert_equal(b"", result.stderr)
+    return [json.loads(line) for line in result.stdout.decode("utf-8").splitlines()]
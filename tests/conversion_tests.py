@@ -5,11 +5,11 @@ from __future__ import unicode_literals
 import io
 from mammoth.docx.numbering_xml import _AbstractNumLevel
 
-from mammoth import documents, results, html
-from mammoth.conversion import convert_document_element_to_html, _comment_author_label
+from mammoth import documents, results, html, images
+from mammoth.conversion import convert_document_element_to_html, convert_document_element_to_html_in_chunks, Stylesheet, _comment_author_label
 from mammoth.docx.xmlparser import parse_xml
 from mammoth.styles.parser import read_style_mapping
-from .testing import assert_equal
+from .testing import assert_equal, assert_raises
 
 
 def test_plain_paragraph_is_converted_to_plain_paragraph():
@@ -193,6 +193,45 @@ def test_style_mapping_for_underline_runs_does_not_close_parent_elements():
     assert_equal("<strong><em>Hello</em></strong>", result.value)
 
 
+def test_runs_with_ignored_formatting_are_removed_along_with_their_children():
+    result = convert_document_element_to_html(
+        documents.paragraph(children=[
+            documents.run(children=[documents.text("Hello")], is_underline=True, is_bold=True),
+            documents.run(children=[documents.text("World")], is_bold=True),
+        ]),
+        style_map=[
+            _style_mapping("u => !")
+        ]
+    )
+    assert_equal("<p><strong>World</strong></p>", result.value)
+
+
+def test_runs_with_the_same_formatting_are_converted_independently():
+    result = convert_document_element_to_html(
+        documents.paragraph(children=[
+            documents.run(children=[documents.text("Hello")], is_bold=True, style_id="Emphasis", style_name="Emphasis"),
+            documents.text(" "),
+            documents.run(children=[documents.text("World")], is_bold=True, style_id="Emphasis", style_name="Emphasis"),
+        ]),
+    )
+    assert_equal("<p><strong>Hello</strong> <strong>World</strong></p>", result.value)
+
+
+def test_warning_for_unrecognised_run_style_is_counted_for_each_run():
+    message_sink = results.MessageSink()
+    convert_document_element_to_html(
+        documents.paragraph(children=[
+            documents.run(children=[documents.text("Hello")], style_id="Emphasis", style_name="Emphasis"),
+            documents.run(children=[documents.text("World")], style_id="Emphasis", style_name="Emphasis"),
+        ]),
+        message_sink=message_sink,
+    )
+    assert_equal(
+        [(results.warning("Unrecognised run style: Emphasis (Style ID: Emphasis)"), 2)],
+        message_sink.counts(),
+    )
+
+
 def test_strikethrough_runs_are_wrapped_in_s_elements_by_default():
     result = convert_document_element_to_html(
         documents.run(children=[documents.text("Hello")], is_strikethrough=True),
@@ -236,6 +275,29 @@ def test_highlight_runs_are_wrapped_in_span_tags():
     )
     assert_equal("<span style=\"background-color:lime\">Hello</span>", result.value)
 
+def test_run_colors_are_written_as_classes_when_stylesheet_is_set():
+    stylesheet = Stylesheet()
+    result = convert_document_element_to_html(
+        documents.paragraph([
+            documents.run(children=[documents.text("Hello")], highlight_color="green", font_color="FF0000"),
+            documents.run(children=[documents.text(" there")], highlight_color="yellow", font_color="FF0000"),
+            documents.run(children=[documents.text("!")], highlight_color="green"),
+        ]),
+        stylesheet=stylesheet,
+    )
+    assert_equal(
+        '<p><span class="mammoth-c2"><span class="mammoth-c1">Hello</span><span class="mammoth-c3"> there</span></span>'
+        '<span class="mammoth-c1">!</span></p>',
+        result.value,
+    )
+    assert_equal(
+        ".mammoth-c1 { background-color:lime }\n"
+        ".mammoth-c2 { color: #FF0000 }\n"
+        ".mammoth-c3 { background-color:yellow }\n",
+        stylesheet.as_string(),
+    )
+
+
 def test_small_caps_runs_are_ignored_by_default():
     result = convert_document_element_to_html(
         documents.run(children=[documents.text("Hello")], is_small_caps=True),
@@ -416,6 +478,17 @@ def test_unmerged_table_cell_is_treated_as_table_cell():
     assert_equal(expected_html, result.value)
 
 
+def test_deeply_nested_tables_are_converted():
+    depth = 1000
+    element = _paragraph_with_text("Hello")
+    for _ in range(depth):
+        element = documents.table([documents.table_row([documents.table_cell([element])])])
+
+    result = convert_document_element_to_html(element)
+
+    assert_equal("<table><tr><td>" * depth + "<p>Hello</p>" + "</td></tr></table>" * depth, result.value)
+
+
 def test_table_style_mappings_can_be_used_to_map_tables():
     table = documents.table([], style_name="Normal Table")
     result = convert_document_element_to_html(
@@ -658,6 +731,177 @@ def test_comment_references_are_linked_to_comment_after_main_body():
     assert_equal(expected_html, result.value)
 
 
+def test_when_split_on_is_not_set_then_value_is_single_string():
+    result = convert_document_element_to_html(
+        documents.document([_paragraph_with_text("Hello")]),
+    )
+    assert_equal("<p>Hello</p>", result.value)
+
+
+def test_document_can_be_split_on_html_element_name():
+    document = documents.document([
+        documents.paragraph(style_id="Heading1", children=[_run_with_text("One")]),
+        _paragraph_with_text("First"),
+        documents.paragraph(style_id="Heading1", children=[_run_with_text("Two")]),
+        _paragraph_with_text("Second"),
+    ])
+    result = convert_document_element_to_html(
+        document,
+        style_map=[_style_mapping("p.Heading1 => h1:fresh")],
+        split_on="h1",
+    )
+    assert_equal([
+        "<h1>One</h1><p>First</p>",
+        "<h1>Two</h1><p>Second</p>",
+    ], result.value)
+
+
+def test_content_before_first_split_element_is_in_its_own_chunk():
+    document = documents.document([
+        _paragraph_with_text("Preface"),
+        documents.paragraph(style_id="Heading1", children=[_run_with_text("One")]),
+    ])
+    result = convert_document_element_to_html(
+        document,
+        style_map=[_style_mapping("p.Heading1 => h1:fresh")],
+        split_on="h1",
+    )
+    assert_equal(["<p>Preface</p>", "<h1>One</h1>"], result.value)
+
+
+def test_when_splitting_then_each_chunk_includes_notes_referenced_in_chunk():
+    document = documents.document(
+        [
+            documents.paragraph(style_id="Heading1", children=[_run_with_text("One")]),
+            documents.paragraph([documents.run([documents.note_reference("footnote", "1")])]),
+            documents.paragraph(style_id="Heading1", children=[
+                documents.run([documents.note_reference("footnote", "2")]),
+            ]),
+        ],
+        notes=documents.notes([
+            documents.note("footnote", "1", [_paragraph_with_text("A")]),
+            documents.note("footnote", "2", [_paragraph_with_text("B")]),
+        ]),
+    )
+    result = convert_document_element_to_html(
+        document,
+        style_map=[_style_mapping("p.Heading1 => h1:fresh")],
+        split_on="h1",
+    )
+    assert_equal([
+        '<h1>One</h1>' +
+        '<p><sup><a href="#footnote-1" id="footnote-ref-1">[1]</a></sup></p>' +
+        '<ol><li id="footnote-1"><p>A <a href="#footnote-ref-1">↑</a></p></li></ol>',
+        '<h1><sup><a href="#footnote-2" id="footnote-ref-2">[2]</a></sup></h1>' +
+        '<ol><li id="footnote-2"><p>B <a href="#footnote-ref-2">↑</a></p></li></ol>',
+    ], result.value)
+
+
+def test_document_can_be_split_on_page_breaks():
+    document = documents.document([
+        _paragraph_with_text("One"),
+        documents.paragraph([documents.run([documents.text("Two"), documents.page_break])]),
+        documents.paragraph([documents.run([documents.page_break, documents.text("Three")])]),
+        _paragraph_with_text("Four"),
+    ])
+    result = convert_document_element_to_html(document, split_on=documents.page_break)
+    assert_equal([
+        "<p>One</p><p>Two</p>",
+        "<p>Three</p><p>Four</p>",
+    ], result.value)
+
+
+def test_when_converting_in_chunks_then_first_chunk_is_written_before_later_blocks_are_visited():
+    converted_images = []
+
+    def convert_image(image):
+        converted_images.append(image)
+        return {"src": ""}
+
+    document = documents.document([
+        documents.paragraph(style_id="Heading1", children=[_run_with_text("One")]),
+        documents.paragraph(style_id="Heading1", children=[_run_with_text("Two")]),
+        documents.paragraph([documents.run([
+            documents.image(alt_text=None, content_type="image/png", open=lambda: io.BytesIO(b"abc")),
+        ])]),
+    ])
+    chunks = convert_document_element_to_html_in_chunks(
+        document,
+        style_map=[_style_mapping("p.Heading1 => h1:fresh")],
+        split_on="h1",
+        convert_image=images.img_element(convert_image),
+    )
+
+    assert_equal("<h1>One</h1>", next(chunks))
+    assert_equal(0, len(converted_images))
+    assert_equal(["<h1>Two</h1><p><img src=\"\" /></p>"], list(chunks))
+    assert_equal(1, len(converted_images))
+
+
+def test_when_max_output_bytes_is_set_then_conversion_stops_after_block_reaching_limit():
+    document = documents.document([
+        _paragraph_with_text("One"),
+        _paragraph_with_text("Two"),
+        _paragraph_with_text("Three"),
+    ])
+    result = convert_document_element_to_html(document, max_output_bytes=12)
+    assert_equal("<p>One</p><p>Two</p>", result.value)
+    assert_equal(
+        [results.warning("Output was truncated after 2 of 3 blocks to fit within 12 bytes")],
+        result.messages,
+    )
+
+
+def test_when_output_is_truncated_then_only_notes_referenced_before_truncation_are_included():
+    document = documents.document(
+        [
+            documents.paragraph([documents.run([documents.note_reference("footnote", "1")])]),
+            documents.paragraph([documents.run([documents.note_reference("footnote", "2")])]),
+        ],
+        notes=documents.notes([
+            documents.note("footnote", "1", [_paragraph_with_text("A")]),
+            documents.note("footnote", "2", [_paragraph_with_text("B")]),
+        ]),
+    )
+    result = convert_document_element_to_html(document, max_output_bytes=1)
+    assert_equal(
+        '<p><sup><a href="#footnote-1" id="footnote-ref-1">[1]</a></sup></p>' +
+        '<ol><li id="footnote-1"><p>A <a href="#footnote-ref-1">↑</a></p></li></ol>',
+        result.value,
+    )
+
+
+def test_when_output_stream_is_set_then_output_is_written_to_stream():
+    output_stream = io.StringIO()
+    result = convert_document_element_to_html(
+        documents.paragraph(children=[_run_with_text("Hello")]),
+        output_stream=output_stream,
+    )
+    assert_equal("<p>Hello</p>", output_stream.getvalue())
+    assert_equal(None, result.value)
+
+
+def test_when_output_stream_and_max_output_bytes_are_set_then_truncated_output_is_written_to_stream():
+    document = documents.document([
+        _paragraph_with_text("One"),
+        _paragraph_with_text("Two"),
+        _paragraph_with_text("Three"),
+    ])
+    output_stream = io.StringIO()
+    result = convert_document_element_to_html(document, max_output_bytes=12, output_stream=output_stream)
+    assert_equal("<p>One</p><p>Two</p>", output_stream.getvalue())
+    assert_equal(None, result.value)
+
+
+def test_output_stream_cannot_be_used_when_splitting_document():
+    error = assert_raises(ValueError, lambda: convert_document_element_to_html(
+        documents.document([_paragraph_with_text("One")]),
+        split_on="p",
+        output_stream=io.StringIO(),
+    ))
+    assert_equal("output_stream can't be used when splitting the document into chunks", str(error))
+
+
 def test_when_initials_are_not_blank_then_comment_author_label_is_initials():
     assert_equal("TP", _comment_author_label(documents.comment(
         comment_id="0",
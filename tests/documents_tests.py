@@ -0,0 +1,118 @@
+from mammoth import documents
+from .testing import assert_equal
+
+
+class DocumentIndexTests(object):
+    def test_elements_of_type_are_found_in_same_order_as_get_descendants(self):
+        first_text = documents.text("one")
+        second_text = documents.text("two")
+        first_run = documents.run([first_text])
+        second_run = documents.run([second_text])
+        paragraph = documents.paragraph([first_run, documents.hyperlink([second_run], href="#")])
+        document = documents.document([paragraph])
+
+        assert_equal([first_run, second_run], document.index.elements_of_type(documents.Run))
+        assert_equal([first_text, second_text], document.index.elements_of_type(documents.Text))
+        assert_equal([paragraph], document.index.elements_of_type(documents.Paragraph))
+
+    def test_elements_of_type_includes_subclasses(self):
+        document = documents.document([
+            documents.paragraph([documents.run([documents.text("one")])]),
+        ])
+
+        assert_equal(2, len(document.index.elements_of_type(documents.HasChildren)))
+
+    def test_elements_of_type_and_style_id_include_instances_of_subclasses(self):
+        class CustomParagraph(documents.Paragraph):
+            __slots__ = ()
+
+        paragraph = CustomParagraph([], "Heading1", None, None, list_id=None, alignment=None, indent=documents.paragraph_indent())
+        document = documents.document([paragraph])
+
+        assert_equal([paragraph], document.index.elements_of_type(documents.Paragraph))
+        assert_equal([paragraph], document.index.paragraphs_with_style_id("Heading1"))
+
+    def test_index_is_snapshot_of_document_when_index_is_first_used(self):
+        paragraph = documents.paragraph([])
+        document = documents.document([paragraph])
+        document.index.elements_of_type(documents.Paragraph)
+
+        second_paragraph = documents.paragraph([])
+        document.children.append(second_paragraph)
+
+        assert_equal([paragraph], document.index.elements_of_type(documents.Paragraph))
+
+    def test_when_there_are_no_elements_of_type_then_elements_of_type_is_empty(self):
+        document = documents.document([documents.paragraph([])])
+
+        assert_equal([], document.index.elements_of_type(documents.Image))
+
+    def test_paragraphs_can_be_found_by_style_id(self):
+        heading = documents.paragraph([], style_id="Heading1")
+        document = documents.document([
+            heading,
+            documents.paragraph([], style_id="Normal"),
+        ])
+
+        assert_equal([heading], document.index.paragraphs_with_style_id("Heading1"))
+        assert_equal([], document.index.paragraphs_with_style_id("Heading2"))
+
+    def test_runs_can_be_found_by_style_id(self):
+        emphasis = documents.run([], style_id="Emphasis")
+        document = documents.document([
+            documents.paragraph([emphasis, documents.run([])]),
+        ])
+
+        assert_equal([emphasis], document.index.runs_with_style_id("Emphasis"))
+
+    def test_bookmarks_can_be_found_by_name(self):
+        bookmark = documents.bookmark(name="_Toc1")
+        document = documents.document([documents.paragraph([bookmark])])
+
+        assert_equal(bookmark, document.index.bookmark("_Toc1"))
+        assert_equal(None, document.index.bookmark("_Toc2"))
+
+    def test_index_is_built_once(self):
+        document = documents.document([])
+
+        assert document.index is document.index
+
+    def test_copy_of_document_has_new_index(self):
+        document = documents.document([documents.paragraph([])])
+        index = document.index
+
+        copy = document.copy(children=[])
+
+        assert copy.index is not index
+        assert_equal([], copy.index.elements_of_type(documents.Paragraph))
+
+
+class SlotsTests(object):
+    def test_elements_do_not_have_instance_dictionaries(self):
+        run = documents.run([documents.text("Hello")], style_id="Emphasis", is_bold=True)
+
+        assert not hasattr(run, "__dict__")
+        assert not hasattr(run.children[0], "__dict__")
+
+    def test_copying_element_updates_fields(self):
+        run = documents.run([documents.text("Hello")], style_id="Emphasis", is_bold=True)
+
+        copied_run = run.copy(is_bold=False)
+
+        assert_equal(documents.run([documents.text("Hello")], style_id="Emphasis"), copied_run)
+        assert_equal(True, run.is_bold)
+
+    def test_paragraphs_without_indentation_share_indent(self):
+        first_paragraph = documents.paragraph([])
+        second_paragraph = documents.paragraph([], indent=documents.paragraph_indent())
+
+        assert first_paragraph.indent is second_paragraph.indent
+        assert_equal(documents.ParagraphIndent(start=None, end=None, first_line=None, hanging=None), first_paragraph.indent)
+
+    def test_copied_document_has_its_own_index(self):
+        document = documents.document([documents.paragraph([], style_id="Heading1")])
+        assert_equal(1, len(document.index.paragraphs_with_style_id("Heading1")))
+
+        copied_document = document.copy(children=[])
+
+        assert_equal([], copied_document.index.paragraphs_with_style_id("Heading1"))
@@ -454,6 +454,85 @@ class RunTests(object):
         return _read_and_get_document_xml_element(run_xml, styles=styles)
 
 
+class CoalesceRunsTests(object):
+    def test_runs_are_not_coalesced_by_default(self):
+        paragraph_xml = xml_element("w:p", {}, [
+            _run_element_with_text("Walking on "),
+            _run_element_with_text("imported air"),
+        ])
+
+        paragraph = _read_and_get_document_xml_element(paragraph_xml)
+
+        assert_equal(2, len(paragraph.children))
+
+    def test_adjacent_runs_with_same_properties_are_coalesced(self):
+        bold_xml = xml_element("w:rPr", {}, [xml_element("w:b")])
+        paragraph_xml = xml_element("w:p", {}, [
+            xml_element("w:r", {}, [bold_xml, _text_element("Walking on ")]),
+            xml_element("w:proofErr"),
+            xml_element("w:r", {}, [bold_xml, _text_element("imported "), xml_element("w:tab")]),
+            xml_element("w:r", {}, [bold_xml, _text_element("air")]),
+        ])
+
+        paragraph = _read_and_get_document_xml_element(paragraph_xml, coalesce_runs=True)
+
+        assert_equal(
+            documents.paragraph([
+                documents.run([
+                    documents.text("Walking on imported "),
+                    documents.tab(),
+                    documents.text("air"),
+                ], is_bold=True),
+            ]),
+            paragraph,
+        )
+
+    def test_adjacent_runs_with_different_properties_are_not_coalesced(self):
+        paragraph_xml = xml_element("w:p", {}, [
+            _run_element_with_text("Walking on "),
+            xml_element("w:r", {}, [
+                xml_element("w:rPr", {}, [xml_element("w:i")]),
+                _text_element("imported air"),
+            ]),
+        ])
+
+        paragraph = _read_and_get_document_xml_element(paragraph_xml, coalesce_runs=True)
+
+        assert_equal(
+            documents.paragraph([
+                documents.run([documents.text("Walking on ")]),
+                documents.run([documents.text("imported air")], is_italic=True),
+            ]),
+            paragraph,
+        )
+
+    def test_runs_separated_by_other_elements_are_not_coalesced(self):
+        paragraph_xml = xml_element("w:p", {}, [
+            _run_element_with_text("Walking on "),
+            xml_element("w:bookmarkStart", {"w:name": "_Peter"}),
+            _run_element_with_text("imported air"),
+        ])
+
+        paragraph = _read_and_get_document_xml_element(paragraph_xml, coalesce_runs=True)
+
+        assert_equal(3, len(paragraph.children))
+
+    def test_runs_in_hyperlinks_are_coalesced(self):
+        hyperlink_xml = xml_element("w:hyperlink", {"w:anchor": "start"}, [
+            _run_element_with_text("Walking on "),
+            _run_element_with_text("imported air"),
+        ])
+
+        hyperlink = _read_and_get_document_xml_element(hyperlink_xml, coalesce_runs=True)
+
+        assert_equal(
+            documents.hyperlink(anchor="start", children=[
+                documents.run([documents.text("Walking on imported air")]),
+            ]),
+            hyperlink,
+        )
+
+
 class ComplexFieldTests(object):
     _URI = "http://example.com"
     _BEGIN_COMPLEX_FIELD = xml_element("w:r", {}, [
@@ -1317,6 +1396,18 @@ def _assert_children_are_converted_normally(tag_name):
     )
 
 
+def test_deeply_nested_elements_that_are_read_for_their_children_are_read():
+    depth = sys.getrecursionlimit() * 2
+    element = _run_element_with_text("Hello")
+    for _ in range(depth):
+        element = xml_element("w:smartTag", {}, [element])
+
+    assert_equal(
+        documents.paragraph([documents.run([documents.text("Hello")])]),
+        _read_and_get_document_xml_element(xml_element("w:p", {}, [element])),
+    )
+
+
 class HyperlinkTests(object):
     def test_hyperlink_is_read_as_external_hyperlink_if_it_has_a_relationship_id(self):
         relationships = Relationships([
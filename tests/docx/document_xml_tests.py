@@ -1,6 +1,6 @@
 import pytest
 
-from mammoth import documents
+from mammoth import documents, results
 from mammoth.docx.xmlparser import element as xml_element, text as xml_text
 from mammoth.docx.document_xml import read_document_xml_element
 from mammoth.docx import body_xml
@@ -44,6 +44,41 @@ def test_footnotes_of_document_are_read():
     assert isinstance(footnote.body[0], documents.Paragraph)
 
 
+def test_when_max_blocks_is_set_then_only_first_blocks_are_read():
+    body_element = xml_element("w:body", {}, [
+        _paragraph_xml("One"),
+        _paragraph_xml("Two"),
+        _paragraph_xml("Three"),
+    ])
+    document_xml = xml_element("w:document", {}, [body_element])
+
+    result = read_document_xml_element(document_xml, body_reader=body_xml.reader(), max_blocks=2)
+
+    assert_equal(
+        [
+            documents.paragraph([documents.run([documents.text("One")])]),
+            documents.paragraph([documents.run([documents.text("Two")])]),
+        ],
+        result.value.children,
+    )
+    assert_equal([results.warning("Document was truncated to the first 2 blocks")], result.messages)
+
+
+def test_when_document_has_no_more_than_max_blocks_then_no_warning_is_emitted():
+    body_element = xml_element("w:body", {}, [_paragraph_xml("One"), xml_element("w:sectPr")])
+    document_xml = xml_element("w:document", {}, [body_element])
+
+    document = _read_and_get_document_xml_element(document_xml, max_blocks=1)
+
+    assert_equal([documents.paragraph([documents.run([documents.text("One")])])], document.children)
+
+
+def _paragraph_xml(text):
+    return xml_element("w:p", {}, [
+        xml_element("w:r", {}, [xml_element("w:t", {}, [xml_text(text)])]),
+    ])
+
+
 def _read_and_get_document_xml_element(*args, **kwargs):
     body_reader = body_xml.reader()
     result = read_document_xml_element(*args, body_reader=body_reader, **kwargs)
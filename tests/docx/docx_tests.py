@@ -19,6 +19,15 @@ class ReadTests(object):
             ])
             assert_equal(expected_document, result.value)
 
+    def test_index_is_built_when_build_index_is_true(self):
+        with open(generate_test_path("single-paragraph.docx"), "rb") as fileobj:
+            result = docx.read(fileobj=fileobj, build_index=True)
+            assert result.value._index is not None
+            assert_equal(
+                [documents.text("Walking on imported air")],
+                result.value.index.elements_of_type(documents.Text),
+            )
+
 
 _relationship_namespaces = {
     "r": "http://schemas.openxmlformats.org/package/2006/relationships",
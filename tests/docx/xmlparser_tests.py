@@ -1,4 +1,5 @@
 import io
+import sys
 
 from mammoth.docx.xmlparser import parse_xml, element as xml_element, text as xml_text
 from ..testing import assert_equal
@@ -72,5 +73,15 @@ class FindChildTests(object):
         assert_equal(None, xml.find_child("b"))
 
 
+def test_can_parse_deeply_nested_elements():
+    depth = sys.getrecursionlimit() * 2
+    xml = _parse_xml_string(b"<a>" * depth + b"Hello" + b"</a>" * depth)
+
+    for _ in range(depth - 1):
+        assert_equal("a", xml.name)
+        [xml] = xml.children
+    assert_equal([xml_text("Hello")], xml.children)
+
+
 def _parse_xml_string(string, namespace_mapping=None):
     return parse_xml(io.BytesIO(string), namespace_mapping)
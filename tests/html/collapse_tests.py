@@ -1,3 +1,5 @@
+import sys
+
 from mammoth import html
 from ..testing import assert_equal
 
@@ -70,6 +72,30 @@ def test_children_of_collapsed_element_can_collapse_with_children_of_previous_el
         ]))
 
 
+def test_collapsing_does_not_change_original_nodes():
+    first_paragraph = html.collapsible_element("p", {}, [html.text("One")])
+    first_blockquote = html.collapsible_element("blockquote", {}, [first_paragraph])
+    nodes = [
+        first_blockquote,
+        html.collapsible_element("blockquote", {}, [
+            html.collapsible_element("p", {}, [html.text("Two")])
+        ]),
+    ]
+
+    html.collapse(nodes)
+
+    assert_equal([first_paragraph], first_blockquote.children)
+    assert_equal([html.text("One")], first_paragraph.children)
+
+
+def test_elements_that_are_not_collapsed_are_reused():
+    element = html.element("p", {}, [html.text("One")])
+
+    [collapsed_element] = html.collapse([element])
+
+    assert collapsed_element is element
+
+
 def test_collapsible_element_can_collapse_into_previous_fresh_element():
     assert_equal(
         [html.element("p", {}, [html.text("One"), html.text("Two")])],
@@ -113,3 +139,19 @@ def test_when_separator_is_present_then_separator_is_prepended_to_collapsed_elem
             html.element("pre", collapsible=True, separator="\n", children=[html.text(" the"), html.text("re")]),
         ]),
     )
+
+
+def test_deeply_nested_collapsible_elements_are_collapsed():
+    depth = sys.getrecursionlimit() * 2
+
+    def nested(text):
+        node = html.text(text)
+        for _ in range(depth):
+            node = html.collapsible_element("div", {}, [node])
+        return node
+
+    [node] = html.collapse([nested("One"), nested("Two")])
+
+    for _ in range(depth - 1):
+        [node] = node.children
+    assert_equal([html.text("One"), html.text("Two")], node.children)
@@ -1,3 +1,5 @@
+import sys
+
 from mammoth import html
 from ..testing import assert_equal
 
@@ -44,6 +46,14 @@ def test_empty_children_are_removed():
         ])])
 
 
+def test_elements_without_empty_children_are_reused():
+    element = html.element("ul", {}, [html.element("li", {}, [html.text("H")])])
+
+    [stripped_element] = html.strip_empty([element])
+
+    assert stripped_element is element
+
+
 def test_self_closing_elements_are_never_empty():
     assert_equal(
         [html.element("br")],
@@ -54,3 +64,11 @@ def test_force_writes_are_never_empty():
     assert_equal(
         [html.force_write],
         html.strip_empty([html.force_write]))
+
+
+def test_deeply_nested_empty_elements_are_removed():
+    node = html.element("p")
+    for _ in range(sys.getrecursionlimit() * 2):
+        node = html.element("span", {}, [node])
+
+    assert_equal([], html.strip_empty([node]))
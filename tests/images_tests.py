@@ -3,6 +3,7 @@ import io
 from precisely import assert_that, has_attrs, is_sequence
 
 import mammoth
+from .testing import assert_equal
 
 
 def test_inline_is_available_as_alias_of_img_element():
@@ -27,6 +28,50 @@ def test_data_uri_encodes_images_in_base64():
     assert attrs["height"] == "600"
 
 
+class ReferenceTests:
+    def test_src_is_path_of_embedded_image_with_prefix(self):
+        open_image = _OpenSpy()
+        image = mammoth.documents.Image(
+            alt_text=None,
+            content_type="image/png",
+            open=open_image,
+            path="word/media/image1.png",
+            info=mammoth.documents.ImageInfo(read_zip_info=None, open=open_image),
+        )
+
+        result = mammoth.images.reference(prefix="images/")(image)
+
+        assert_that(result, is_sequence(
+            has_attrs(attributes={"src": "images/word/media/image1.png"}),
+        ))
+        assert_equal(0, open_image.call_count)
+
+    def test_src_is_uri_of_linked_image(self):
+        open_image = _OpenSpy()
+        image = mammoth.documents.Image(
+            alt_text=None,
+            content_type="image/png",
+            open=open_image,
+            path="http://example.com/image.png",
+        )
+
+        result = mammoth.images.reference(prefix="images/")(image)
+
+        assert_that(result, is_sequence(
+            has_attrs(attributes={"src": "http://example.com/image.png"}),
+        ))
+        assert_equal(0, open_image.call_count)
+
+
+class _OpenSpy(object):
+    def __init__(self):
+        self.call_count = 0
+
+    def __call__(self):
+        self.call_count += 1
+        return io.BytesIO(b"")
+
+
 class ImgElementTests:
     def test_when_element_does_not_have_alt_text_then_alt_attribute_is_not_set(self):
         image_bytes = b"abc"
@@ -0,0 +1,78 @@
+from mammoth.docx.numbering_xml import _AbstractNumLevel
+from mammoth.list_numbering import ListCounters, list_type
+from .testing import assert_equal
+
+
+class ListCountersTests(object):
+    def test_first_item_of_list_is_numbered_one(self):
+        counters = ListCounters()
+        assert_equal(1, counters.next("1", "0", None))
+
+    def test_first_item_of_list_is_numbered_using_start_number(self):
+        counters = ListCounters()
+        assert_equal(5, counters.next("1", "0", "5"))
+
+    def test_items_at_same_level_are_numbered_consecutively(self):
+        counters = ListCounters()
+        counters.next("1", "0", None)
+        assert_equal(2, counters.next("1", "0", None))
+        assert_equal(3, counters.next("1", "0", None))
+
+    def test_lists_are_numbered_independently(self):
+        counters = ListCounters()
+        counters.next("1", "0", None)
+        assert_equal(1, counters.next("2", "0", None))
+        assert_equal(2, counters.next("1", "0", None))
+
+    def test_shallower_item_continues_numbering_of_its_level(self):
+        counters = ListCounters()
+        counters.next("1", "0", None)
+        counters.next("1", "1", None)
+        assert_equal(2, counters.next("1", "0", None))
+
+    def test_deeper_levels_are_reset_when_parent_changes(self):
+        counters = ListCounters()
+        counters.next("1", "0", None)
+        counters.next("1", "1", None)
+        counters.next("1", "2", None)
+        counters.next("1", "1", None)
+        counters.next("1", "0", None)
+        assert_equal(1, counters.next("1", "1", None))
+        assert_equal(1, counters.next("1", "2", None))
+
+    def test_skipped_levels_do_not_reset_shallower_levels(self):
+        counters = ListCounters()
+        counters.next("1", "0", None)
+        counters.next("1", "2", None)
+        assert_equal(1, counters.next("1", "1", None))
+        assert_equal(2, counters.next("1", "0", None))
+
+
+class ListTypeTests(object):
+    def test_ordered_formats_are_mapped_to_ol_type(self):
+        assert_equal(("ol", "a"), list_type(_level("lowerLetter")))
+        assert_equal(("ol", "A"), list_type(_level("upperLetter")))
+        assert_equal(("ol", "i"), list_type(_level("lowerRoman")))
+        assert_equal(("ol", "I"), list_type(_level("upperRoman")))
+
+    def test_decimal_format_has_no_type(self):
+        assert_equal(("ol", None), list_type(_level("decimal")))
+
+    def test_bullets_are_mapped_to_ul_type(self):
+        assert_equal(("ul", "circle"), list_type(_level("bullet", "o")))
+        assert_equal(("ul", "square"), list_type(_level("bullet", "")))
+        assert_equal(("ul", "disc"), list_type(_level("bullet", "")))
+
+    def test_unrecognised_bullets_have_no_type(self):
+        assert_equal(("ul", None), list_type(_level("bullet", "-")))
+
+
+def _level(numbering_format, level_text=None):
+    return _AbstractNumLevel(
+        level_index="0",
+        is_ordered=numbering_format != "bullet",
+        paragraph_style_id=None,
+        start_num=None,
+        numbering_format=numbering_format,
+        level_text=level_text,
+    )
@@ -3,18 +3,22 @@
 from __future__ import unicode_literals
 
 import base64
+import hashlib
 import io
 import shutil
 import os
+import subprocess
+import sys
+import zipfile
 
 import tempman
 
-from .testing import assert_equal, generate_test_path
+from .testing import assert_equal, assert_raises, generate_test_path
 
 _test_path = generate_test_path
 
 import mammoth
-from mammoth import results
+from mammoth import results, zips
 
 
 def test_docx_containing_one_paragraph_is_converted_to_single_p_element():
@@ -87,6 +91,19 @@ def test_embedded_style_map_can_be_retrieved():
         assert_equal("p => h1", mammoth.read_embedded_style_map(fileobj))
 
 
+def test_style_map_can_be_embedded_in_many_paths():
+    with tempman.create_temp_dir() as temp_dir:
+        paths = [os.path.join(temp_dir.path, name) for name in ["a.docx", "b.docx"]]
+        for path in paths:
+            shutil.copyfile(generate_test_path("single-paragraph.docx"), path)
+
+        mammoth.embed_style_map_in_paths(paths, "p => h1")
+
+        for path in paths:
+            with open(path, "rb") as fileobj:
+                assert_equal("p => h1", mammoth.read_embedded_style_map(fileobj))
+
+
 def test_warning_if_style_mapping_is_not_understood():
     style_map = """
 !!!!
@@ -177,6 +194,46 @@ def test_image_conversion_can_be_customised():
         assert_equal([], result.messages)
 
 
+def test_images_can_be_referenced_by_path_without_being_read(monkeypatch):
+    opened_names = []
+    open_entry = zips._Zip.open
+
+    def spy_open(zip_file, name):
+        opened_names.append(name)
+        return open_entry(zip_file, name)
+
+    monkeypatch.setattr(zips._Zip, "open", spy_open)
+
+    with open(generate_test_path("tiny-picture.docx"), "rb") as fileobj:
+        result = mammoth.convert_to_html(
+            fileobj=fileobj,
+            convert_image=mammoth.images.reference(prefix="media/"),
+        )
+        assert_equal(
+            '<p><img class="fr-bordered" height="10" src="media/word/media/image1.png" width="10" /></p>',
+            result.value,
+        )
+        assert_equal([], result.messages)
+        assert_equal([], [name for name in opened_names if name.startswith("word/media/")])
+
+
+def test_image_info_is_read_from_zip_entry():
+    infos = []
+
+    @mammoth.images.img_element
+    def convert_image(image):
+        infos.append(image.info)
+        return {"src": ""}
+
+    with open(generate_test_path("tiny-picture.docx"), "rb") as fileobj:
+        mammoth.convert_to_html(fileobj=fileobj, convert_image=convert_image)
+        info, = infos
+        assert_equal(110, info.compressed_size)
+        assert_equal(110, info.uncompressed_size)
+        with open(generate_test_path("tiny-picture.png"), "rb") as image_fileobj:
+            assert_equal(hashlib.sha256(image_fileobj.read()).hexdigest(), info.digest())
+
+
 def test_simple_list_is_converted_to_list_elements():
     with open(generate_test_path("simple-list.docx"), "rb") as fileobj:
         result = mammoth.convert_to_html(fileobj=fileobj)
@@ -184,6 +241,81 @@ def test_simple_list_is_converted_to_list_elements():
         assert_equal("""<ul type="disc"><li data-li-order="1">Apple</li><li data-li-order="2">Banana</li></ul>""", result.value)
 
 
+def test_max_blocks_limits_number_of_top_level_blocks_read():
+    with open(generate_test_path("tables.docx"), "rb") as fileobj:
+        result = mammoth.convert_to_html(fileobj=fileobj, max_blocks=1)
+        assert_equal("<p>Above</p>", result.value)
+        assert_equal([results.warning("Document was truncated to the first 1 blocks")], result.messages)
+
+
+def test_when_profiler_is_set_then_phases_are_included_in_result():
+    profiler = mammoth.profiling.Profiler()
+    with open(generate_test_path("footnotes.docx"), "rb") as fileobj:
+        result = mammoth.convert_to_html(fileobj=fileobj, profiler=profiler)
+
+    phase_names = [phase.name for phase in result.profile]
+    for phase_name in ["open zip", "parse word/document.xml", "read word/document.xml", "read notes", "convert document", "collapse", "write"]:
+        assert phase_name in phase_names, "Expected phase: " + phase_name
+
+
+def test_on_message_is_called_with_each_distinct_message_as_it_is_generated():
+    received = []
+    with open(generate_test_path("style_names.docx"), "rb") as fileobj:
+        result = mammoth.convert_to_html(fileobj=fileobj, on_message=received.append)
+
+    assert_equal(result.messages, received)
+    assert_equal(3, len(received))
+
+
+def test_message_counts_include_number_of_occurrences_of_each_message():
+    with open(generate_test_path("style_names.docx"), "rb") as fileobj:
+        result = mammoth.convert_to_html(fileobj=fileobj)
+
+    assert_equal(
+        (results.warning("Unrecognised paragraph style: No Spacing (Style ID: NoSpacing)"), 2),
+        result.message_counts[0],
+    )
+
+
+def test_importing_mammoth_does_not_import_submodules_until_they_are_used():
+    source = (
+        "import sys, mammoth\n" +
+        "print(sorted(name for name in sys.modules if name.startswith('mammoth.')))\n" +
+        "mammoth.transforms\n" +
+        "print('mammoth.transforms' in sys.modules)\n"
+    )
+    output = subprocess.check_output([sys.executable, "-c", source], universal_newlines=True)
+    assert_equal("[]\nTrue\n", output)
+
+
+def test_public_names_can_be_accessed_without_importing_submodules():
+    names = [
+        "conversion", "convert", "convert_to_html", "convert_to_markdown",
+        "document_matchers", "documents", "docx", "embed_style_map",
+        "extract_raw_text", "extract_raw_text_from_element", "html", "html_paths",
+        "images", "lists", "options", "raw_text", "read_embedded_style_map",
+        "read_style_map", "results", "styles", "transforms", "underline",
+        "write_style_map", "writers", "zips",
+    ]
+    source = (
+        "import mammoth\n" +
+        "print([name for name in {0!r} if getattr(mammoth, name, None) is None])\n".format(names) +
+        "print(mammoth.read_style_map is mammoth.docx.style_map.read_style_map)\n"
+    )
+    output = subprocess.check_output([sys.executable, "-c", source], universal_newlines=True)
+    assert_equal("[]\nTrue\n", output)
+
+
+def test_dingbats_are_not_loaded_for_documents_without_symbols():
+    source = (
+        "import sys, mammoth\n" +
+        "with open({0!r}, 'rb') as fileobj: mammoth.convert_to_html(fileobj)\n".format(generate_test_path("single-paragraph.docx")) +
+        "print('mammoth.docx.dingbats' in sys.modules)\n"
+    )
+    output = subprocess.check_output([sys.executable, "-c", source], universal_newlines=True)
+    assert_equal("False\n", output)
+
+
 def test_word_tables_are_converted_to_html_tables():
     expected_html = ("<p>Above</p>" +
         "<table>" +
@@ -343,6 +475,52 @@ def test_can_read_strict_format():
         assert_equal("<p>Test</p>", result.value)
 
 
+def test_deeply_nested_tables_are_converted():
+    depth = 1000
+    body = (
+        "<w:tbl><w:tr><w:tc>" * depth +
+        "<w:p><w:r><w:t>Hello</w:t></w:r></w:p>" +
+        "</w:tc></w:tr></w:tbl>" * depth
+    )
+
+    result = mammoth.convert_to_html(fileobj=_docx_with_body(body))
+
+    assert_equal("<table><tr><td>" * depth + "<p>Hello</p>" + "</td></tr></table>" * depth, result.value)
+
+
+def test_deeply_nested_text_boxes_are_converted():
+    depth = 1000
+    body = (
+        "<w:p><w:r><w:pict><v:shape><v:textbox><w:txbxContent>" * depth +
+        "<w:p><w:r><w:t>Hello</w:t></w:r></w:p>" +
+        "</w:txbxContent></v:textbox></v:shape></w:pict></w:r></w:p>" * depth
+    )
+
+    result = mammoth.convert_to_html(fileobj=_docx_with_body(body))
+
+    assert_equal("<p>Hello</p>", result.value)
+
+
+def _docx_with_body(body):
+    document_xml = (
+        '<w:document' +
+        ' xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"' +
+        ' xmlns:v="urn:schemas-microsoft-com:vml">' +
+        "<w:body>{0}</w:body></w:document>"
+    ).format(body)
+
+    fileobj = io.BytesIO()
+    with zipfile.ZipFile(generate_test_path("single-paragraph.docx")) as source:
+        with zipfile.ZipFile(fileobj, "w") as destination:
+            for name in source.namelist():
+                if name == "word/document.xml":
+                    destination.writestr(name, document_xml)
+                else:
+                    destination.writestr(name, source.read(name))
+    fileobj.seek(0)
+    return fileobj
+
+
 def _copy_of_test_data(path):
     destination = io.BytesIO()
     with open(generate_test_path(path), "rb") as source:
@@ -377,6 +555,49 @@ def test_font_colors_are_preserved():
         html = result.value
         assert 'style="color: #' in html
 
+def test_html_can_be_converted_in_chunks():
+    with open(_test_path("tables.docx"), "rb") as fileobj:
+        chunks = mammoth.convert_to_html_in_chunks(fileobj, split_on="p")
+        assert_equal("<p>Below</p>", list(chunks)[-1])
+
+def test_messages_are_passed_to_on_message_when_converting_in_chunks():
+    messages = []
+    with open(_test_path("style_names.docx"), "rb") as fileobj:
+        chunks = mammoth.convert_to_html_in_chunks(fileobj, split_on="h1", on_message=messages.append)
+        list(chunks)
+    assert results.warning("Unrecognised paragraph style: Quote (Style ID: Quote)") in messages
+
+def test_font_colors_can_be_written_as_classes():
+    with open(_test_path("font-colors.docx"), "rb") as fileobj:
+        result = mammoth.convert_to_html(fileobj=fileobj, style_classes=True)
+        assert 'style="' not in result.value
+        assert 'class="mammoth-c1"' in result.value
+        assert result.stylesheet.startswith(".mammoth-c1 { color: #")
+
+def test_stylesheet_is_none_when_style_classes_are_not_used():
+    with open(_test_path("font-colors.docx"), "rb") as fileobj:
+        result = mammoth.convert_to_html(fileobj=fileobj)
+        assert_equal(None, result.stylesheet)
+
+def test_style_classes_cannot_be_used_when_converting_to_markdown():
+    with open(_test_path("font-colors.docx"), "rb") as fileobj:
+        error = assert_raises(ValueError, lambda: mammoth.convert_to_markdown(fileobj=fileobj, style_classes=True))
+        assert_equal("style_classes can only be used with HTML output", str(error))
+
+
+def test_output_can_be_written_to_text_file():
+    with tempman.create_temp_dir() as temp_dir:
+        output_path = os.path.join(temp_dir.path, "output.md")
+        with open(_test_path("single-paragraph.docx"), "rb") as fileobj:
+            with open(output_path, "w", encoding="utf-8") as output_stream:
+                result = mammoth.convert_to_markdown(fileobj=fileobj, output_stream=output_stream)
+
+        with open(output_path, encoding="utf-8") as output_file:
+            assert_equal("Walking on imported air\n\n", output_file.read())
+        assert_equal(None, result.value)
+        assert_equal([], result.messages)
+
+
 def test_paragraphs_with_numId_zero_stripped():
     with open(_test_path("num-Id-numbered-list.docx"), "rb") as fileobj:
         result = mammoth.convert_to_html(fileobj=fileobj)
@@ -1,6 +1,7 @@
-from mammoth.options import read_options, _default_style_map
+from mammoth import results
+from mammoth.options import read_options, _default_style_map, _read_style_map
 from mammoth.styles.parser import read_style_mapping
-from .testing import assert_equal
+from .testing import assert_equal, assert_raises
 
 
 def test_default_style_map_is_used_if_style_map_is_not_set():
@@ -29,3 +30,91 @@ def test_lines_starting_with_hash_in_custom_style_map_are_ignored():
         "include_default_style_map": False
     }).value["style_map"]
     assert_equal([read_style_mapping("p.SectionTitle => h2").value], style_map)
+
+
+def test_changing_result_of_reading_style_map_does_not_change_later_results():
+    style_map_text = "p.SectionTitle => h2\n!!"
+    first_result = _read_style_map(style_map_text)
+    expected_style_map = list(first_result.value)
+    expected_messages = list(first_result.messages)
+
+    first_result.value.append(first_result.value[0])
+    first_result.messages.append(results.warning("Added"))
+    first_result.value = []
+
+    second_result = _read_style_map(style_map_text)
+    assert_equal(expected_style_map, second_result.value)
+    assert_equal(expected_messages, second_result.messages)
+    assert_equal(1, len(second_result.messages))
+
+
+def test_style_mappings_read_from_style_map_cannot_be_changed():
+    style = _read_style_map("p.SectionTitle => h2").value[0]
+
+    assert_raises(AttributeError, lambda: setattr(style, "html_path", None))
+
+
+def test_default_style_map_is_equivalent_to_parsing_its_textual_form():
+    result = _read_style_map(_default_style_map_text)
+    assert_equal([], result.messages)
+    assert_equal(result.value, _default_style_map)
+
+
+_default_style_map_text = """
+p.Heading1 => h1:fresh
+p.Heading2 => h2:fresh
+p.Heading3 => h3:fresh
+p.Heading4 => h4:fresh
+p.Heading5 => h5:fresh
+p.Heading6 => h6:fresh
+p[style-name='Heading 1'] => h1:fresh
+p[style-name='Heading 2'] => h2:fresh
+p[style-name='Heading 3'] => h3:fresh
+p[style-name='Heading 4'] => h4:fresh
+p[style-name='Heading 5'] => h5:fresh
+p[style-name='Heading 6'] => h6:fresh
+p[style-name='heading 1'] => h1:fresh
+p[style-name='heading 2'] => h2:fresh
+p[style-name='heading 3'] => h3:fresh
+p[style-name='heading 4'] => h4:fresh
+p[style-name='heading 5'] => h5:fresh
+p[style-name='heading 6'] => h6:fresh
+
+# Apple Pages
+p.Heading => h1:fresh
+p[style-name='Heading'] => h1:fresh
+
+r[style-name='Strong'] => strong
+
+p[style-name='footnote text'] => p:fresh
+r[style-name='footnote reference'] =>
+p[style-name='endnote text'] => p:fresh
+r[style-name='endnote reference'] =>
+p[style-name='annotation text'] => p:fresh
+r[style-name='annotation reference'] =>
+
+# LibreOffice
+p[style-name='Footnote'] => p:fresh
+r[style-name='Footnote anchor'] =>
+p[style-name='Endnote'] => p:fresh
+r[style-name='Endnote anchor'] =>
+
+p:unordered-list(1) => ul > li:fresh
+p:unordered-list(2) => ul|ol > li > ul > li:fresh
+p:unordered-list(3) => ul|ol > li > ul|ol > li > ul > li:fresh
+p:unordered-list(4) => ul|ol > li > ul|ol > li > ul|ol > li > ul > li:fresh
+p:unordered-list(5) => ul|ol > li > ul|ol > li > ul|ol > li > ul|ol > li > ul > li:fresh
+p:ordered-list(1) => ol > li:fresh
+p:ordered-list(2) => ul|ol > li > ol > li:fresh
+p:ordered-list(3) => ul|ol > li > ul|ol > li > ol > li:fresh
+p:ordered-list(4) => ul|ol > li > ul|ol > li > ul|ol > li > ol > li:fresh
+p:ordered-list(5) => ul|ol > li > ul|ol > li > ul|ol > li > ul|ol > li > ol > li:fresh
+
+r[style-name='Hyperlink'] =>
+
+p[style-name='Normal'] => p:fresh
+
+# Apple Pages
+p.Body => p:fresh
+p[style-name='Body'] => p:fresh
+"""
@@ -0,0 +1,45 @@
+from precisely import assert_that, contains_exactly, has_attrs
+
+from mammoth import profiling
+from .testing import assert_equal
+
+
+def test_phases_are_listed_in_order_of_first_start():
+    profiler = profiling.Profiler()
+
+    with profiler.phase("outer"):
+        with profiler.phase("inner"):
+            pass
+
+    assert_equal(["outer", "inner"], [phase.name for phase in profiler.phases])
+
+
+def test_repeated_phases_are_aggregated():
+    profiler = profiling.Profiler()
+
+    for _ in range(3):
+        with profiler.phase("read"):
+            pass
+
+    assert_that(profiler.phases, contains_exactly(
+        has_attrs(name="read", calls=3),
+    ))
+
+
+def test_phase_is_recorded_when_body_raises():
+    profiler = profiling.Profiler()
+
+    try:
+        with profiler.phase("read"):
+            raise ValueError()
+    except ValueError:
+        pass
+
+    assert_that(profiler.phases, contains_exactly(
+        has_attrs(name="read", calls=1),
+    ))
+
+
+def test_null_profiler_records_nothing():
+    with profiling.null_profiler.phase("read"):
+        pass
@@ -1,3 +1,5 @@
+import sys
+
 from mammoth.raw_text import extract_raw_text_from_element
 from mammoth import documents
 from .testing import assert_equal
@@ -55,3 +57,13 @@ def test_non_text_element_without_children_is_converted_to_empty_string():
     result = extract_raw_text_from_element(element)
 
     assert_equal("", result)
+
+
+def test_text_of_deeply_nested_elements_is_extracted():
+    element = documents.run([documents.Text("Hello.")])
+    for _ in range(sys.getrecursionlimit() * 2):
+        element = documents.hyperlink([element], href="#")
+
+    result = extract_raw_text_from_element(documents.paragraph([element]))
+
+    assert_equal("Hello.\n\n", result)
@@ -0,0 +1,46 @@
+from mammoth import results
+from .testing import assert_equal
+
+
+def test_message_sink_removes_duplicate_messages_while_preserving_order():
+    sink = results.MessageSink()
+    sink.add(results.warning("one"))
+    sink.add(results.warning("two"))
+    sink.add(results.warning("one"))
+
+    assert_equal([results.warning("one"), results.warning("two")], sink.messages)
+
+
+def test_message_sink_counts_occurrences_of_each_message():
+    sink = results.MessageSink()
+    sink.add(results.warning("one"))
+    sink.add(results.warning("two"))
+    sink.add(results.warning("one"))
+
+    assert_equal([(results.warning("one"), 2), (results.warning("two"), 1)], sink.counts())
+
+
+def test_message_sink_formats_warnings_from_template_and_arguments():
+    sink = results.MessageSink()
+    sink.warning("Unrecognised {0} style: {1}", "paragraph", "Heading 1")
+    sink.warning("Unrecognised {0} style: {1}", "paragraph", "Heading 1")
+
+    assert_equal([(results.warning("Unrecognised paragraph style: Heading 1"), 2)], sink.counts())
+
+
+def test_message_sink_calls_on_message_for_first_occurrence_of_each_message():
+    received = []
+    sink = results.MessageSink(on_message=received.append)
+    sink.warning("one")
+    sink.add(results.warning("two"))
+    sink.add(results.warning("one"))
+
+    assert_equal([results.warning("one"), results.warning("two")], received)
+
+
+def test_bind_combines_messages():
+    result = results.Result(1, [results.warning("one")]) \
+        .bind(lambda value: results.Result(value + 1, [results.warning("two"), results.warning("one")]))
+
+    assert_equal(2, result.value)
+    assert_equal([results.warning("one"), results.warning("two")], result.messages)
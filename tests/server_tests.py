@@ -0,0 +1,160 @@
+import contextlib
+import io
+import json
+import subprocess
+import sys
+import threading
+import urllib.error
+import urllib.request
+import zipfile
+
+from mammoth import server
+from .testing import assert_equal, generate_test_path
+
+
+def test_docx_is_converted_to_html():
+    with _start_server() as url:
+        status, response = _convert(url, "single-paragraph.docx")
+
+    assert_equal(200, status)
+    assert_equal({"value": "<p>Walking on imported air</p>", "messages": []}, response)
+
+
+def test_docx_is_converted_to_markdown_if_output_format_is_markdown():
+    with _start_server() as url:
+        status, response = _convert(url, "single-paragraph.docx", query="?output_format=markdown")
+
+    assert_equal(200, status)
+    assert_equal("Walking on imported air\n\n", response["value"])
+
+
+def test_configured_style_map_can_be_selected_by_name():
+    with _start_server(style_maps={"spans": "p => span:fresh"}) as url:
+        status, response = _convert(url, "single-paragraph.docx", query="?style_map=spans")
+
+    assert_equal(200, status)
+    assert_equal("<span>Walking on imported air</span>", response["value"])
+
+
+def test_unknown_style_map_is_rejected():
+    with _start_server() as url:
+        status, response = _convert(url, "single-paragraph.docx", query="?style_map=spans")
+
+    assert_equal(400, status)
+    assert_equal({"error": "Unknown style map: spans"}, response)
+
+
+def test_request_larger_than_max_request_size_is_rejected():
+    with _start_server(max_request_size=100) as url:
+        status, response = _convert(url, "single-paragraph.docx")
+
+    assert_equal(413, status)
+    assert_equal({"error": "Request body is larger than 100 bytes"}, response)
+
+
+def test_invalid_docx_is_reported_as_client_error():
+    with _start_server() as url:
+        status, response = _request(url + "/convert", data=b"not a docx")
+
+    assert_equal(400, status)
+    assert_equal({"error": "BadZipFile: File is not a zip file"}, response)
+
+
+def test_docx_without_main_document_part_is_reported_as_client_error():
+    with _start_server() as url:
+        status, response = _request(url + "/convert", data=_zip_bytes({"word/styles.xml": "<w:styles/>"}))
+
+    assert_equal(400, status)
+    assert_equal("OSError: Could not find main document part. Are you sure this is a valid .docx file?", response["error"])
+
+
+def test_unexpected_error_during_conversion_is_reported_as_server_error(monkeypatch):
+    def convert(*args, **kwargs):
+        raise RuntimeError("Unexpected")
+
+    monkeypatch.setattr(server.mammoth, "convert", convert)
+
+    with _start_server() as url:
+        status, response = _convert(url, "single-paragraph.docx")
+        _, metrics = _request(url + "/metrics")
+
+    assert_equal(500, status)
+    assert_equal({"error": "RuntimeError: Unexpected"}, response)
+    assert_equal(0, metrics["client_errors"])
+    assert_equal(1, metrics["server_errors"])
+
+
+def test_metrics_include_requests_latency_and_style_map_cache():
+    with _start_server(style_maps={"spans": "p => span:fresh"}) as url:
+        _convert(url, "single-paragraph.docx", query="?style_map=spans")
+        _convert(url, "single-paragraph.docx", query="?style_map=unknown")
+        status, metrics = _request(url + "/metrics")
+
+    assert_equal(200, status)
+    assert_equal(2, metrics["requests"])
+    assert_equal(1, metrics["client_errors"])
+    assert_equal(0, metrics["server_errors"])
+    assert metrics["latency_seconds"]["p50"] > 0
+    assert metrics["style_map_cache"]["hits"] >= 1
+    assert metrics["style_map_cache"]["hit_rate"] > 0
+
+
+def test_forked_workers_are_recycled_after_max_jobs():
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "mammoth.server",
+            "--port", "0",
+            "--workers", "2",
+            "--max-jobs-per-worker", "1",
+        ],
+        stdout=subprocess.PIPE,
+    )
+    try:
+        url = process.stdout.readline().decode("utf-8").split()[-1]
+        for _ in range(4):
+            status, response = _convert(url, "single-paragraph.docx")
+            assert_equal(200, status)
+            assert_equal("<p>Walking on imported air</p>", response["value"])
+
+        status, metrics = _request(url + "/metrics")
+        assert_equal(4, metrics["requests"])
+        assert_equal(2, metrics["workers"])
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+        process.stdout.close()
+
+
+@contextlib.contextmanager
+def _start_server(**kwargs):
+    conversion_server = server.create_server(address=("127.0.0.1", 0), workers=0, **kwargs)
+    thread = threading.Thread(target=conversion_server.serve_forever)
+    thread.start()
+    try:
+        host, port = conversion_server.server_address[:2]
+        yield "http://{0}:{1}".format(host, port)
+    finally:
+        conversion_server.shutdown()
+        thread.join()
+
+
+def _convert(url, name, query=""):
+    with open(generate_test_path(name), "rb") as fileobj:
+        return _request(url + "/convert" + query, data=fileobj.read())
+
+
+def _zip_bytes(files):
+    fileobj = io.BytesIO()
+    with zipfile.ZipFile(fileobj, "w") as zip_file:
+        for name, contents in files.items():
+            zip_file.writestr(name, contents)
+    return fileobj.getvalue()
+
+
+def _request(url, data=None):
+    try:
+        with urllib.request.urlopen(url, data=data) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        with error:
+            return error.code, json.loads(error.read())
@@ -93,6 +93,24 @@ def test_can_tokenise_multiple_tokens():
     )
 
 
+def test_tokens_include_index_of_first_character():
+    assert_that(
+        tokenise("p => h1"),
+        is_sequence(
+            has_attrs(character_index=0, type="identifier", value="p"),
+            has_attrs(character_index=1, type="whitespace", value=" "),
+            has_attrs(character_index=2, type="symbol", value="=>"),
+            has_attrs(character_index=4, type="whitespace", value=" "),
+            has_attrs(character_index=5, type="identifier", value="h1"),
+            has_attrs(character_index=7, type="end", value=""),
+        ),
+    )
+
+
+def test_identifiers_with_multiple_escape_sequences_are_tokenised():
+    assert_tokens(r"a\:b\.c1", is_token("identifier", r"a\:b\.c1"))
+
+
 def assert_tokens(string, *expected):
     expected = list(expected)
     expected.append(is_token("end", ""))
@@ -1,3 +1,5 @@
+import sys
+
 import cobble
 
 from mammoth import documents, transforms
@@ -55,7 +57,168 @@ class EachElementTests(object):
         ]), result)
 
 
+    def test_unchanged_elements_are_not_copied(self):
+        unchanged_paragraph = documents.paragraph(children=[documents.run(children=[])])
+        changed_paragraph = documents.paragraph(children=[documents.run(children=[documents.tab()])])
+        root = documents.document(children=[unchanged_paragraph, changed_paragraph])
+
+        result = _each_element(lambda element: documents.text("\t") if element == documents.tab() else element)(root)
+
+        assert_equal(
+            documents.document(children=[
+                unchanged_paragraph,
+                documents.paragraph(children=[documents.run(children=[documents.text("\t")])]),
+            ]),
+            result,
+        )
+        assert result.children[0] is unchanged_paragraph
+        assert result.children[1] is not changed_paragraph
+
+    def test_element_is_not_copied_if_nothing_has_changed(self):
+        root = documents.document(children=[
+            documents.paragraph(children=[documents.run(children=[documents.tab()])]),
+        ])
+
+        result = _each_element(lambda element: element)(root)
+
+        assert result is root
+
+
+    def test_deeply_nested_elements_are_transformed(self):
+        depth = sys.getrecursionlimit() * 2
+        element = documents.run([documents.tab()])
+        for _ in range(depth):
+            element = documents.hyperlink([element], href="#")
+
+        result = transforms.element_of_type(documents.Tab, lambda tab: documents.text("\t"))(element)
+
+        for _ in range(depth):
+            [result] = result.children
+        assert_equal(documents.run([documents.text("\t")]), result)
+
+
+class ComposeTests(object):
+    def test_when_there_are_no_transforms_then_element_is_unchanged(self):
+        paragraph = documents.paragraph(children=[])
+        assert transforms.compose()(paragraph) is paragraph
+
+    def test_transforms_are_applied_in_order(self):
+        document = documents.document(children=[
+            documents.paragraph(children=[documents.run(children=[])]),
+        ])
+
+        result = transforms.compose(
+            transforms.paragraph(lambda paragraph: paragraph.copy(style_id=(paragraph.style_id or "") + "a")),
+            transforms.paragraph(lambda paragraph: paragraph.copy(style_id=paragraph.style_id + "b")),
+        )(document)
+
+        assert_equal("ab", result.children[0].style_id)
+
+    def test_earlier_transforms_do_not_see_changes_made_by_later_transforms(self):
+        def make_bold(run):
+            return run.copy(is_bold=True)
+
+        def record_bold_runs(paragraph):
+            bold_runs = [run for run in paragraph.children if run.is_bold]
+            return paragraph.copy(style_id=str(len(bold_runs)))
+
+        document = documents.document(children=[
+            documents.paragraph(children=[documents.run(children=[]), documents.run(children=[])]),
+        ])
+
+        assert_equal(
+            _apply_sequentially([transforms.paragraph(record_bold_runs), transforms.run(make_bold)], document),
+            transforms.compose(transforms.paragraph(record_bold_runs), transforms.run(make_bold))(document),
+        )
+        assert_equal(
+            _apply_sequentially([transforms.run(make_bold), transforms.paragraph(record_bold_runs)], document),
+            transforms.compose(transforms.run(make_bold), transforms.paragraph(record_bold_runs))(document),
+        )
+
+    def test_later_transforms_are_applied_to_children_introduced_by_earlier_transforms(self):
+        def add_run(paragraph):
+            return paragraph.copy(children=paragraph.children + [documents.run(children=[documents.text("new")])])
+
+        def make_bold(run):
+            return run.copy(is_bold=True)
+
+        document = documents.document(children=[
+            documents.paragraph(children=[documents.run(children=[documents.text("old")])]),
+        ])
+
+        result = transforms.compose(transforms.paragraph(add_run), transforms.run(make_bold))(document)
+
+        assert_equal(
+            _apply_sequentially([transforms.paragraph(add_run), transforms.run(make_bold)], document),
+            result,
+        )
+        assert_equal([True, True], [run.is_bold for run in result.children[0].children])
+
+    def test_transforms_can_replace_elements_with_elements_of_other_types(self):
+        def run_to_tab(run):
+            return documents.tab()
+
+        def count_tabs(paragraph):
+            tabs = [child for child in paragraph.children if child == documents.tab()]
+            return paragraph.copy(style_id=str(len(tabs)))
+
+        document = documents.document(children=[
+            documents.paragraph(children=[documents.run(children=[]), documents.tab()]),
+        ])
+        element_transforms = [
+            transforms.paragraph(count_tabs),
+            transforms.run(run_to_tab),
+            transforms.paragraph(count_tabs),
+        ]
+
+        result = transforms.compose(*element_transforms)(document)
+
+        assert_equal(_apply_sequentially(element_transforms, document), result)
+        assert_equal("2", result.children[0].style_id)
+
+    def test_other_transforms_are_applied_to_whole_document_in_order(self):
+        document = documents.document(children=[documents.paragraph(children=[])])
+
+        result = transforms.compose(
+            transforms.paragraph(lambda paragraph: paragraph.copy(style_id="a")),
+            lambda document: document.copy(notes=["note"]),
+            transforms.paragraph(lambda paragraph: paragraph.copy(style_id=paragraph.style_id + "b")),
+        )(document)
+
+        assert_equal(["note"], result.notes)
+        assert_equal("ab", result.children[0].style_id)
+
+    def test_unchanged_elements_are_not_copied(self):
+        unchanged_paragraph = documents.paragraph(children=[documents.run(children=[])])
+        document = documents.document(children=[
+            unchanged_paragraph,
+            documents.paragraph(children=[documents.tab()]),
+        ])
+
+        result = transforms.compose(
+            transforms.run(lambda run: run),
+            transforms.element_of_type(documents.Tab, lambda tab: documents.text("\t")),
+        )(document)
+
+        assert result.children[0] is unchanged_paragraph
+        assert_equal([documents.text("\t")], result.children[1].children)
+
+
+def _apply_sequentially(transforms_to_apply, element):
+    for transform in transforms_to_apply:
+        element = transform(element)
+    return element
+
+
 class GetDescendantsTests(object):
+    def test_includes_deeply_nested_descendants(self):
+        depth = sys.getrecursionlimit() * 2
+        element = documents.run([documents.tab()])
+        for _ in range(depth):
+            element = documents.hyperlink([element], href="#")
+
+        assert_equal(depth + 2, len(get_descendants(documents.paragraph([element]))))
+
     def test_returns_nothing_if_element_type_has_no_children(self):
         assert_equal([], get_descendants(documents.tab()))
 
@@ -80,3 +243,13 @@ class GetDescendantsOfTypeTests(object):
         run = documents.run(children=[])
         element = documents.paragraph(children=[tab, run])
         assert_equal([run], get_descendants_of_type(element, documents.Run))
+
+    def test_descendants_of_document_include_children_added_after_document_index_is_used(self):
+        paragraph = documents.paragraph(children=[])
+        document = documents.document([paragraph])
+        document.index.elements_of_type(documents.Paragraph)
+
+        second_paragraph = documents.paragraph(children=[])
+        document.children.append(second_paragraph)
+
+        assert_equal([paragraph, second_paragraph], get_descendants_of_type(document, documents.Paragraph))
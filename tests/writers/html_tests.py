@@ -0,0 +1,73 @@
+from __future__ import unicode_literals
+
+import io
+
+from mammoth.writers.html import HtmlWriter
+from ..testing import assert_equal, assert_raises
+
+
+def test_special_html_characters_in_text_are_escaped():
+    writer = _create_writer()
+    writer.text('<a href="?x=1&y=2">')
+    assert_equal("&lt;a href=&quot;?x=1&amp;y=2&quot;&gt;", writer.as_string())
+
+
+def test_text_without_special_characters_is_written_unchanged():
+    writer = _create_writer()
+    writer.text("Hello")
+    assert_equal("Hello", writer.as_string())
+
+
+def test_attributes_are_written_in_sorted_order_and_escaped():
+    writer = _create_writer()
+    writer.start("a", {"title": "\"Tom\" & <Jerry>", "href": "#x"})
+    writer.end("a")
+    assert_equal('<a href="#x" title="&quot;Tom&quot; &amp; &lt;Jerry&gt;"></a>', writer.as_string())
+
+
+def test_self_closing_elements_are_written_with_attributes():
+    writer = _create_writer()
+    writer.self_closing("img", {"src": "a.png"})
+    writer.self_closing("br")
+    assert_equal('<img src="a.png" /><br />', writer.as_string())
+
+
+def test_elements_with_same_attributes_are_written_the_same_each_time():
+    writer = _create_writer()
+    attributes = {"class": "tip"}
+    for text in ["One", "Two"]:
+        writer.start("p", attributes)
+        writer.text(text)
+        writer.end("p")
+    assert_equal('<p class="tip">One</p><p class="tip">Two</p>', writer.as_string())
+
+
+def test_changes_to_attributes_are_reflected_in_later_elements():
+    writer = _create_writer()
+    attributes = {"class": "tip"}
+    writer.start("p", attributes)
+    writer.end("p")
+    attributes["class"] = "warning"
+    writer.start("p", attributes)
+    writer.end("p")
+    assert_equal('<p class="tip"></p><p class="warning"></p>', writer.as_string())
+
+
+def test_html_is_appended_without_escaping():
+    writer = _create_writer()
+    writer.append("<hr />")
+    assert_equal("<hr />", writer.as_string())
+
+
+def test_output_is_written_to_stream_passed_to_writer():
+    stream = io.StringIO()
+    writer = HtmlWriter(stream=stream)
+    writer.start("p")
+    writer.text("Hello")
+    assert_equal("<p>Hello", stream.getvalue())
+    error = assert_raises(ValueError, writer.as_string)
+    assert_equal("as_string() can't be used when writing to a stream passed to the writer", str(error))
+
+
+def _create_writer():
+    return HtmlWriter()
@@ -1,7 +1,9 @@
 from __future__ import unicode_literals
 
+import io
+
 from mammoth.writers.markdown import MarkdownWriter
-from ..testing import assert_equal
+from ..testing import assert_equal, assert_raises
 
 
 def test_special_markdown_characters_are_escaped():
@@ -181,5 +183,22 @@ def test_numbering_is_separate_for_nested_list_and_parent_list():
 
 
 
+def test_output_is_written_incrementally_to_stream():
+    stream = io.StringIO()
+    writer = MarkdownWriter(stream=stream)
+    writer.start("p")
+    writer.text("Hello")
+    assert_equal("Hello", stream.getvalue())
+    writer.end("p")
+    assert_equal("Hello\n\n", stream.getvalue())
+
+
+def test_output_cannot_be_read_as_string_when_writing_to_stream():
+    writer = MarkdownWriter(stream=io.StringIO())
+    writer.text("Hello")
+    error = assert_raises(ValueError, writer.as_string)
+    assert_equal("as_string() can't be used when writing to a stream passed to the writer", str(error))
+
+
 def _create_writer():
     return MarkdownWriter()
@@ -1,3 +1,6 @@
+import io
+import zipfile
+
 from mammoth import zips
 from .testing import assert_equal
 
@@ -29,3 +32,109 @@ def test_when_joining_paths_then_absolute_paths_ignore_earlier_paths():
     assert_equal("/b/c", zips.join_path("a", "/b", "c"))
     assert_equal("/b", zips.join_path("/a", "/b"))
     assert_equal("/a", zips.join_path("/a"))
+
+
+def test_update_zip_replaces_and_adds_entries():
+    fileobj = _create_zip([("a", b"one"), ("b", b"two")])
+
+    zips.update_zip(fileobj, {"b": b"new two", "c": b"three"})
+
+    with zipfile.ZipFile(fileobj) as zip_file:
+        assert_equal(["a", "b", "c"], zip_file.namelist())
+        assert_equal(b"one", zip_file.read("a"))
+        assert_equal(b"new two", zip_file.read("b"))
+        assert_equal(b"three", zip_file.read("c"))
+
+
+def test_update_zip_keeps_order_of_entries():
+    fileobj = _create_zip([("a", b"one"), ("b", b"two"), ("c", b"three")])
+
+    zips.update_zip(fileobj, {"d": b"four", "a": b"new one"})
+
+    with zipfile.ZipFile(fileobj) as zip_file:
+        assert_equal(["a", "b", "c", "d"], zip_file.namelist())
+        assert_equal(b"new one", zip_file.read("a"))
+
+
+def test_update_zip_copies_entries_with_data_descriptors():
+    fileobj = _create_zip_with_data_descriptors([("a", b"one" * 1000), ("b", b"two")])
+    with zipfile.ZipFile(fileobj) as zip_file:
+        assert_equal(0x08, zip_file.getinfo("a").flag_bits & 0x08)
+
+    zips.update_zip(fileobj, {"b": b"new two"})
+
+    with zipfile.ZipFile(fileobj) as zip_file:
+        assert_equal(["a", "b"], zip_file.namelist())
+        assert_equal(b"one" * 1000, zip_file.read("a"))
+        assert_equal(b"new two", zip_file.read("b"))
+        assert_equal(None, zip_file.testzip())
+
+
+def test_update_zip_copies_entries_when_zipfile_internals_are_missing(monkeypatch):
+    monkeypatch.setattr(zips, "_zipfile_module_internals", ("_missing_internal", ))
+    fileobj = _create_zip([("a", b"one"), ("b", b"two")], compression=zipfile.ZIP_DEFLATED)
+
+    zips.update_zip(fileobj, {"b": b"new two"})
+
+    with zipfile.ZipFile(fileobj) as zip_file:
+        assert_equal(["a", "b"], zip_file.namelist())
+        assert_equal(b"one", zip_file.read("a"))
+        assert_equal(b"new two", zip_file.read("b"))
+        assert_equal(None, zip_file.testzip())
+
+
+def test_update_zip_copies_compressed_bytes_of_unchanged_entries():
+    fileobj = _create_zip([("a", b"one" * 1000)], compression=zipfile.ZIP_DEFLATED)
+    with zipfile.ZipFile(fileobj) as zip_file:
+        original_info = zip_file.getinfo("a")
+
+    zips.update_zip(fileobj, {"b": b"two"})
+
+    with zipfile.ZipFile(fileobj) as zip_file:
+        info = zip_file.getinfo("a")
+        assert_equal(zipfile.ZIP_DEFLATED, info.compress_type)
+        assert_equal(original_info.compress_size, info.compress_size)
+        assert_equal(original_info.CRC, info.CRC)
+        assert_equal(b"one" * 1000, zip_file.read("a"))
+        assert_equal(None, zip_file.testzip())
+
+
+def test_update_zip_truncates_file_when_updated_zip_is_smaller():
+    fileobj = _create_zip([("a", b"one"), ("b", b"two" * 1000)])
+
+    zips.update_zip(fileobj, {"b": b"two"})
+
+    end_of_central_directory = fileobj.getvalue()[-zipfile.sizeEndCentDir:]
+    assert_equal(zipfile.stringEndArchive, end_of_central_directory[:4])
+    with zipfile.ZipFile(fileobj) as zip_file:
+        assert_equal(b"two", zip_file.read("b"))
+
+
+def _create_zip(entries, compression=zipfile.ZIP_STORED):
+    fileobj = io.BytesIO()
+    with zipfile.ZipFile(fileobj, "w", compression) as zip_file:
+        for name, contents in entries:
+            zip_file.writestr(name, contents)
+    return fileobj
+
+
+def _create_zip_with_data_descriptors(entries):
+    # ZipFile writes sizes and CRCs in data descriptors after the data of
+    # each entry when the file it's writing to isn't seekable.
+    fileobj = io.BytesIO()
+    with zipfile.ZipFile(_UnseekableWriter(fileobj), "w", zipfile.ZIP_DEFLATED) as zip_file:
+        for name, contents in entries:
+            zip_file.writestr(name, contents)
+    fileobj.seek(0)
+    return fileobj
+
+
+class _UnseekableWriter(object):
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+
+    def write(self, data):
+        return self._fileobj.write(data)
+
+    def flush(self):
+        pass